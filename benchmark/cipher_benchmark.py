@@ -0,0 +1,86 @@
+"""Reports password verification latency per KDF configuration.
+
+Usage:
+    PYTHONPATH=src python benchmark/cipher_benchmark.py [--iterations N]
+        [--config bcrypt:rounds=10 --config scrypt:n=32768,r=8,p=1]
+
+Run it on the deployment's CPUs to choose IDENTITY.password_cipher.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from typing import List, Tuple
+
+from spaceone.identity.lib.cipher import (
+    DEFAULT_SCHEME_OPTIONS,
+    Argon2Hasher,
+    _checkpw,
+    _hashpw,
+)
+
+DEFAULT_CONFIGS = [
+    ("bcrypt", {"rounds": 10}),
+    ("bcrypt", {"rounds": 12}),
+    ("bcrypt", {"rounds": 14}),
+    ("scrypt", {"n": 16384, "r": 8, "p": 1}),
+    ("scrypt", {"n": 65536, "r": 8, "p": 1}),
+    ("argon2id", DEFAULT_SCHEME_OPTIONS["argon2id"]),
+]
+
+
+def parse_config(value: str) -> Tuple[str, dict]:
+    scheme, _, params = value.partition(":")
+    options = dict(DEFAULT_SCHEME_OPTIONS[scheme])
+
+    for param in filter(None, params.split(",")):
+        key, _, number = param.partition("=")
+        options[key] = int(number)
+
+    return scheme, options
+
+
+def benchmark(scheme: str, options: dict, iterations: int) -> List[float]:
+    password = b"benchmark-password"
+    hashed = _hashpw(password, scheme, options)
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _checkpw(password, hashed)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=10)
+    parser.add_argument(
+        "-c",
+        "--config",
+        action="append",
+        type=parse_config,
+        help="scheme[:key=value,...] (e.g. bcrypt:rounds=12)",
+    )
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}, iterations: {args.iterations}")
+    print(f'{"scheme":<10} {"options":<45} {"mean(ms)":>10} {"p95(ms)":>10}')
+
+    for scheme, options in args.config or DEFAULT_CONFIGS:
+        if scheme == "argon2id" and Argon2Hasher is None:
+            print(f"{scheme:<10} {'skipped (argon2-cffi is not installed)':<45}")
+            continue
+
+        latencies = sorted(benchmark(scheme, options, args.iterations))
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(
+            f"{scheme:<10} {str(options):<45} "
+            f"{statistics.mean(latencies):>10.1f} {p95:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
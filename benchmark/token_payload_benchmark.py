@@ -0,0 +1,101 @@
+"""Compares access token size and encode/verify latency of the token formats.
+
+Usage:
+    PYTHONPATH=src python benchmark/token_payload_benchmark.py [-n ITERATIONS]
+
+For each project count it issues an access token with the plain
+"projects" claim and with the compact "pjc" claim
+(IDENTITY.token.compact_projects), then reports the token size and the
+mean time to sign, verify and read the project list back.
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from jwcrypto import jwk
+from spaceone.core import utils
+
+from spaceone.identity.lib.claim_codec import decode_list_claim, encode_list_claim
+from spaceone.identity.lib.key_generator import KeyGenerator
+from spaceone.identity.lib.key_ring import KeyRing
+
+PROJECT_COUNTS = [10, 100, 1000, 5000]
+PERMISSIONS = [f"identity:Resource{i}.read" for i in range(50)]
+
+
+def measure(func: Callable, iterations: int) -> float:
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return statistics.mean(latencies)
+
+
+def run(project_count: int, compact: bool, key: jwk.JWK, iterations: int) -> List:
+    projects = [utils.generate_id("project") for _ in range(project_count)]
+    key_gen = KeyGenerator(key, "domain-benchmark", "USER", "user-benchmark")
+
+    def issue() -> str:
+        if compact:
+            return key_gen.generate_token(
+                "ACCESS_TOKEN",
+                timeout=1800,
+                role_type="WORKSPACE_MEMBER",
+                permissions=PERMISSIONS,
+                encoded_projects=encode_list_claim(projects),
+            )
+        else:
+            return key_gen.generate_token(
+                "ACCESS_TOKEN",
+                timeout=1800,
+                role_type="WORKSPACE_MEMBER",
+                permissions=PERMISSIONS,
+                projects=projects,
+            )
+
+    token = issue()
+
+    def verify() -> list:
+        payload = KeyRing.decode(token, key)
+        if compact:
+            return decode_list_claim(payload["pjc"])
+        return payload["projects"]
+
+    assert sorted(verify()) == sorted(projects)
+
+    return [
+        project_count,
+        "pjc" if compact else "projects",
+        len(token),
+        measure(issue, iterations),
+        measure(verify, iterations),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    key = jwk.JWK.generate(kty="RSA", size=2048)
+
+    print(
+        f'{"projects":>8} {"claim":<9} {"size(bytes)":>12} '
+        f'{"issue(ms)":>10} {"verify(ms)":>11}'
+    )
+    for project_count in PROJECT_COUNTS:
+        for compact in [False, True]:
+            count, claim, size, issue_ms, verify_ms = run(
+                project_count, compact, key, args.iterations
+            )
+            print(
+                f"{count:>8} {claim:<9} {size:>12} {issue_ms:>10.2f} {verify_ms:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,497 @@
+"""Measures latency and throughput of TokenService.issue and grant.
+
+Usage:
+    PYTHONPATH=src python benchmark/token_service_benchmark.py [-n ITERATIONS]
+        [-c CONCURRENCY] [--project-groups 0,10,100] [--mongo-host HOST]
+
+The benchmark seeds a domain with local, external and MFA users, a domain
+admin and workspaces with a varying number of project groups, then drives
+the service methods in process. MongoDB is mongomock unless --mongo-host
+points to a local mongod, and the cache is a fake Redis (fakeredis). The
+auth plugin, the plugin endpoint lookup and SMTP are stubbed, so only the
+identity service itself is measured.
+
+For each scenario it reports p50/p99 latency, throughput and the mean time
+per request spent in each stage timed by StageTimer (key fetch, state
+checks, user lookup, password check, JWT sign and verify, ...). Throughput
+is computed from the measured request latencies, so the preparation of
+requests (e.g. MFA codes) is not included.
+
+Besides the service requirements, the benchmark needs mongomock and
+fakeredis, which are not installed with the service:
+    pip install mongomock fakeredis
+"""
+
+import argparse
+import contextlib
+import functools
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import fakeredis
+import mongoengine
+import mongomock
+from mongomock.collection import BulkOperationBuilder
+from spaceone.core import cache, config, utils
+from spaceone.core.cache.redis_cache import RedisCache
+from spaceone.core.manager import BaseManager
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.identity.lib.stage_timer import StageExporter, StageTimer
+
+PASSWORD = "Benchmark1234!@#$"
+PERMISSIONS = [f"identity:Resource{i}" for i in range(50)] + ["inventory:", "cost-"]
+
+
+class StageCollector(StageExporter):
+    """Accumulates the stage durations measured by StageTimer per stage."""
+
+    def __init__(self, options: dict = None):
+        super().__init__(options or {})
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.elapsed = defaultdict(float)
+
+    def export(self, operation: str, status: str, duration: float, stages: dict):
+        if getattr(self._local, "paused", False):
+            return
+
+        with self._lock:
+            for stage, elapsed in stages.items():
+                self.elapsed[stage] += elapsed
+
+    @contextlib.contextmanager
+    def pause(self):
+        self._local.paused = True
+        try:
+            yield
+        finally:
+            self._local.paused = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.elapsed.clear()
+
+
+def init_environment(mongo_host: str = None, bcrypt_rounds: int = 12) -> None:
+    if mongo_host:
+        mongoengine.connect(
+            f"identity-benchmark-{utils.random_string(8).lower()}",
+            host=mongo_host,
+            alias="default",
+        )
+    else:
+        # recent pymongo passes "sort" to bulk updates, which mongomock ignores
+        add_update = BulkOperationBuilder.add_update
+        BulkOperationBuilder.add_update = lambda self, *args, sort=None, **kwargs: (
+            add_update(self, *args, **kwargs)
+        )
+
+        mongoengine.connect(
+            "identity-benchmark",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+
+    config.init_conf(package="spaceone.identity")
+    config.set_service_config()
+
+    fake_redis_server = fakeredis.FakeServer()
+    RedisCache._get_connection = lambda self, pool: fakeredis.FakeRedis(
+        server=fake_redis_server
+    )
+    config.set_global(CACHES={"default": {"engine": "RedisCache"}})
+
+    identity_conf = config.get_global("IDENTITY") or {}
+    cipher_conf = identity_conf.get("password_cipher", {})
+    cipher_conf["bcrypt"] = {**cipher_conf.get("bcrypt", {}), "rounds": bcrypt_rounds}
+    config.set_global(IDENTITY={**identity_conf, "password_cipher": cipher_conf})
+
+
+def stub_external_services(plugin_latency: float) -> None:
+    from spaceone.identity.connector.external_auth_plugin_connector import (
+        ExternalAuthPluginConnector,
+    )
+    from spaceone.identity.connector.smtp_connector import SMTPConnector
+    from spaceone.identity.manager.plugin_manager import PluginManager
+
+    def init_plugin_manager(self, *args, **kwargs):
+        BaseManager.__init__(self, *args, **kwargs)
+        self.plugin_connector = None
+
+    def resolve_plugin_endpoint(self, plugin_id, version, upgrade_mode, domain_id):
+        return "grpc://auth-plugin.benchmark:50051", None
+
+    def authorize(self, credentials, options, secret_data, domain_id, **kwargs):
+        if plugin_latency:
+            time.sleep(plugin_latency)
+        return {"user_id": credentials["user_id"], "state": "ENABLED"}
+
+    PluginManager.__init__ = init_plugin_manager
+    PluginManager._resolve_plugin_endpoint = resolve_plugin_endpoint
+    ExternalAuthPluginConnector.initialize = lambda self, endpoint: None
+    ExternalAuthPluginConnector.authorize = authorize
+    SMTPConnector.set_smtp = lambda self, host, port, user, password: None
+    SMTPConnector.send_email = lambda self, to_emails, subject, contents: None
+
+    # emails are still queued in the outbox, only the delivery is stubbed
+    connectors_conf = config.get_global("CONNECTORS") or {}
+    connectors_conf["SMTPConnector"] = {
+        "host": "smtp.benchmark",
+        "port": 587,
+        "from_email": "benchmark@example.com",
+    }
+    config.set_global(CONNECTORS=connectors_conf)
+
+
+class Fixture:
+    def __init__(self, project_group_counts: List[int], projects_per_group: int):
+        from spaceone.identity.manager.domain_secret_manager import DomainSecretManager
+        from spaceone.identity.manager.user_manager import UserManager
+        from spaceone.identity.model.domain.database import Domain
+        from spaceone.identity.model.external_auth.database import ExternalAuth
+        from spaceone.identity.model.role.database import Role
+
+        self.domain_vo = Domain.create({"name": "benchmark"})
+        self.domain_id = self.domain_vo.domain_id
+        DomainSecretManager().create_domain_secret(self.domain_vo)
+
+        ExternalAuth.create(
+            {
+                "domain_id": self.domain_id,
+                "plugin_info": {
+                    "plugin_id": "plugin-benchmark-auth",
+                    "version": "1.0",
+                    "options": {},
+                    "metadata": {},
+                },
+            }
+        )
+
+        for role_id, role_type in [
+            ("managed-domain-admin", "DOMAIN_ADMIN"),
+            ("managed-workspace-member", "WORKSPACE_MEMBER"),
+        ]:
+            Role.create(
+                {
+                    "role_id": role_id,
+                    "name": role_id,
+                    "role_type": role_type,
+                    "permissions": PERMISSIONS,
+                    "domain_id": self.domain_id,
+                }
+            )
+
+        user_mgr = UserManager()
+        self.admin_id = self._create_user(
+            user_mgr, "admin@benchmark.io", role_type="DOMAIN_ADMIN"
+        )
+        self.member_id = self._create_user(
+            user_mgr, "member@benchmark.io", role_type="WORKSPACE_MEMBER"
+        )
+        self.mfa_user_id = self._create_user(
+            user_mgr,
+            "mfa@benchmark.io",
+            mfa={
+                "state": "ENABLED",
+                "mfa_type": "EMAIL",
+                "options": {"email": "mfa@benchmark.io"},
+            },
+        )
+        self.external_user_id = self._create_user(
+            user_mgr, "external@benchmark.io", auth_type="EXTERNAL"
+        )
+
+        self._create_role_binding(self.admin_id, "managed-domain-admin", "DOMAIN_ADMIN")
+
+        self.workspaces = {}
+        for project_group_count in project_group_counts:
+            workspace_id = self._create_workspace(
+                project_group_count, projects_per_group
+            )
+            self.workspaces[project_group_count] = workspace_id
+
+    def _create_user(
+        self, user_mgr, user_id: str, auth_type="LOCAL", role_type="USER", mfa=None
+    ):
+        params = {
+            "user_id": user_id,
+            "name": user_id.split("@")[0],
+            "auth_type": auth_type,
+            "domain_id": self.domain_id,
+        }
+
+        if auth_type == "LOCAL":
+            params["password"] = PASSWORD
+
+        user_vo = user_mgr.create_user(params)
+        user_vo = user_vo.update({"state": "ENABLED", "role_type": role_type})
+        if mfa:
+            user_vo = user_vo.update({"mfa": mfa})
+
+        return user_vo.user_id
+
+    def _create_role_binding(
+        self, user_id: str, role_id: str, role_type: str, workspace_id: str = None
+    ) -> None:
+        from spaceone.identity.model.role_binding.database import RoleBinding
+
+        RoleBinding.create(
+            {
+                "user_id": user_id,
+                "role_id": role_id,
+                "role_type": role_type,
+                "resource_group": "WORKSPACE" if workspace_id else "DOMAIN",
+                "workspace_id": workspace_id or "*",
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def _create_workspace(self, project_group_count: int, projects_per_group: int):
+        from spaceone.identity.model.project.database import Project
+        from spaceone.identity.model.project_group.database import ProjectGroup
+        from spaceone.identity.model.workspace.database import Workspace
+
+        workspace_vo = Workspace.create(
+            {
+                "name": f"benchmark-{project_group_count}",
+                "dormant_ttl": -1,
+                "user_count": 1,
+                "domain_id": self.domain_id,
+            }
+        )
+        workspace_id = workspace_vo.workspace_id
+
+        self._create_role_binding(
+            self.member_id,
+            "managed-workspace-member",
+            "WORKSPACE_MEMBER",
+            workspace_id,
+        )
+
+        for i in range(project_group_count):
+            project_group_vo = ProjectGroup.create(
+                {
+                    "name": f"project-group-{i}",
+                    "users": [self.member_id],
+                    "workspace_id": workspace_id,
+                    "domain_id": self.domain_id,
+                }
+            )
+
+            for j in range(projects_per_group):
+                Project.create(
+                    {
+                        "name": f"project-{i}-{j}",
+                        "project_group_id": project_group_vo.project_group_id,
+                        "workspace_id": workspace_id,
+                        "domain_id": self.domain_id,
+                    }
+                )
+
+        return workspace_id
+
+
+def build_scenarios(fixture: Fixture) -> List[tuple]:
+    from spaceone.identity.error.error_mfa import ERROR_MFA_REQUIRED
+    from spaceone.identity.manager.mfa_manager.base import MFAManager
+    from spaceone.identity.service.token_service import TokenService
+
+    domain_id = fixture.domain_id
+
+    def issue(auth_type: str, credentials: dict, verify_code: str = None) -> dict:
+        params = {
+            "credentials": credentials,
+            "auth_type": auth_type,
+            "domain_id": domain_id,
+        }
+        if verify_code:
+            params["verify_code"] = verify_code
+
+        return TokenService().issue(params)
+
+    def grant(refresh_token: str, scope: str, workspace_id: str = None) -> dict:
+        params = {
+            "grant_type": "REFRESH_TOKEN",
+            "token": refresh_token,
+            "scope": scope,
+            "domain_id": domain_id,
+        }
+        if workspace_id:
+            params["workspace_id"] = workspace_id
+
+        return TokenService().grant(params)
+
+    local_credentials = {"user_id": fixture.admin_id, "password": PASSWORD}
+    mfa_credentials = {"user_id": fixture.mfa_user_id, "password": PASSWORD}
+    external_credentials = {"user_id": fixture.external_user_id, "password": "-"}
+
+    def prepare_mfa() -> tuple:
+        # the first step sends the verification code and fails with MFA required
+        try:
+            issue("LOCAL", mfa_credentials)
+        except ERROR_MFA_REQUIRED:
+            pass
+
+        verify_code = MFAManager.get_mfa_info(mfa_credentials)["verify_code"]
+        return ("MFA", mfa_credentials, verify_code)
+
+    admin_refresh_token = issue("LOCAL", local_credentials)["refresh_token"]
+    member_refresh_token = issue(
+        "LOCAL", {"user_id": fixture.member_id, "password": PASSWORD}
+    )["refresh_token"]
+
+    scenarios = [
+        ("issue LOCAL", lambda: ("LOCAL", local_credentials), issue),
+        ("issue EXTERNAL", lambda: ("EXTERNAL", external_credentials), issue),
+        ("issue MFA", prepare_mfa, issue),
+        (
+            "grant DOMAIN",
+            lambda: (admin_refresh_token, "DOMAIN"),
+            grant,
+        ),
+    ]
+
+    for project_group_count, workspace_id in fixture.workspaces.items():
+        scenarios.append(
+            (
+                f"grant WORKSPACE ({project_group_count} project groups)",
+                functools.partial(
+                    lambda ws_id: (member_refresh_token, "WORKSPACE", ws_id),
+                    workspace_id,
+                ),
+                grant,
+            )
+        )
+
+    return scenarios
+
+
+def run_scenario(
+    prepare: Callable,
+    func: Callable,
+    iterations: int,
+    concurrency: int,
+    timer: StageCollector,
+    flush_cache: bool = False,
+) -> dict:
+    def run_once(_) -> float:
+        create_transaction(meta={}, thread_id=str(threading.current_thread().ident))
+        try:
+            # preparing MFA codes is not part of the measured request
+            with timer.pause():
+                if flush_cache:
+                    cache.flush()
+                args = prepare()
+
+            start = time.perf_counter()
+            func(*args)
+            return time.perf_counter() - start
+        finally:
+            delete_transaction()
+
+    # warm up process-local and Redis caches like a long-running server
+    run_once(None)
+    timer.reset()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(run_once, range(iterations)))
+
+    # each worker spends sum / concurrency in requests, without preparation
+    latencies.sort()
+    return {
+        "p50": percentile(latencies, 50) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+        "throughput": iterations * concurrency / sum(latencies),
+        "stages": {
+            stage: elapsed / iterations * 1000
+            for stage, elapsed in sorted(timer.elapsed.items())
+        },
+    }
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-n", "--iterations", type=int, default=200)
+    parser.add_argument("-c", "--concurrency", type=int, default=1)
+    parser.add_argument(
+        "--project-groups",
+        default="0,10,100",
+        help="comma separated numbers of project groups of workspace members",
+    )
+    parser.add_argument("--projects-per-group", type=int, default=5)
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument(
+        "--plugin-latency",
+        type=float,
+        default=0,
+        help="simulated latency of the auth plugin in milliseconds",
+    )
+    parser.add_argument(
+        "--flush-cache",
+        action="store_true",
+        help="flush the Redis cache before each request to measure cold lookups",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument(
+        "--mongo-host", default=None, help="e.g. mongodb://localhost:27017"
+    )
+    args = parser.parse_args()
+
+    if not args.verbose:
+        # expected errors such as ERROR_MFA_REQUIRED are logged by the service
+        logging.disable(logging.CRITICAL)
+
+    init_environment(args.mongo_host, args.bcrypt_rounds)
+    stub_external_services(args.plugin_latency / 1000)
+    create_transaction(meta={})
+
+    project_group_counts = [int(c) for c in args.project_groups.split(",") if c]
+    fixture = Fixture(project_group_counts, args.projects_per_group)
+    scenarios = build_scenarios(fixture)
+
+    # the stages are the ones timed by the service itself (IDENTITY.stage_timer)
+    timer = StageCollector()
+    StageTimer.add_exporter(timer)
+
+    print(
+        f"iterations={args.iterations} concurrency={args.concurrency} "
+        f"bcrypt_rounds={args.bcrypt_rounds} "
+        f"mongo={'mongod' if args.mongo_host else 'mongomock'} cache={cache.is_set()}"
+    )
+    print(f"{'scenario':<40} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>9}")
+
+    results = []
+    for name, prepare, func in scenarios:
+        result = run_scenario(
+            prepare, func, args.iterations, args.concurrency, timer, args.flush_cache
+        )
+        results.append((name, result))
+        print(
+            f"{name:<40} {result['p50']:>9.2f} {result['p99']:>9.2f} "
+            f"{result['throughput']:>9.1f}"
+        )
+
+    print("\nmean time per request by stage (ms)")
+    for name, result in results:
+        stages = ", ".join(
+            f"{stage}={elapsed:.2f}" for stage, elapsed in result["stages"].items()
+        )
+        print(f"{name:<40} {stages}")
+
+    if args.mongo_host:
+        mongoengine.get_connection().drop_database(mongoengine.get_db().name)
+
+
+if __name__ == "__main__":
+    main()
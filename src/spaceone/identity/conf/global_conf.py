@@ -20,6 +20,13 @@ WORKSPACE_COLORS_NAME = [
 # Dormancy Settings
 DORMANCY_CHECK_HOUR = 14
 DORMANCY_SETTINGS_KEY = "identity:dormancy:workspace"
+DORMANCY_SHARD_SIZE = 500  # workspaces per shard
+DORMANCY_BATCH_SIZE = 100  # workspaces per checkpoint
+DORMANCY_SHARD_LEASE = 1800  # seconds without progress before a shard is resumed
+DORMANCY_SHARD_MAX_ATTEMPTS = 3
+
+# Workspace User Count Settings
+WORKSPACE_USER_COUNT_RECONCILE_HOUR = 15
 
 # Database Settings
 DATABASE_AUTO_CREATE_INDEX = True
@@ -55,8 +62,96 @@ IDENTITY = {
         "token_max_timeout": 604800,  # 7 days
         "refresh_timeout": 10800,  # 3 hours
         "admin_refresh_max_timeout": 2419200,  # 28 days
+        # encode role permissions into the compact "pmc" claim instead of
+        # "permissions". enable only when every service can decode it, since
+        # "permissions" then holds a marker which denies every permission.
+        "compact_permissions": False,
+        # encode the project list of WORKSPACE_MEMBER tokens into the compact
+        # "pjc" claim when it has at least compact_projects_min_count projects.
+        # enable only when every service can decode it, since "projects" then
+        # holds a marker which matches no project.
+        "compact_projects": False,
+        "compact_projects_min_count": 100,
     },
     "mfa": {"verify_code_timeout": 300},
+    "key_ring": {
+        "ttl": 600,  # 10 minutes
+        "max_size": 1024,
+    },
+    "job_dispatcher": {
+        "max_workers": 8,
+        "max_jobs_per_plugin": 2,
+    },
+    "plugin_endpoint_cache": {
+        "ttl": 300,  # 5 minutes
+        "error_ttl": 10,
+        "max_size": 1024,
+    },
+    "permission_matcher": {
+        "ttl": 3600,  # 1 hour
+        "max_size": 1024,
+    },
+    "password_cipher": {
+        "scheme": "bcrypt",  # bcrypt | scrypt | argon2id (requires argon2-cffi)
+        "bcrypt": {"rounds": 12},
+        "scrypt": {"n": 16384, "r": 8, "p": 1},
+        "argon2id": {"time_cost": 3, "memory_cost": 65536, "parallelism": 4},
+    },
+    "password_cipher_pool": {
+        "max_workers": None,  # number of CPUs
+        "max_queue_size": 64,
+        "timeout": 5,
+        "start_method": "spawn",
+    },
+    # process-local cache in front of Redis for domain and workspace states,
+    # invalidated on every pod by the cache invalidation bus
+    "state_cache": {
+        "expire": 3600,
+        "local_ttl": 30,
+        "local_max_size": 10000,
+    },
+    # process-local cache of compiled JSON schema validators
+    "schema_validator": {
+        "local_ttl": 300,
+        "local_max_size": 1000,
+    },
+    # write-behind buffer of last_accessed_at of users and apps
+    "access_time_buffer": {
+        "enabled": True,
+        "flush_interval": 10,  # seconds
+        "max_size": 10000,
+    },
+    # persistent SMTP connections per process
+    "smtp_pool": {
+        "max_size": 4,
+        "keepalive_interval": 30,  # seconds idle before NOOP check on reuse
+        "max_idle_time": 240,  # seconds idle before closing
+    },
+    # compiled email templates, reused by restarted processes if a dir is set
+    "email_template": {
+        "bytecode_cache_dir": None,  # defaults to a directory under /tmp
+    },
+    # durable outbox of emails sent by background workers. a failure of the
+    # mail server is not reported to the request which queued the email.
+    # emails with temporary passwords or reset links are never stored and
+    # are sent at once, raising the error as before.
+    "email_outbox": {
+        "enabled": True,
+        "workers": 2,
+        "batch_size": 50,
+        "poll_interval": 5,  # seconds
+        "max_attempts": 5,
+        "retry_interval": 30,  # seconds, multiplied by attempts
+        "lease": 300,  # seconds before a claimed email is claimed again
+    },
+    # per-stage timings of token issue and grant
+    "stage_timer": {
+        "enabled": False,
+        "exporters": {
+            "log": {"min_duration_ms": 0},
+            # "prometheus": {"port": 9102},
+        },
+    },
 }
 
 # Handler Settings
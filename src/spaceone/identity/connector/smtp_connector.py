@@ -1,10 +1,16 @@
 import logging
 import smtplib
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Callable
 
 from spaceone.identity.error.error_smtp import *
 
+from spaceone.core import config
 from spaceone.core.connector import BaseConnector
 
 __all__ = ["SMTPConnector"]
@@ -12,24 +18,109 @@ __all__ = ["SMTPConnector"]
 _LOGGER = logging.getLogger(__name__)
 
 
+class _SMTPConnectionPool:
+    """Logged-in SMTP connections of a process, reused across sends.
+
+    A connection idle for more than keepalive_interval seconds is checked
+    with NOOP before it is reused, and one idle for more than max_idle_time
+    seconds is closed, since servers drop idle clients anyway.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], smtplib.SMTP],
+        max_size: int,
+        keepalive_interval: float,
+        max_idle_time: float,
+    ):
+        self._connect = connect
+        self._keepalive_interval = keepalive_interval
+        self._max_idle_time = max_idle_time
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_size)
+
+    @contextmanager
+    def connection(self):
+        with self._semaphore:
+            smtp = self._get_idle_connection() or self._connect()
+
+            try:
+                yield smtp
+            except (smtplib.SMTPServerDisconnected, OSError):
+                self._close(smtp)
+                raise
+            except Exception:
+                self._release(smtp)
+                raise
+            else:
+                self._release(smtp)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+
+        for smtp, _ in idle:
+            self._close(smtp, graceful=True)
+
+    def _get_idle_connection(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+
+                # the most recently used connection is the most likely alive
+                smtp, released_at = self._idle.pop()
+
+            idle_time = time.monotonic() - released_at
+            if idle_time > self._max_idle_time:
+                self._close(smtp, graceful=True)
+            elif idle_time > self._keepalive_interval and not self._is_alive(smtp):
+                self._close(smtp)
+            else:
+                return smtp
+
+    def _release(self, smtp: smtplib.SMTP) -> None:
+        with self._lock:
+            self._idle.append((smtp, time.monotonic()))
+
+    @staticmethod
+    def _is_alive(smtp: smtplib.SMTP) -> bool:
+        try:
+            return smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(smtp: smtplib.SMTP, graceful: bool = False) -> None:
+        try:
+            if graceful:
+                smtp.quit()
+            else:
+                smtp.close()
+        except Exception:
+            smtp.close()
+
+
 class SMTPConnector(BaseConnector):
+    _pools = {}
+    _lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.smtp = None
-        host = self.config.get("host")
-        port = self.config.get("port")
-        user = self.config.get("user")
-        password = self.config.get("password")
+        self.host = self.config.get("host")
+        self.port = self.config.get("port")
+        self.user = self.config.get("user")
+        self.password = self.config.get("password")
         self.from_email = self.config.get("from_email")
-        self.set_smtp(host, port, user, password)
 
-    def set_smtp(self, host, port, user, password):
+    def set_smtp(self, host, port, user, password) -> smtplib.SMTP:
         try:
-            self.smtp = smtplib.SMTP(host, port)
-            self.smtp.connect(host, port)
-            self.smtp.ehlo()
-            self.smtp.starttls()
-            self.smtp.login(user, password)
+            smtp = smtplib.SMTP(host, port)
+            smtp.ehlo()
+            smtp.starttls()
+            smtp.login(user, password)
+            return smtp
         except Exception as e:
             _LOGGER.error(f"[set_smtp] set smtp failed : Please check smtp config {e}")
             raise ERROR_SMTP_CONNECTION_FAILED()
@@ -43,12 +134,45 @@ class SMTPConnector(BaseConnector):
 
         multipart_msg.attach(MIMEText(contents, "html"))
 
-        response = self.smtp.sendmail(
-            self.from_email, to_emails.split(","), multipart_msg.as_string()
-        )
+        pool = self._get_pool()
+
+        # a pooled connection may have been dropped by the server, so retry once
+        for retry in [True, False]:
+            try:
+                with pool.connection() as smtp:
+                    response = smtp.sendmail(
+                        self.from_email,
+                        to_emails.split(","),
+                        multipart_msg.as_string(),
+                    )
+                break
+            except smtplib.SMTPServerDisconnected as e:
+                if not retry:
+                    raise e
+
+                _LOGGER.debug(f"[send_email] reconnect smtp: {e}")
 
         if response:
             _LOGGER.debug(f"[send_email] send email response : {response}")
 
     def quit_smtp(self):
-        self.smtp.quit()
+        self._get_pool().close()
+
+    def _get_pool(self) -> _SMTPConnectionPool:
+        pool_key = (self.host, self.port, self.user)
+
+        if pool_key not in self._pools:
+            with self._lock:
+                if pool_key not in self._pools:
+                    identity_conf = config.get_global("IDENTITY") or {}
+                    pool_conf = identity_conf.get("smtp_pool", {})
+                    self._pools[pool_key] = _SMTPConnectionPool(
+                        lambda: self.set_smtp(
+                            self.host, self.port, self.user, self.password
+                        ),
+                        max_size=pool_conf.get("max_size", 4),
+                        keepalive_interval=pool_conf.get("keepalive_interval", 30),
+                        max_idle_time=pool_conf.get("max_idle_time", 240),
+                    )
+
+        return self._pools[pool_key]
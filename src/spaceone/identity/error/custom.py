@@ -33,3 +33,11 @@ class ERROR_WORKSPACE_EXIST_IN_WORKSPACE_GROUP(ERROR_INVALID_ARGUMENT):
 class ERROR_USER_EXIST_IN_WORKSPACE_GROUP(ERROR_INVALID_ARGUMENT):
     _message = """User exists in Workspace Group. (user_id = {user_id}, workspace_group_id = {workspace_group_id})
                Remove the user from the workspace group before deleting the workspace group."""
+
+
+class ERROR_PASSWORD_CIPHER_BUSY(ERROR_UNAVAILAVBLE):
+    _message = "Too many password hashing requests. Please try again later. (timeout = {timeout})"
+
+
+class ERROR_PASSWORD_CIPHER_NOT_SUPPORTED(ERROR_INVALID_ARGUMENT):
+    _message = "Password cipher scheme is not supported. (scheme = {scheme}, reason = {reason})"
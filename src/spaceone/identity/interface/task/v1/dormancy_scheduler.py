@@ -55,4 +55,20 @@ class DormancyScheduler(HourlyScheduler):
             print(
                 f"{utils.datetime_to_iso8601(datetime.utcnow())} [INFO] [create_task] check_dormancy_by: {self._dormancy_check_hour} hour (UTC)"
             )
-            return []
+
+            # shards of a stopped worker are resumed in the following hours
+            stp = {
+                "name": "dormancy_resume_schedule",
+                "version": "v1",
+                "executionEngine": "BaseWorker",
+                "stages": [
+                    {
+                        "locator": "SERVICE",
+                        "name": "JobService",
+                        "metadata": {"token": self._token},
+                        "method": "resume_dormancy_shards",
+                        "params": {"params": {}},
+                    }
+                ],
+            }
+            return [stp]
@@ -0,0 +1,43 @@
+import logging
+
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core import config
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import IntervalScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EmailOutboxScheduler(IntervalScheduler):
+    def __init__(self, queue, interval):
+        super().__init__(queue, interval)
+        self.locator = Locator()
+        self._init_config()
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+
+    def create_task(self) -> list:
+        tasks = []
+        tasks.extend(self._create_drain_task())
+        return tasks
+
+    def _create_drain_task(self):
+        # emails left by a stopped process are sent even if no email is queued
+        stp = {
+            "name": "email_outbox_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "JobService",
+                    "metadata": {"token": self._token},
+                    "method": "drain_email_outbox",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+        return [stp]
@@ -0,0 +1,130 @@
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Type, Union
+
+from pymongo import UpdateOne
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AccessTimeBuffer:
+    """Write-behind buffer of access timestamps (e.g. last_accessed_at).
+
+    Timestamps are collected in memory, keeping only the latest one per
+    document, and written by a background thread every flush_interval
+    seconds with one unordered bulk_write per collection. A timestamp is
+    only written when it is newer than the stored one, so buffers of
+    several processes or pods can be flushed in any order. The buffer is
+    also flushed when it reaches max_size and at interpreter shutdown.
+    """
+
+    _buffer = {}
+    _lock = threading.Lock()
+    _flush_thread: Union[threading.Thread, None] = None
+    _conf: Union[dict, None] = None
+
+    @classmethod
+    def record(
+        cls,
+        model: Type[MongoModel],
+        conditions: dict,
+        field: str = "last_accessed_at",
+        accessed_at: datetime = None,
+    ) -> None:
+        accessed_at = accessed_at or datetime.utcnow()
+        conf = cls._get_conf()
+
+        if not conf["enabled"]:
+            cls._write(model, [(conditions, field, accessed_at)])
+            return
+
+        key = (model, field, tuple(sorted(conditions.items())))
+
+        with cls._lock:
+            current = cls._buffer.get(key)
+            if current is None or current < accessed_at:
+                cls._buffer[key] = accessed_at
+
+            buffer_size = len(cls._buffer)
+            cls._start_flush_thread(conf["flush_interval"])
+
+        if buffer_size >= conf["max_size"]:
+            cls.flush()
+
+    @classmethod
+    def flush(cls) -> int:
+        with cls._lock:
+            buffer, cls._buffer = cls._buffer, {}
+
+        updates = defaultdict(list)
+        for (model, field, conditions), accessed_at in buffer.items():
+            updates[model].append((dict(conditions), field, accessed_at))
+
+        for model, model_updates in updates.items():
+            cls._write(model, model_updates)
+
+        return len(buffer)
+
+    @staticmethod
+    def _write(model: Type[MongoModel], updates: list) -> None:
+        # a conditional $set instead of $max, which mongomock cannot apply to null
+        operations = [
+            UpdateOne(
+                {
+                    **conditions,
+                    "$or": [{field: None}, {field: {"$lt": accessed_at}}],
+                },
+                {"$set": {field: accessed_at}},
+            )
+            for conditions, field, accessed_at in updates
+        ]
+
+        try:
+            model._get_collection().bulk_write(operations, ordered=False)
+        except Exception as e:
+            # access times are informational, so a failed flush is not retried
+            _LOGGER.error(
+                f"[AccessTimeBuffer] failed to write {len(operations)} "
+                f"{model.__name__} access times: {e}"
+            )
+
+    @classmethod
+    def _start_flush_thread(cls, flush_interval: float) -> None:
+        if cls._flush_thread is None:
+            cls._flush_thread = threading.Thread(
+                target=cls._run_flush_loop,
+                args=(flush_interval,),
+                name="access-time-buffer",
+                daemon=True,
+            )
+            cls._flush_thread.start()
+            atexit.register(cls.flush)
+
+    @classmethod
+    def _run_flush_loop(cls, flush_interval: float) -> None:
+        while True:
+            time.sleep(flush_interval)
+
+            try:
+                cls.flush()
+            except Exception as e:
+                _LOGGER.error(f"[AccessTimeBuffer] flush error: {e}", exc_info=True)
+
+    @classmethod
+    def _get_conf(cls) -> dict:
+        if cls._conf is None:
+            identity_conf = config.get_global("IDENTITY") or {}
+            buffer_conf = identity_conf.get("access_time_buffer", {})
+            cls._conf = {
+                "enabled": buffer_conf.get("enabled", True),
+                "flush_interval": buffer_conf.get("flush_interval", 10),
+                "max_size": buffer_conf.get("max_size", 10000),
+            }
+
+        return cls._conf
@@ -1,15 +1,249 @@
 # -*- coding: utf-8 -*-
 
+import base64
+import hashlib
+import hmac
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Tuple, Union
+
 import bcrypt
+from spaceone.core import config
+
+from spaceone.identity.error.custom import (
+    ERROR_PASSWORD_CIPHER_BUSY,
+    ERROR_PASSWORD_CIPHER_NOT_SUPPORTED,
+)
+
+try:
+    from argon2 import PasswordHasher as Argon2Hasher
+    from argon2 import exceptions as argon2_exceptions
+except ImportError:
+    Argon2Hasher = None
+    argon2_exceptions = None
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEMES = ["bcrypt", "scrypt", "argon2id"]
+
+DEFAULT_SCHEME_OPTIONS = {
+    "bcrypt": {"rounds": 12},
+    "scrypt": {"n": 16384, "r": 8, "p": 1},
+    "argon2id": {"time_cost": 3, "memory_cost": 65536, "parallelism": 4},
+}
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _hashpw(password: bytes, scheme: str, options: dict) -> bytes:
+    if scheme == "bcrypt":
+        return bcrypt.hashpw(password, bcrypt.gensalt(rounds=options["rounds"]))
+
+    elif scheme == "scrypt":
+        salt = os.urandom(16)
+        n, r, p = options["n"], options["r"], options["p"]
+        hashed = hashlib.scrypt(
+            password, salt=salt, n=n, r=r, p=p, maxmem=128 * n * r * p + 2**20
+        )
+        return b"$scrypt$n=%d,r=%d,p=%d$%s$%s" % (
+            n,
+            r,
+            p,
+            _b64encode(salt),
+            _b64encode(hashed),
+        )
+
+    elif scheme == "argon2id":
+        return Argon2Hasher(**options).hash(password).encode("utf-8")
+
+    raise ValueError(f"unknown password hash scheme: {scheme}")
+
+
+def _checkpw(password: bytes, hashed: bytes) -> bool:
+    scheme, options = _parse_hash(hashed)
+
+    if scheme == "bcrypt":
+        return bcrypt.checkpw(password, hashed)
+
+    elif scheme == "scrypt":
+        salt, expected = hashed.split(b"$")[3:5]
+        n, r, p = options["n"], options["r"], options["p"]
+        expected = _b64decode(expected)
+        hashed = hashlib.scrypt(
+            password,
+            salt=_b64decode(salt),
+            n=n,
+            r=r,
+            p=p,
+            maxmem=128 * n * r * p + 2**20,
+            dklen=len(expected),
+        )
+        return hmac.compare_digest(hashed, expected)
+
+    elif scheme == "argon2id":
+        try:
+            return Argon2Hasher().verify(hashed, password)
+        except (argon2_exceptions.VerificationError, argon2_exceptions.InvalidHash):
+            return False
+
+    return False
+
+
+def _parse_hash(hashed: bytes) -> Tuple[Union[str, None], dict]:
+    """Returns the scheme and the cost options encoded in a stored hash."""
+
+    if hashed.startswith((b"$2a$", b"$2b$", b"$2y$")):
+        return "bcrypt", {"rounds": int(hashed.split(b"$")[2])}
+
+    elif hashed.startswith(b"$scrypt$"):
+        params = hashed.split(b"$")[2].split(b",")
+        return "scrypt", {
+            key.decode(): int(value)
+            for key, value in [param.split(b"=") for param in params]
+        }
+
+    elif hashed.startswith(b"$argon2id$"):
+        # $argon2id$v=19$m=65536,t=3,p=4$salt$hash
+        params = dict(param.split(b"=") for param in hashed.split(b"$")[3].split(b","))
+        return "argon2id", {
+            "time_cost": int(params[b"t"]),
+            "memory_cost": int(params[b"m"]),
+            "parallelism": int(params[b"p"]),
+        }
+
+    return None, {}
+
+
+class PasswordCipherPool:
+    """Process pool for CPU-bound password hashing and verification.
+
+    Hashing runs in worker processes, so it neither holds the GIL nor
+    occupies a gRPC worker thread for the whole KDF. The number of requests
+    in flight is bounded by max_workers + max_queue_size; callers wait up to
+    timeout seconds for a slot and are rejected with
+    ERROR_PASSWORD_CIPHER_BUSY beyond that.
+    """
+
+    _executor: Union[ProcessPoolExecutor, None] = None
+    _semaphore: Union[threading.BoundedSemaphore, None] = None
+    _timeout: float = 5
+    _lock = threading.Lock()
+
+    @classmethod
+    def run(cls, func, *args):
+        executor, semaphore = cls._get_executor()
+
+        if not semaphore.acquire(timeout=cls._timeout):
+            _LOGGER.warning("[PasswordCipherPool] request queue is full.")
+            raise ERROR_PASSWORD_CIPHER_BUSY(timeout=cls._timeout)
+
+        try:
+            return executor.submit(func, *args).result()
+        except BrokenProcessPool:
+            _LOGGER.error("[PasswordCipherPool] process pool is broken. restart.")
+            cls._reset(executor)
+            raise
+        finally:
+            semaphore.release()
+
+    @classmethod
+    def _get_executor(cls):
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    identity_conf = config.get_global("IDENTITY") or {}
+                    pool_conf = identity_conf.get("password_cipher_pool", {})
+                    max_workers = pool_conf.get("max_workers") or os.cpu_count()
+                    max_queue_size = pool_conf.get("max_queue_size", 64)
+
+                    cls._timeout = pool_conf.get("timeout", 5)
+                    cls._semaphore = threading.BoundedSemaphore(
+                        max_workers + max_queue_size
+                    )
+                    # worker processes are spawned, since forking a process
+                    # with running gRPC threads is not safe
+                    cls._executor = ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        mp_context=multiprocessing.get_context(
+                            pool_conf.get("start_method", "spawn")
+                        ),
+                    )
+
+        return cls._executor, cls._semaphore
+
+    @classmethod
+    def _reset(cls, executor: ProcessPoolExecutor) -> None:
+        with cls._lock:
+            if cls._executor is executor:
+                cls._executor = None
+
+        executor.shutdown(wait=False)
 
 
 class PasswordCipher:
+    """Hashes and verifies passwords with a configurable KDF.
+
+    Hashes are self-describing (bcrypt "$2b$", "$scrypt$" and "$argon2id$"),
+    so passwords hashed by any supported scheme and cost can be verified,
+    while new hashes use the configured scheme. needs_rehash tells whether
+    a stored hash should be upgraded to the current configuration.
+    """
+
+    def __init__(self, scheme: str = None, options: dict = None):
+        identity_conf = config.get_global("IDENTITY") or {}
+        cipher_conf = identity_conf.get("password_cipher", {})
+
+        self.scheme = scheme or cipher_conf.get("scheme", "bcrypt")
+
+        self._check_scheme(self.scheme)
+
+        self.options = {
+            **DEFAULT_SCHEME_OPTIONS[self.scheme],
+            **cipher_conf.get(self.scheme, {}),
+            **(options or {}),
+        }
+
     @staticmethod
-    def __encoder(password: str) -> str:
+    def __encoder(password: str) -> bytes:
         return str(password).encode("utf-8")
 
     def hashpw(self, password: str) -> bytes:
-        return bcrypt.hashpw(self.__encoder(password), bcrypt.gensalt())
+        return PasswordCipherPool.run(
+            _hashpw, self.__encoder(password), self.scheme, self.options
+        )
 
     def checkpw(self, password, hashed) -> bool:
-        return bcrypt.checkpw(self.__encoder(password), hashed)
+        scheme, _ = _parse_hash(hashed)
+        if scheme is None:
+            return False
+
+        self._check_scheme(scheme)
+        return PasswordCipherPool.run(_checkpw, self.__encoder(password), hashed)
+
+    def needs_rehash(self, hashed: bytes) -> bool:
+        scheme, options = _parse_hash(hashed)
+        return scheme != self.scheme or any(
+            options.get(key) != value for key, value in self.options.items()
+        )
+
+    @staticmethod
+    def _check_scheme(scheme: str) -> None:
+        if scheme not in SCHEMES:
+            raise ERROR_PASSWORD_CIPHER_NOT_SUPPORTED(
+                scheme=scheme, reason="unknown scheme"
+            )
+
+        if scheme == "argon2id" and Argon2Hasher is None:
+            raise ERROR_PASSWORD_CIPHER_NOT_SUPPORTED(
+                scheme=scheme, reason="argon2-cffi is not installed"
+            )
@@ -0,0 +1,76 @@
+import base64
+import re
+import zlib
+from typing import List
+
+_HEX_ID_PATTERN = re.compile(r"^([a-z]+-)([0-9a-f]+)$")
+
+# put in the plain list claim of a token carrying its compact form, so that a
+# service which does not decode the compact claim denies instead of allowing
+# everything: it matches no permission prefix and no project id
+COMPACT_CLAIM_MARKER = "!compact"
+
+
+def encode_list_claim(values: List[str]) -> str:
+    """Encodes a list of ids into a compact token claim.
+
+    Generated ids sharing one prefix with fixed-length hex suffixes (e.g.
+    "project-725d939bfc8d") are packed as raw bytes ("h."), anything else is
+    zlib compressed ("z."). Both forms are base64url encoded.
+    """
+
+    if packed := _pack_hex_ids(values):
+        return "h." + _b64encode(packed)
+
+    data = zlib.compress("\n".join(sorted(values)).encode("utf-8"))
+    return "z." + _b64encode(data)
+
+
+def decode_list_claim(claim: str) -> List[str]:
+    encoding, _, encoded = claim.partition(".")
+    data = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+
+    if encoding == "h":
+        prefix, _, packed = data.partition(b"\0")
+        id_size = packed[0]
+        prefix = prefix.decode("utf-8")
+        return [
+            prefix + packed[index : index + id_size].hex()
+            for index in range(1, len(packed), id_size)
+        ]
+
+    values = zlib.decompress(data).decode("utf-8")
+    return values.split("\n") if values else []
+
+
+def _pack_hex_ids(values: List[str]) -> bytes:
+    prefix = None
+    hex_size = None
+    packed = []
+
+    for value in values:
+        match = _HEX_ID_PATTERN.match(value)
+        if match is None:
+            return b""
+
+        if prefix is None:
+            prefix, hex_size = match.group(1), len(match.group(2))
+
+        if match.group(1) != prefix or len(match.group(2)) != hex_size:
+            return b""
+
+        packed.append(match.group(2))
+
+    if not packed or hex_size % 2 or hex_size // 2 > 255:
+        return b""
+
+    return (
+        prefix.encode("utf-8")
+        + b"\0"
+        + bytes([hex_size // 2])
+        + bytes.fromhex("".join(packed))
+    )
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
@@ -0,0 +1,249 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import List, Tuple, Union
+
+from pymongo import ReturnDocument
+from spaceone.core import config, utils
+
+from spaceone.identity.connector.smtp_connector import SMTPConnector
+from spaceone.identity.error.error_smtp import ERROR_SMTP_CONNECTION_FAILED
+from spaceone.identity.model.email_outbox.database import OutboxEmail
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EmailOutbox:
+    """Durable outbox of emails, sent by background worker threads.
+
+    send stores the email in the database and wakes the workers, so a
+    request does not wait for the mail server. Workers claim emails in
+    batches with an atomic update and send each batch over pooled SMTP
+    connections. Failed emails are retried with a growing delay, and
+    emails claimed by a stopped process are claimed again after the lease
+    time. Since workers only run in processes which send emails, the
+    EmailOutboxScheduler also drains the outbox periodically. An email
+    with an expiration (e.g. of a verification code) is dropped instead
+    of being sent or retried after it expires. A failure of a queued
+    email is logged by the worker, not raised to the sender.
+    """
+
+    _workers: List[threading.Thread] = []
+    _wakeup = threading.Event()
+    _lock = threading.Lock()
+    _conf: Union[dict, None] = None
+
+    @classmethod
+    def send(
+        cls, to_emails: str, subject: str, contents: str, expire: int = None
+    ) -> None:
+        cls.send_many([(to_emails, subject, contents)], expire)
+
+    @classmethod
+    def send_many(
+        cls,
+        messages: List[Tuple[str, str, str]],
+        expire: int = None,
+        durable: bool = True,
+    ) -> None:
+        """Queues (to_emails, subject, contents) messages with one insert.
+
+        expire is the number of seconds after which the messages are useless.
+        Messages which must not be stored (e.g. with passwords) are sent at
+        once with durable=False, raising the error of the mail server.
+        """
+
+        conf = cls._get_conf()
+        smtp_connector = SMTPConnector()
+
+        # a missing configuration is reported to the caller as before
+        if not smtp_connector.host:
+            raise ERROR_SMTP_CONNECTION_FAILED()
+
+        if not (conf["enabled"] and durable):
+            for to_emails, subject, contents in messages:
+                smtp_connector.send_email(to_emails, subject, contents)
+            return
+
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=expire) if expire else None
+        OutboxEmail._get_collection().insert_many(
+            [
+                {
+                    "email_id": utils.generate_id("email"),
+                    "to_emails": to_emails,
+                    "subject": subject,
+                    "contents": contents,
+                    "status": "PENDING",
+                    "attempts": 0,
+                    "created_at": now,
+                    "next_attempt_at": now,
+                    "expires_at": expires_at,
+                }
+                for to_emails, subject, contents in messages
+            ]
+        )
+
+        cls.start()
+        cls._wakeup.set()
+
+    @classmethod
+    def start(cls) -> None:
+        if cls._workers:
+            return
+
+        conf = cls._get_conf()
+        with cls._lock:
+            if not cls._workers:
+                for index in range(conf["workers"]):
+                    worker = threading.Thread(
+                        target=cls._run_worker,
+                        name=f"email-outbox-{index}",
+                        daemon=True,
+                    )
+                    worker.start()
+                    cls._workers.append(worker)
+
+    @classmethod
+    def drain(cls) -> int:
+        """Sends one batch of emails and returns the number of claimed emails."""
+
+        conf = cls._get_conf()
+        OutboxEmail._get_collection().delete_many(
+            {"expires_at": {"$lte": datetime.utcnow()}}
+        )
+
+        outbox_emails = cls._claim_emails(conf["batch_size"], conf["lease"])
+
+        if outbox_emails:
+            smtp_connector = SMTPConnector()
+            for outbox_email in outbox_emails:
+                cls._send_email(smtp_connector, outbox_email, conf)
+
+        return len(outbox_emails)
+
+    @classmethod
+    def drain_all(cls) -> int:
+        """Drains the outbox until no batch is left, e.g. in a scheduled task."""
+
+        conf = cls._get_conf()
+
+        total_count = 0
+        while True:
+            claimed_count = cls.drain()
+            total_count += claimed_count
+
+            if claimed_count < conf["batch_size"]:
+                return total_count
+
+    @staticmethod
+    def _claim_emails(batch_size: int, lease: int) -> List[dict]:
+        now = datetime.utcnow()
+        claimable = {
+            "$or": [
+                {"status": "PENDING", "next_attempt_at": {"$lte": now}},
+                {
+                    "status": "SENDING",
+                    "claimed_at": {"$lt": now - timedelta(seconds=lease)},
+                },
+            ],
+            "expires_at": {"$not": {"$lte": now}},
+        }
+
+        collection = OutboxEmail._get_collection()
+        candidates = (
+            collection.find(claimable, {"_id": 1})
+            .sort("created_at", 1)
+            .limit(batch_size)
+        )
+
+        outbox_emails = []
+        for candidate in list(candidates):
+            # another worker may have claimed it in the meantime
+            outbox_email = collection.find_one_and_update(
+                {"_id": candidate["_id"], **claimable},
+                {
+                    "$set": {"status": "SENDING", "claimed_at": now},
+                    "$inc": {"attempts": 1},
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+            if outbox_email:
+                outbox_emails.append(outbox_email)
+
+        return outbox_emails
+
+    @staticmethod
+    def _send_email(
+        smtp_connector: SMTPConnector, outbox_email: dict, conf: dict
+    ) -> None:
+        collection = OutboxEmail._get_collection()
+
+        try:
+            smtp_connector.send_email(
+                outbox_email["to_emails"],
+                outbox_email["subject"],
+                outbox_email["contents"],
+            )
+        except Exception as e:
+            attempts = outbox_email["attempts"]
+            retry_delay = conf["retry_interval"] * attempts
+            next_attempt_at = datetime.utcnow() + timedelta(seconds=retry_delay)
+            expires_at = outbox_email.get("expires_at")
+
+            if expires_at and next_attempt_at >= expires_at:
+                _LOGGER.error(
+                    f"[EmailOutbox] give up sending {outbox_email['email_id']} "
+                    f"which expires before the next attempt: {e}"
+                )
+                collection.delete_one({"_id": outbox_email["_id"]})
+                return
+            elif attempts >= conf["max_attempts"]:
+                _LOGGER.error(
+                    f"[EmailOutbox] give up sending {outbox_email['email_id']} "
+                    f"after {attempts} attempts: {e}"
+                )
+                update = {"status": "FAILED", "contents": None}
+            else:
+                _LOGGER.warning(
+                    f"[EmailOutbox] failed to send {outbox_email['email_id']} "
+                    f"(attempts = {attempts}): {e}"
+                )
+                update = {"status": "PENDING", "next_attempt_at": next_attempt_at}
+
+            update["error_message"] = str(e)
+            collection.update_one({"_id": outbox_email["_id"]}, {"$set": update})
+        else:
+            collection.delete_one({"_id": outbox_email["_id"]})
+
+    @classmethod
+    def _run_worker(cls) -> None:
+        conf = cls._get_conf()
+
+        while True:
+            cls._wakeup.clear()
+
+            try:
+                if cls.drain() >= conf["batch_size"]:
+                    continue
+            except Exception as e:
+                _LOGGER.error(f"[EmailOutbox] worker error: {e}", exc_info=True)
+
+            cls._wakeup.wait(conf["poll_interval"])
+
+    @classmethod
+    def _get_conf(cls) -> dict:
+        if cls._conf is None:
+            identity_conf = config.get_global("IDENTITY") or {}
+            outbox_conf = identity_conf.get("email_outbox", {})
+            cls._conf = {
+                "enabled": outbox_conf.get("enabled", True),
+                "workers": outbox_conf.get("workers", 2),
+                "batch_size": outbox_conf.get("batch_size", 50),
+                "poll_interval": outbox_conf.get("poll_interval", 5),
+                "max_attempts": outbox_conf.get("max_attempts", 5),
+                "retry_interval": outbox_conf.get("retry_interval", 30),
+                "lease": outbox_conf.get("lease", 300),
+            }
+
+        return cls._conf
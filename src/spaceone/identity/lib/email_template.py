@@ -0,0 +1,112 @@
+import logging
+import os
+import threading
+from typing import Dict, List, Union
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+from spaceone.core import config
+
+_LOGGER = logging.getLogger(__name__)
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "../template")
+DEFAULT_LANGUAGE = "en"
+
+
+class EmailTemplate:
+    """Email templates compiled once per process.
+
+    precompile() compiles every template when the module is loaded and keeps
+    them in memory, so sending an email neither looks up the loader nor
+    checks the file for changes. Compiled code is stored in a bytecode
+    cache on disk, so a restarted process loads it instead of parsing the
+    HTML again. Templates are named <name>_<language>.html, and a language
+    without a template falls back to DEFAULT_LANGUAGE.
+    """
+
+    _env: Union[Environment, None] = None
+    _templates: Dict[str, Template] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def precompile(cls) -> int:
+        env = cls._get_env()
+
+        templates = {}
+        for template_name in env.list_templates(extensions=["html"]):
+            templates[template_name] = env.get_template(template_name)
+
+        with cls._lock:
+            cls._templates = templates
+
+        return len(templates)
+
+    @classmethod
+    def resolve_language(cls, name: str, language: str) -> str:
+        if f"{name}_{language}.html" in cls._templates:
+            return language
+        else:
+            return DEFAULT_LANGUAGE
+
+    @classmethod
+    def render(cls, name: str, language: str, **context) -> str:
+        return cls.render_many(name, language, [context])[0]
+
+    @classmethod
+    def render_many(
+        cls, name: str, language: str, contexts: List[dict], **common_context
+    ) -> List[str]:
+        """Renders a template once per context, sharing the common context."""
+
+        template = cls._get_template(name, language)
+        common_context.setdefault(
+            "service_name", config.get_global("EMAIL_SERVICE_NAME")
+        )
+
+        return [template.render(common_context, **context) for context in contexts]
+
+    @classmethod
+    def _get_template(cls, name: str, language: str) -> Template:
+        if not cls._templates:
+            cls.precompile()
+
+        template_name = f"{name}_{cls.resolve_language(name, language)}.html"
+
+        if template := cls._templates.get(template_name):
+            return template
+
+        # templates added after precompile()
+        template = cls._get_env().get_template(template_name)
+        with cls._lock:
+            cls._templates[template_name] = template
+
+        return template
+
+    @classmethod
+    def _get_env(cls) -> Environment:
+        if cls._env is None:
+            with cls._lock:
+                if cls._env is None:
+                    identity_conf = config.get_global("IDENTITY") or {}
+                    template_conf = identity_conf.get("email_template", {})
+                    cls._env = Environment(
+                        loader=FileSystemLoader(searchpath=TEMPLATE_PATH),
+                        autoescape=select_autoescape(),
+                        bytecode_cache=FileSystemBytecodeCache(
+                            template_conf.get("bytecode_cache_dir")
+                        ),
+                        auto_reload=False,
+                    )
+
+        return cls._env
+
+
+try:
+    EmailTemplate.precompile()
+except Exception as e:
+    _LOGGER.error(f"[EmailTemplate] failed to precompile templates: {e}")
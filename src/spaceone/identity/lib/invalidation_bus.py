@@ -0,0 +1,256 @@
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Union
+
+from spaceone.core import cache
+from spaceone.core.cache.redis_cache import RedisCache
+
+_LOGGER = logging.getLogger(__name__)
+
+_CHANNEL = "identity:cache-invalidation"
+
+# shared cache keys to drop per event, keys ending with "*" are patterns
+_EVENTS = {
+    "DOMAIN_STATE_CHANGED": [
+        "identity:resource-state:domain:{domain_id}",
+    ],
+    "WORKSPACE_STATE_CHANGED": [
+        "identity:resource-state:workspace:{domain_id}:{workspace_id}",
+    ],
+    "DOMAIN_SECRET_CHANGED": [
+        "identity:public-jwk:{domain_id}",
+        "identity:private-jwk:{domain_id}",
+        "identity:refresh-public-jwk:{domain_id}",
+        "identity:refresh-private-jwk:{domain_id}",
+    ],
+    "ROLE_CHANGED": [
+        "identity:role-permission-info:{domain_id}:{role_id}",
+    ],
+    "PROJECT_GROUP_TREE_CHANGED": [],
+    "APP_CHANGED": [
+        "identity:app-auth:{domain_id}:{generation}:{client_id}",
+    ],
+    # compiled validators are only cached locally
+    "SCHEMA_CHANGED": [],
+}
+
+# generations to increase per event. entries keyed by an older generation are
+# never read again and expire on their own, so no keys have to be scanned
+_GENERATIONS = {
+    "DOMAIN_STATE_CHANGED": [
+        "identity:app-auth-generation:{domain_id}",
+    ],
+    "WORKSPACE_STATE_CHANGED": [
+        "identity:app-auth-generation:{domain_id}",
+    ],
+    "ROLE_CHANGED": [
+        "identity:app-auth-generation:{domain_id}",
+    ],
+    # API keys of a project group cache the projects under it
+    "PROJECT_GROUP_TREE_CHANGED": [
+        "identity:user-projects-generation:{domain_id}:{workspace_id}",
+        "identity:project-group-generation:{domain_id}",
+        "identity:app-auth-generation:{domain_id}",
+    ],
+}
+
+
+@cache.connect
+def _get_cache_backend(cache_cls):
+    return cache_cls
+
+
+class InvalidationBus:
+    """Central invalidation of identity caches.
+
+    Managers publish typed events (e.g. role_changed) instead of deleting
+    cache keys themselves. The publishing process drops the shared cache
+    entries of the event and the event is broadcast on a Redis channel, so
+    every process runs the local handlers registered for it (e.g. to drop
+    parsed domain keys). Local handlers must be idempotent, because the
+    publishing process runs them directly and again when the broadcast
+    comes back. When the subscriber reconnects, reset handlers run instead,
+    since events may have been missed in the meantime.
+
+    Caches with many entries per domain include a generation in their keys
+    (see get_generation), which an event increases instead of deleting the
+    entries.
+    """
+
+    _local_handlers = defaultdict(list)
+    _reset_handlers = []
+    _lock = threading.Lock()
+    _subscriber: Union[threading.Thread, None] = None
+
+    @classmethod
+    def domain_state_changed(cls, domain_id: str) -> None:
+        cls.publish("DOMAIN_STATE_CHANGED", domain_id=domain_id)
+
+    @classmethod
+    def workspace_state_changed(cls, domain_id: str, workspace_id: str) -> None:
+        cls.publish(
+            "WORKSPACE_STATE_CHANGED", domain_id=domain_id, workspace_id=workspace_id
+        )
+
+    @classmethod
+    def domain_secret_changed(cls, domain_id: str) -> None:
+        cls.publish("DOMAIN_SECRET_CHANGED", domain_id=domain_id)
+
+    @classmethod
+    def role_changed(cls, domain_id: str, role_id: str) -> None:
+        cls.publish("ROLE_CHANGED", domain_id=domain_id, role_id=role_id)
+
+    @classmethod
+    def project_group_tree_changed(cls, domain_id: str, workspace_id: str) -> None:
+        cls.publish(
+            "PROJECT_GROUP_TREE_CHANGED",
+            domain_id=domain_id,
+            workspace_id=workspace_id,
+        )
+
+    @classmethod
+    def app_changed(cls, domain_id: str, *client_ids: str) -> None:
+        generation = cls.get_generation(f"identity:app-auth-generation:{domain_id}")
+        for client_id in set(client_ids):
+            if client_id:
+                cls.publish(
+                    "APP_CHANGED",
+                    domain_id=domain_id,
+                    client_id=client_id,
+                    generation=generation,
+                )
+
+    @classmethod
+    def schema_changed(
+        cls, domain_id: str, schema_id: str, provider: str, schema_type: str
+    ) -> None:
+        cls.publish(
+            "SCHEMA_CHANGED",
+            domain_id=domain_id,
+            schema_id=schema_id,
+            provider=provider,
+            schema_type=schema_type,
+        )
+
+    @classmethod
+    def publish(cls, event_type: str, **params) -> None:
+        if event_type not in _EVENTS:
+            raise ValueError(f"unknown invalidation event: {event_type}")
+
+        cls._run_local_handlers(event_type, params)
+
+        if not cache.is_set():
+            return
+
+        for key in _EVENTS[event_type]:
+            key = key.format(**params)
+            if key.endswith("*"):
+                cache.delete_pattern(key)
+            else:
+                cache.delete(key)
+
+        for generation_key in _GENERATIONS.get(event_type, []):
+            cls.increase_generation(generation_key.format(**params))
+
+        backend = _get_cache_backend()
+        if isinstance(backend, RedisCache):
+            message = json.dumps({"event_type": event_type, "params": params})
+            try:
+                backend.conn.publish(_CHANNEL, message)
+            except Exception as e:
+                _LOGGER.error(f"[InvalidationBus] failed to publish {event_type}: {e}")
+
+    @classmethod
+    def get_generation(cls, generation_key: str) -> int:
+        if not cache.is_set():
+            return 0
+
+        generation = cache.get(generation_key)
+        if generation is None:
+            generation = cls._init_generation(generation_key)
+
+        return generation
+
+    @classmethod
+    def increase_generation(cls, generation_key: str) -> None:
+        # a lost counter restarts from a new value instead of an old generation
+        if cache.increment(generation_key) == 1:
+            cls._init_generation(generation_key)
+
+    @classmethod
+    def add_local_handler(cls, event_type: str, handler: Callable[..., None]) -> None:
+        with cls._lock:
+            cls._local_handlers[event_type].append(handler)
+
+    @classmethod
+    def add_reset_handler(cls, handler: Callable[[], None]) -> None:
+        with cls._lock:
+            cls._reset_handlers.append(handler)
+
+    @classmethod
+    def start(cls) -> None:
+        if cls._subscriber is not None:
+            return
+
+        # without a shared cache, there are no other processes to hear from
+        if not cache.is_set() or not isinstance(_get_cache_backend(), RedisCache):
+            return
+
+        with cls._lock:
+            if cls._subscriber is None:
+                cls._subscriber = threading.Thread(
+                    target=cls._run_subscriber,
+                    name="invalidation-bus-subscriber",
+                    daemon=True,
+                )
+                cls._subscriber.start()
+
+    @staticmethod
+    def _init_generation(generation_key: str) -> int:
+        generation = time.time_ns() // 1000
+        cache.set(generation_key, generation)
+        return generation
+
+    @classmethod
+    def _run_local_handlers(cls, event_type: str, params: dict) -> None:
+        for handler in list(cls._local_handlers.get(event_type, [])):
+            try:
+                handler(**params)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[InvalidationBus] failed to handle {event_type}: {e}",
+                    exc_info=True,
+                )
+
+    @classmethod
+    def _run_reset_handlers(cls) -> None:
+        for handler in list(cls._reset_handlers):
+            try:
+                handler()
+            except Exception as e:
+                _LOGGER.error(f"[InvalidationBus] failed to reset: {e}", exc_info=True)
+
+    @classmethod
+    def _run_subscriber(cls) -> None:
+        while True:
+            try:
+                pubsub = _get_cache_backend().conn.pubsub(
+                    ignore_subscribe_messages=True
+                )
+                pubsub.subscribe(_CHANNEL)
+
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        event = json.loads(message["data"])
+                        cls._run_local_handlers(event["event_type"], event["params"])
+
+            except Exception as e:
+                _LOGGER.error(f"[InvalidationBus] subscriber error: {e}")
+
+            # events may have been missed while disconnected
+            cls._run_reset_handlers()
+
+            time.sleep(1)
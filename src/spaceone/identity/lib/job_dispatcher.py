@@ -0,0 +1,73 @@
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class JobDispatcher:
+    """Runs tasks on a bounded thread pool with a concurrency limit per key.
+
+    Tasks of the same key (e.g. a plugin) wait in their own queue instead of
+    occupying a worker thread, so a slow key never stalls the other keys.
+    Each task runs in its own transaction created from the given meta.
+    """
+
+    def __init__(self, max_workers: int, max_tasks_per_key: int, meta: dict = None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="job-dispatcher"
+        )
+        self._max_tasks_per_key = max_tasks_per_key
+        self._meta = meta or {}
+        self._queues = {}
+        self._running = {}
+        self._pending_count = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.wait()
+        self._executor.shutdown(wait=True)
+
+    def submit(self, key: str, func: Callable, *args, **kwargs) -> None:
+        with self._condition:
+            self._queues.setdefault(key, deque()).append((func, args, kwargs))
+            self._pending_count += 1
+            self._schedule(key)
+
+    def wait(self) -> None:
+        with self._condition:
+            while self._pending_count > 0:
+                self._condition.wait()
+
+    def _schedule(self, key: str) -> None:
+        queue = self._queues[key]
+        while queue and self._running.get(key, 0) < self._max_tasks_per_key:
+            func, args, kwargs = queue.popleft()
+            self._running[key] = self._running.get(key, 0) + 1
+            self._executor.submit(self._run, key, func, args, kwargs)
+
+    def _run(self, key: str, func: Callable, args: tuple, kwargs: dict) -> None:
+        create_transaction(
+            meta=dict(self._meta),
+            thread_id=str(threading.current_thread().ident),
+        )
+
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            _LOGGER.error(f"[JobDispatcher] task error ({key}): {e}", exc_info=True)
+        finally:
+            delete_transaction()
+
+            with self._condition:
+                self._running[key] -= 1
+                self._pending_count -= 1
+                self._schedule(key)
+                self._condition.notify_all()
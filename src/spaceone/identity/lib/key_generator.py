@@ -1,10 +1,14 @@
 import logging
 import time
+from typing import Union
 
+from jwcrypto import jwk
 from spaceone.core.auth.jwt.jwt_util import JWTUtil
 from spaceone.core import utils
 
 from spaceone.identity.error import ERROR_GENERATE_KEY_FAILURE
+from spaceone.identity.lib.claim_codec import COMPACT_CLAIM_MARKER
+from spaceone.identity.lib.key_ring import KeyRing
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,12 +16,12 @@ _LOGGER = logging.getLogger(__name__)
 class KeyGenerator:
     def __init__(
         self,
-        prv_jwk: dict,
+        prv_jwk: Union[dict, jwk.JWK],
         domain_id: str,
         owner_type: str,
         audience: str,
         client_id: str = None,
-        refresh_prv_jwk: dict = None,
+        refresh_prv_jwk: Union[dict, jwk.JWK] = None,
     ):
         self.prv_jwk = prv_jwk
         self.domain_id = domain_id
@@ -40,7 +44,9 @@ class KeyGenerator:
         role_type: str = None,
         workspace_id: str = None,
         permissions: list = None,
+        encoded_permissions: str = None,
         projects: list = None,
+        encoded_projects: str = None,
         injected_params: dict = None,
         endpoints: list = None,
         identity_base_url: str = None,
@@ -70,9 +76,19 @@ class KeyGenerator:
         if permissions and len(permissions) > 0:
             payload["permissions"] = permissions
 
+        if encoded_permissions:
+            # decoded with PermissionMatcher.decode
+            payload["pmc"] = encoded_permissions
+            payload["permissions"] = [COMPACT_CLAIM_MARKER]
+
         if projects and len(projects) > 0:
             payload["projects"] = projects
 
+        if encoded_projects:
+            # decoded with claim_codec.decode_list_claim
+            payload["pjc"] = encoded_projects
+            payload["projects"] = [COMPACT_CLAIM_MARKER]
+
         if injected_params:
             payload["injected_params"] = injected_params
 
@@ -83,9 +99,17 @@ class KeyGenerator:
             payload["identity_base_url"] = identity_base_url
 
         if token_type == "REFRESH_TOKEN":
-            return JWTUtil.encode(payload, self.refresh_prv_jwk)
+            return self._encode(payload, self.refresh_prv_jwk)
+        else:
+            return self._encode(payload, self.prv_jwk)
+
+    @staticmethod
+    def _encode(payload: dict, key: Union[dict, jwk.JWK]) -> str:
+        # parsed keys from KeyRing are used as they are
+        if isinstance(key, jwk.JWK):
+            return KeyRing.encode(payload, key)
         else:
-            return JWTUtil.encode(payload, self.prv_jwk)
+            return JWTUtil.encode(payload, key)
 
     @staticmethod
     def _print_key(payload: dict):
@@ -102,7 +126,9 @@ class KeyGenerator:
             f'iat: {payload.get("iat")}, '
             f'jti: {payload.get("jti")}, '
             f'projects: {payload.get("projects")},'
+            f'pjc: {payload.get("pjc")},'
             f'permissions: {payload.get("permissions")},'
+            f'pmc: {payload.get("pmc")},'
             f'injected_params: {payload.get("injected_params")},'
             f'endpoints: {payload.get("endpoints")},'
             f'identity_base_url: {payload.get("identity_base_url")},'
@@ -0,0 +1,89 @@
+import json
+import logging
+import threading
+from typing import Callable, Union
+
+from cachetools import TTLCache
+from jwcrypto import jwk
+from jwcrypto import jwt as jwcrypto_jwt
+from spaceone.core import config
+
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
+
+_LOGGER = logging.getLogger(__name__)
+
+_KEY_TYPES = ["private", "refresh-private", "public", "refresh-public"]
+
+
+class KeyRing:
+    """Process-local cache of parsed domain JWK objects.
+
+    Keys are loaded once per domain and key type, parsed into jwcrypto JWK
+    objects and kept for a limited time, so signing and verifying tokens
+    does not fetch or parse the key again on every request. Keys of a domain
+    are dropped in every process when its secret changes.
+    """
+
+    _keys: Union[TTLCache, None] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_key(
+        cls, domain_id: str, key_type: str, loader: Callable[[str], dict]
+    ) -> jwk.JWK:
+        keys = cls._get_keys()
+        cache_key = (domain_id, key_type)
+
+        with cls._lock:
+            key = keys.get(cache_key)
+
+        if key is None:
+            key = jwk.JWK(**loader(domain_id))
+            with cls._lock:
+                keys[cache_key] = key
+
+        return key
+
+    @classmethod
+    def invalidate(cls, domain_id: str) -> None:
+        keys = cls._get_keys()
+        with cls._lock:
+            for key_type in _KEY_TYPES:
+                keys.pop((domain_id, key_type), None)
+
+    @classmethod
+    def clear(cls) -> None:
+        if cls._keys is not None:
+            with cls._lock:
+                cls._keys.clear()
+
+    @staticmethod
+    def encode(payload: dict, key: jwk.JWK, algorithm: str = "RS256") -> str:
+        jwt_obj = jwcrypto_jwt.JWT(claims=payload, header={"alg": algorithm})
+        jwt_obj.make_signed_token(key)
+        return jwt_obj.serialize()
+
+    @staticmethod
+    def decode(token: str, key: jwk.JWK, algorithm: str = "RS256") -> dict:
+        jwt_obj = jwcrypto_jwt.JWT(jwt=token, key=key, algs=[algorithm])
+        return json.loads(jwt_obj.claims)
+
+    @classmethod
+    def _get_keys(cls) -> TTLCache:
+        if cls._keys is None:
+            with cls._lock:
+                if cls._keys is None:
+                    identity_conf = config.get_global("IDENTITY") or {}
+                    key_ring_conf = identity_conf.get("key_ring", {})
+                    cls._keys = TTLCache(
+                        maxsize=key_ring_conf.get("max_size", 1024),
+                        ttl=key_ring_conf.get("ttl", 600),
+                    )
+
+                    InvalidationBus.start()
+
+        return cls._keys
+
+
+InvalidationBus.add_local_handler("DOMAIN_SECRET_CHANGED", KeyRing.invalidate)
+InvalidationBus.add_reset_handler(KeyRing.clear)
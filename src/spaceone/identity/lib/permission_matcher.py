@@ -0,0 +1,117 @@
+import threading
+from typing import Callable, List, Tuple, Union
+
+from cachetools import TTLCache
+from spaceone.core import config
+
+from spaceone.identity.lib.claim_codec import decode_list_claim, encode_list_claim
+
+_END = None
+
+
+class PermissionMatcher:
+    """Prefix trie compiled from role permissions.
+
+    A permission matches when it starts with one of the role permissions,
+    the same rule the authorization handler applies to the permission list
+    of a token, so every role permission is a wildcard of its prefix.
+    match() costs O(len(permission)) regardless of how many permissions the
+    role has.
+    """
+
+    _matchers: Union[TTLCache, None] = None
+    _lock = threading.Lock()
+
+    def __init__(self, permissions: List[str]):
+        self._root = {}
+
+        for permission in permissions or []:
+            self._add(permission)
+
+    @property
+    def permissions(self) -> List[str]:
+        """Returns the minimal permission list.
+
+        Permissions covered by a shorter permission are left out, which does
+        not change what the list matches.
+        """
+
+        permissions = []
+        stack = [("", self._root)]
+        while stack:
+            prefix, node = stack.pop()
+            if _END in node:
+                permissions.append(prefix)
+                continue
+
+            for char, child in node.items():
+                stack.append((prefix + char, child))
+
+        return sorted(permissions)
+
+    def match(self, permission: str) -> bool:
+        node = self._root
+        if _END in node:
+            return True
+
+        for char in permission:
+            node = node.get(char)
+            if node is None:
+                return False
+
+            if _END in node:
+                return True
+
+        return False
+
+    def encode(self) -> str:
+        return encode_list_claim(self.permissions)
+
+    @classmethod
+    def decode(cls, encoded_permissions: str) -> "PermissionMatcher":
+        return cls(decode_list_claim(encoded_permissions))
+
+    @classmethod
+    def get_matcher(
+        cls, key: Tuple, loader: Callable[[], List[str]]
+    ) -> "PermissionMatcher":
+        """Returns the matcher compiled for the key, e.g. a role and its version."""
+
+        matchers = cls._get_matchers()
+
+        with cls._lock:
+            matcher = matchers.get(key)
+
+        if matcher is None:
+            matcher = cls(loader())
+            with cls._lock:
+                matchers[key] = matcher
+
+        return matcher
+
+    def _add(self, permission: str) -> None:
+        node = self._root
+        for char in permission:
+            if _END in node:
+                # already covered by a shorter permission
+                return
+
+            node = node.setdefault(char, {})
+
+        # a shorter permission covers every longer one under it
+        node.clear()
+        node[_END] = True
+
+    @classmethod
+    def _get_matchers(cls) -> TTLCache:
+        if cls._matchers is None:
+            with cls._lock:
+                if cls._matchers is None:
+                    identity_conf = config.get_global("IDENTITY") or {}
+                    matcher_conf = identity_conf.get("permission_matcher", {})
+                    cls._matchers = TTLCache(
+                        maxsize=matcher_conf.get("max_size", 1024),
+                        ttl=matcher_conf.get("ttl", 3600),
+                    )
+
+        return cls._matchers
@@ -0,0 +1,123 @@
+import threading
+from typing import Callable, Hashable, Tuple, Union
+
+from cachetools import LRUCache, TTLCache
+from jsonschema import exceptions, validators
+from jsonschema.protocols import Validator
+from spaceone.core import config
+
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
+from spaceone.identity.model.schema.database import Schema
+
+
+class SchemaValidator:
+    """Process-local cache of compiled JSON schema validators.
+
+    Schemas are looked up by the conditions of the caller (e.g. provider
+    and schema type) and their validators are compiled once per
+    (domain_id, schema_id, version), so a repeated validation neither reads
+    the database nor compiles the schema. Schema changes are published on
+    the InvalidationBus, which drops the entries of the schema and the
+    lookups of its provider in every process. The local TTL bounds staleness if an invalidation message is
+    missed.
+    """
+
+    _lookups: Union[TTLCache, None] = None
+    _validators: Union[LRUCache, None] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_validator(
+        cls, lookup_key: Hashable, loader: Callable[[], Union[Schema, None]]
+    ) -> Union[Validator, None]:
+        lookups, validators_cache = cls._get_caches()
+
+        with cls._lock:
+            validator_key = lookups.get(lookup_key)
+            validator = validators_cache.get(validator_key)
+
+        if validator is not None:
+            return validator
+
+        schema_vo = loader()
+
+        # undefined schemas are not cached, since they can be created anytime
+        if schema_vo is None:
+            return None
+
+        validator_key = (schema_vo.domain_id, schema_vo.schema_id, schema_vo.version)
+
+        with cls._lock:
+            validator = validators_cache.get(validator_key)
+
+        if validator is None:
+            validator = cls._compile(schema_vo.schema)
+
+        with cls._lock:
+            validators_cache[validator_key] = validator
+            lookups[lookup_key] = validator_key
+
+        return validator
+
+    @staticmethod
+    def validate(validator: Validator, data: dict) -> Union[str, None]:
+        """Returns the message of the most relevant error, as jsonschema.validate."""
+
+        if error := exceptions.best_match(validator.iter_errors(data)):
+            return error.message
+        else:
+            return None
+
+    @staticmethod
+    def _compile(schema: dict) -> Validator:
+        validator_cls = validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        return validator_cls(schema)
+
+    @classmethod
+    def _on_schema_changed(
+        cls, domain_id: str, schema_id: str, provider: str, schema_type: str
+    ) -> None:
+        if cls._lookups is None:
+            return
+
+        with cls._lock:
+            # a new schema of the provider may be found instead of a cached one
+            cls._lookups.pop((domain_id, "provider", provider, schema_type), None)
+
+            # the version of a schema is not always changed with its contents
+            for key in list(cls._validators.keys()):
+                if key[:2] == (domain_id, schema_id):
+                    cls._validators.pop(key, None)
+
+            for lookup_key, validator_key in list(cls._lookups.items()):
+                if validator_key[:2] == (domain_id, schema_id):
+                    cls._lookups.pop(lookup_key, None)
+
+    @classmethod
+    def _clear_caches(cls) -> None:
+        if cls._lookups is not None:
+            with cls._lock:
+                cls._lookups.clear()
+                cls._validators.clear()
+
+    @classmethod
+    def _get_caches(cls) -> Tuple[TTLCache, LRUCache]:
+        if cls._lookups is None:
+            with cls._lock:
+                if cls._lookups is None:
+                    identity_conf = config.get_global("IDENTITY") or {}
+                    validator_conf = identity_conf.get("schema_validator", {})
+                    max_size = validator_conf.get("local_max_size", 1000)
+                    cls._validators = LRUCache(maxsize=max_size)
+                    cls._lookups = TTLCache(
+                        maxsize=max_size, ttl=validator_conf.get("local_ttl", 300)
+                    )
+
+                    InvalidationBus.start()
+
+        return cls._lookups, cls._validators
+
+
+InvalidationBus.add_local_handler("SCHEMA_CHANGED", SchemaValidator._on_schema_changed)
+InvalidationBus.add_reset_handler(SchemaValidator._clear_caches)
@@ -0,0 +1,247 @@
+import functools
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, List, Union
+
+from spaceone.core import config
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_BUCKETS = [
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+]
+
+
+class StageExporter(ABC):
+    def __init__(self, options: dict):
+        self.options = options
+
+    @abstractmethod
+    def export(self, operation: str, status: str, duration: float, stages: dict):
+        pass
+
+
+class LogStageExporter(StageExporter):
+    """Writes one structured log line per measured operation."""
+
+    def __init__(self, options: dict):
+        super().__init__(options)
+        self.min_duration = options.get("min_duration_ms", 0) / 1000
+
+    def export(self, operation: str, status: str, duration: float, stages: dict):
+        if duration < self.min_duration:
+            return
+
+        timing = {
+            "operation": operation,
+            "status": status,
+            "duration_ms": round(duration * 1000, 3),
+            "stages_ms": {
+                stage: round(elapsed * 1000, 3) for stage, elapsed in stages.items()
+            },
+        }
+        _LOGGER.info(f"[StageTimer] {json.dumps(timing)}")
+
+
+class PrometheusStageExporter(StageExporter):
+    """Observes stage durations in a Prometheus histogram.
+
+    The histogram is served by the prometheus_client HTTP server when a
+    port is configured, otherwise by whatever exposes the default registry.
+    """
+
+    _histogram = None
+    _lock = threading.Lock()
+
+    def __init__(self, options: dict):
+        super().__init__(options)
+
+        if prometheus_client is None:
+            raise ImportError("prometheus_client is not installed")
+
+        with self._lock:
+            if PrometheusStageExporter._histogram is None:
+                PrometheusStageExporter._histogram = prometheus_client.Histogram(
+                    "identity_token_stage_duration_seconds",
+                    "Duration of token issuance stages",
+                    ["operation", "stage", "status"],
+                    buckets=options.get("buckets", _DEFAULT_BUCKETS),
+                )
+
+                if port := options.get("port"):
+                    prometheus_client.start_http_server(port)
+
+    def export(self, operation: str, status: str, duration: float, stages: dict):
+        self._histogram.labels(operation, "total", status).observe(duration)
+        for stage, elapsed in stages.items():
+            self._histogram.labels(operation, stage, status).observe(elapsed)
+
+
+_EXPORTERS = {
+    "log": LogStageExporter,
+    "prometheus": PrometheusStageExporter,
+}
+
+
+class _NullContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+class _Operation:
+    __slots__ = ("name", "stages", "_exporters", "_start")
+
+    def __init__(self, name: str, exporters: List[StageExporter]):
+        self.name = name
+        self.stages = {}
+        self._exporters = exporters
+        self._start = None
+
+    def __enter__(self):
+        StageTimer._local.operation = self
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self._start
+        StageTimer._local.operation = None
+
+        status = "SUCCESS" if exc_type is None else "FAILURE"
+        for exporter in self._exporters:
+            try:
+                exporter.export(self.name, status, duration, self.stages)
+            except Exception as e:
+                _LOGGER.error(f"[StageTimer] failed to export timings: {e}")
+
+        return False
+
+
+class _Stage:
+    __slots__ = ("_operation", "_name", "_start")
+
+    def __init__(self, operation: _Operation, name: str):
+        self._operation = operation
+        self._name = name
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed = time.perf_counter() - self._start
+        stages = self._operation.stages
+        stages[self._name] = stages.get(self._name, 0) + elapsed
+        return False
+
+
+class StageTimer:
+    """Per-stage timers of request handling.
+
+    An operation (e.g. "grant") is measured with the measure decorator or
+    the operation context manager, and code running in the same thread
+    times its parts with stage("jwt_sign"). When the operation ends, its
+    total and stage durations are passed to the configured exporters
+    (IDENTITY.stage_timer). Without an active operation, or when the timer
+    is disabled, stage() returns a shared no-op context manager.
+    """
+
+    _local = threading.local()
+    _exporters: Union[List[StageExporter], None] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def operation(cls, name: str):
+        exporters = cls._get_exporters()
+
+        # nested operations are timed as a part of the outer one
+        if not exporters or getattr(cls._local, "operation", None) is not None:
+            return _NULL_CONTEXT
+
+        return _Operation(name, exporters)
+
+    @classmethod
+    def measure(cls, name: str) -> Callable:
+        def wrapper(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapped_func(*args, **kwargs):
+                with cls.operation(name):
+                    return func(*args, **kwargs)
+
+            return wrapped_func
+
+        return wrapper
+
+    @classmethod
+    def stage(cls, name: str):
+        operation = getattr(cls._local, "operation", None)
+        if operation is None:
+            return _NULL_CONTEXT
+
+        return _Stage(operation, name)
+
+    @classmethod
+    def add_exporter(cls, exporter: StageExporter) -> None:
+        """Adds an exporter to the configured ones, e.g. to collect timings."""
+
+        exporters = cls._get_exporters()
+        with cls._lock:
+            cls._exporters = exporters + [exporter]
+
+    @classmethod
+    def _get_exporters(cls) -> List[StageExporter]:
+        if cls._exporters is None:
+            with cls._lock:
+                if cls._exporters is None:
+                    cls._exporters = cls._load_exporters()
+
+        return cls._exporters
+
+    @staticmethod
+    def _load_exporters() -> List[StageExporter]:
+        identity_conf = config.get_global("IDENTITY") or {}
+        timer_conf = identity_conf.get("stage_timer", {})
+
+        if not timer_conf.get("enabled", False):
+            return []
+
+        exporters = []
+        for exporter_name, options in timer_conf.get("exporters", {}).items():
+            exporter_cls = _EXPORTERS.get(exporter_name)
+            if exporter_cls is None:
+                _LOGGER.error(f"[StageTimer] unknown exporter: {exporter_name}")
+                continue
+
+            try:
+                exporters.append(exporter_cls(options or {}))
+            except Exception as e:
+                _LOGGER.error(f"[StageTimer] failed to init {exporter_name}: {e}")
+
+        return exporters
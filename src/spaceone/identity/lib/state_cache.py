@@ -0,0 +1,101 @@
+import threading
+from typing import Callable, Union
+
+from cachetools import TTLCache
+from spaceone.core import cache, config
+
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
+
+
+class StateCache:
+    """Two-tier cache of resource states (e.g. the state of a workspace).
+
+    States are looked up in a process-local cache first, then in the shared
+    cache (Redis) and finally loaded from the database. State changes are
+    published on the InvalidationBus, which drops the shared entry and the
+    local copies of every process. The local TTL bounds staleness if an
+    invalidation message is missed.
+    """
+
+    _local_cache: Union[TTLCache, None] = None
+    _expire: int = 3600
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_state(cls, key: str, loader: Callable[[], str]) -> str:
+        local_cache = cls._get_local_cache()
+
+        with cls._lock:
+            state = local_cache.get(key)
+
+        if state is not None:
+            return state
+
+        if cache.is_set():
+            state = cache.get(key)
+
+        # values of other types were written by older versions
+        if not isinstance(state, str):
+            state = loader()
+
+            if cache.is_set():
+                cache.set(key, state, expire=cls._expire)
+
+        with cls._lock:
+            local_cache[key] = state
+
+        return state
+
+    @staticmethod
+    def get_domain_state_key(domain_id: str) -> str:
+        return f"identity:resource-state:domain:{domain_id}"
+
+    @staticmethod
+    def get_workspace_state_key(domain_id: str, workspace_id: str) -> str:
+        return f"identity:resource-state:workspace:{domain_id}:{workspace_id}"
+
+    @classmethod
+    def _on_domain_state_changed(cls, domain_id: str) -> None:
+        cls._delete_local_key(cls.get_domain_state_key(domain_id))
+
+    @classmethod
+    def _on_workspace_state_changed(cls, domain_id: str, workspace_id: str) -> None:
+        cls._delete_local_key(cls.get_workspace_state_key(domain_id, workspace_id))
+
+    @classmethod
+    def _delete_local_key(cls, key: str) -> None:
+        if cls._local_cache is not None:
+            with cls._lock:
+                cls._local_cache.pop(key, None)
+
+    @classmethod
+    def _clear_local_cache(cls) -> None:
+        if cls._local_cache is not None:
+            with cls._lock:
+                cls._local_cache.clear()
+
+    @classmethod
+    def _get_local_cache(cls) -> TTLCache:
+        if cls._local_cache is None:
+            with cls._lock:
+                if cls._local_cache is None:
+                    identity_conf = config.get_global("IDENTITY") or {}
+                    state_cache_conf = identity_conf.get("state_cache", {})
+                    cls._expire = state_cache_conf.get("expire", 3600)
+                    cls._local_cache = TTLCache(
+                        maxsize=state_cache_conf.get("local_max_size", 10000),
+                        ttl=state_cache_conf.get("local_ttl", 30),
+                    )
+
+                    InvalidationBus.start()
+
+        return cls._local_cache
+
+
+InvalidationBus.add_local_handler(
+    "DOMAIN_STATE_CHANGED", StateCache._on_domain_state_changed
+)
+InvalidationBus.add_local_handler(
+    "WORKSPACE_STATE_CHANGED", StateCache._on_workspace_state_changed
+)
+InvalidationBus.add_reset_handler(StateCache._clear_local_cache)
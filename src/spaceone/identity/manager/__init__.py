@@ -1,2 +1,3 @@
 from spaceone.identity.manager.plugin_manager import PluginManager
+from spaceone.identity.manager.project_group_manager import ProjectGroupManager
 from spaceone.identity.manager.secret_manager import SecretManager
@@ -1,5 +1,5 @@
 import logging
-from typing import Tuple
+from typing import Generator, List, Tuple
 
 from spaceone.core.manager import BaseManager
 
@@ -55,6 +55,43 @@ class AccountCollectorPluginManager(BaseManager):
 
         return plugin_connector.dispatch("AccountCollector.sync", params)
 
+    def sync_stream(
+        self,
+        endpoint: str,
+        options: dict,
+        secret_data: dict,
+        domain_id: str,
+        schema_id: str = None,
+    ) -> Generator[List[dict], None, None]:
+        plugin_connector: SpaceConnector = self.locator.get_connector(
+            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
+        )
+
+        params = {
+            "options": options,
+            "secret_data": secret_data,
+            "domain_id": domain_id,
+        }
+        if schema_id:
+            params["schema_id"] = schema_id
+
+        supported_verbs = plugin_connector.client.api_resources.get(
+            "AccountCollector", []
+        )
+
+        if "sync_stream" in supported_verbs:
+            response_iterator = plugin_connector.dispatch(
+                "AccountCollector.sync_stream", params
+            )
+            for response in response_iterator:
+                yield response.get("results", [])
+        else:
+            _LOGGER.debug(
+                f"[sync_stream] sync_stream is not supported by plugin, use sync instead: {endpoint}"
+            )
+            response = plugin_connector.dispatch("AccountCollector.sync", params)
+            yield response.get("results", [])
+
     def get_account_collector_plugin_endpoint_by_vo(self, provider_vo: Provider) -> str:
         plugin_info = provider_vo.plugin_info
         endpoint, updated_version = self.get_account_collector_plugin_endpoint(
@@ -72,10 +109,10 @@ class AccountCollectorPluginManager(BaseManager):
         return endpoint
 
     def get_account_collector_plugin_endpoint(
-        self, plugin_info: dict, domain_id: str
+        self, plugin_info: dict, domain_id: str, refresh: bool = False
     ) -> Tuple[str, str]:
         plugin_mgr: PluginManager = self.locator.get_manager("PluginManager")
-        return plugin_mgr.get_plugin_endpoint(plugin_info, domain_id)
+        return plugin_mgr.get_plugin_endpoint(plugin_info, domain_id, refresh)
 
     def upgrade_account_collector_plugin_version(
         self, provider_vo: Provider, endpoint: str, updated_version: str
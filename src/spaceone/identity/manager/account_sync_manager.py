@@ -0,0 +1,560 @@
+import logging
+import random
+from datetime import datetime
+from typing import List
+
+from bson import ObjectId
+from pymongo import InsertOne, UpdateOne
+from spaceone.core import utils
+from spaceone.core.error import *
+from spaceone.core.manager import BaseManager
+
+from spaceone.identity.conf.global_conf import WORKSPACE_COLORS_NAME
+from spaceone.identity.manager.project_group_manager import ProjectGroupManager
+from spaceone.identity.manager.schema_manager import SchemaManager
+from spaceone.identity.manager.secret_manager import SecretManager
+from spaceone.identity.manager.user_project_manager import UserProjectManager
+from spaceone.identity.manager.workspace_manager import WorkspaceManager
+from spaceone.identity.model.project.database import Project
+from spaceone.identity.model.project_group.database import ProjectGroup
+from spaceone.identity.model.service_account.database import ServiceAccount
+from spaceone.identity.model.workspace.database import Workspace
+
+_LOGGER = logging.getLogger(__name__)
+
+_PROJECT_TREE_FIELDS = ["parent_group_id", "project_group_id", "project_type"]
+
+# unique keys checked by the create() of models instead of unique_with
+_MODEL_UNIQUE_KEYS = {Workspace: [["name", "domain_id"]]}
+
+
+class AccountSyncManager(BaseManager):
+    """Applies AccountCollector results as a diff against the managed resources.
+
+    Managed workspaces, project groups, projects and service accounts of the
+    domain are loaded once, changes are computed in memory and written back
+    with one unordered bulk_write per collection on flush(), after every
+    page of results. Inserted rows are checked against the unique keys of
+    their model and deleted again if the transaction is rolled back.
+    """
+
+    def __init__(
+        self,
+        trusted_account_id: str,
+        trusted_secret_id: str,
+        provider: str,
+        resource_group: str,
+        domain_id: str,
+        workspace_id: str = None,
+        sync_options: dict = None,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.trusted_account_id = trusted_account_id
+        self.trusted_secret_id = trusted_secret_id
+        self.provider = provider
+        self.resource_group = resource_group
+        self.domain_id = domain_id
+        self.workspace_id = workspace_id
+        self.sync_options = sync_options or {}
+
+        self.workspace_by_name = {}
+        self.workspace_by_id = {}
+        self.project_group_by_ref = {}
+        self.project_by_ref = {}
+        self.service_account_by_ref = {}
+
+        self.pending_inserts = {}
+        self.pending_updates = {}
+        self.pending_insert_ids = set()
+        self.pending_secrets = []
+        self.changed_workspace_ids = set()
+        self.moved_project_groups = []
+
+        self._load()
+
+    def sync(self, results: List[dict]) -> int:
+        synced_count = 0
+        for result in results:
+            if self._sync_result(result):
+                synced_count += 1
+
+        self.flush()
+        return synced_count
+
+    def flush(self) -> None:
+        pending_inserts, self.pending_inserts = self.pending_inserts, {}
+        pending_updates, self.pending_updates = self.pending_updates, {}
+        self.pending_insert_ids = set()
+
+        for model in [Workspace, ProjectGroup, Project, ServiceAccount]:
+            self._bulk_write(
+                model, pending_inserts.get(model, []), pending_updates.get(model, {})
+            )
+
+        if self.pending_secrets:
+            pending_secrets, self.pending_secrets = self.pending_secrets, []
+            for service_account_row, secret_data, secret_schema_id in pending_secrets:
+                self._sync_secret(service_account_row, secret_data, secret_schema_id)
+
+            self._bulk_write(
+                ServiceAccount, [], self.pending_updates.pop(ServiceAccount, {})
+            )
+
+        if self.moved_project_groups:
+            project_group_mgr = ProjectGroupManager()
+            for project_group_row in self.moved_project_groups:
+                project_group_mgr.update_descendant_paths(
+                    self.domain_id,
+                    project_group_row["project_group_id"],
+                    project_group_row["path"],
+                )
+
+            self.moved_project_groups = []
+
+        if self.changed_workspace_ids:
+            user_project_mgr = UserProjectManager()
+            for workspace_id in self.changed_workspace_ids:
+                user_project_mgr.delete_workspace_user_projects(
+                    self.domain_id, workspace_id
+                )
+
+            self.changed_workspace_ids = set()
+
+    def _load(self) -> None:
+        if self.resource_group == "DOMAIN":
+            single_workspace_id = self.sync_options.get("single_workspace_id")
+            if single_workspace_id:
+                WorkspaceManager().get_workspace(single_workspace_id, self.domain_id)
+
+            for row in Workspace.filter(domain_id=self.domain_id).as_pymongo():
+                self.workspace_by_id[row["workspace_id"]] = row
+                self.workspace_by_name.setdefault(row.get("name"), row)
+
+            scope = {"domain_id": self.domain_id}
+        else:
+            scope = {"domain_id": self.domain_id, "workspace_id": self.workspace_id}
+
+        ProjectGroupManager().ensure_project_group_path(self.domain_id)
+
+        for row in ProjectGroup.filter(is_managed=True, **scope).as_pymongo():
+            key = (row.get("workspace_id"), row.get("reference_id"))
+            self.project_group_by_ref.setdefault(key, row)
+
+        for row in Project.filter(
+            is_managed=True, project_type="PRIVATE", **scope
+        ).as_pymongo():
+            key = (row.get("workspace_id"), row.get("reference_id"))
+            self.project_by_ref.setdefault(key, row)
+
+        for row in ServiceAccount.filter(
+            is_managed=True, provider=self.provider, **scope
+        ).as_pymongo():
+            key = (
+                row.get("workspace_id"),
+                row.get("project_id"),
+                row.get("reference_id"),
+            )
+            self.service_account_by_ref.setdefault(key, row)
+
+        _LOGGER.debug(
+            f"[_load] loaded managed resources ({self.domain_id}): "
+            f"workspaces={len(self.workspace_by_id)}, "
+            f"project_groups={len(self.project_group_by_ref)}, "
+            f"projects={len(self.project_by_ref)}, "
+            f"service_accounts={len(self.service_account_by_ref)}"
+        )
+
+    def _sync_result(self, result: dict) -> bool:
+        location: List[dict] = self._get_location(result)
+
+        if self.resource_group == "DOMAIN":
+            if self.sync_options.get("single_workspace_id"):
+                sync_workspace_id = self.sync_options["single_workspace_id"]
+            elif location:
+                location_info = location.pop(0)
+                workspace_row = self._sync_workspace(location_info)
+                sync_workspace_id = workspace_row["workspace_id"]
+            else:
+                _LOGGER.debug(f"[_sync_result] location is empty => SKIP")
+                return False
+        else:
+            sync_workspace_id = self.workspace_id
+
+        parent_group_row = None
+        for location_info in location:
+            parent_group_row = self._sync_project_group(
+                sync_workspace_id, location_info, parent_group_row
+            )
+
+        parent_group_id = None
+        if parent_group_row:
+            parent_group_id = parent_group_row["project_group_id"]
+
+        project_row = self._sync_project(result, sync_workspace_id, parent_group_id)
+        self._sync_service_account(result, project_row)
+        return True
+
+    def _sync_workspace(self, location_info: dict) -> dict:
+        name = location_info.get("name")
+        reference_id = location_info.get("resource_id")
+        workspace_row = self.workspace_by_name.get(name)
+
+        params = {"trusted_account_id": self.trusted_account_id, "is_managed": True}
+        if workspace_row:
+            references = workspace_row.get("references")
+            if not references:
+                params["references"] = [reference_id]
+            elif reference_id not in references:
+                params["references"] = references + [reference_id]
+
+            params["last_synced_at"] = datetime.utcnow()
+            self._update(Workspace, workspace_row, params)
+            self._remove_old_reference_id_from_workspace(
+                workspace_row["workspace_id"], reference_id
+            )
+        else:
+            params.update(
+                {
+                    "name": name,
+                    "tags": self._set_workspace_theme(),
+                    "domain_id": self.domain_id,
+                    "last_synced_at": datetime.utcnow(),
+                    "references": [reference_id],
+                    "dormant_ttl": -1,
+                    "service_account_count": 0,
+                    "user_count": 0,
+                    "cost_info": {"day": 0, "month": 0},
+                }
+            )
+            workspace_row = self._insert(Workspace, params)
+            self.workspace_by_id[workspace_row["workspace_id"]] = workspace_row
+            self.workspace_by_name[name] = workspace_row
+
+        return workspace_row
+
+    def _sync_project_group(
+        self, workspace_id: str, location_info: dict, parent_group_row: dict = None
+    ) -> dict:
+        name = location_info["name"]
+        reference_id = location_info["resource_id"]
+        key = (workspace_id, reference_id)
+        project_group_row = self.project_group_by_ref.get(key)
+
+        params = {"trusted_account_id": self.trusted_account_id}
+        if parent_group_row:
+            parent_group_id = parent_group_row["project_group_id"]
+            params["parent_group_id"] = parent_group_id
+            params["path"] = (parent_group_row.get("path") or []) + [parent_group_id]
+
+        if project_group_row:
+            if project_group_row.get("name") != name:
+                params["name"] = name
+
+            params["last_synced_at"] = datetime.utcnow()
+            if "path" in params and params["path"] != project_group_row.get("path"):
+                self.moved_project_groups.append(project_group_row)
+
+            self._update(ProjectGroup, project_group_row, params)
+        else:
+            params.setdefault("path", [])
+            params.update(
+                {
+                    "name": name,
+                    "reference_id": reference_id,
+                    "is_managed": True,
+                    "domain_id": self.domain_id,
+                    "workspace_id": workspace_id,
+                    "last_synced_at": datetime.utcnow(),
+                }
+            )
+            project_group_row = self._insert(ProjectGroup, params)
+            self.project_group_by_ref[key] = project_group_row
+
+        return project_group_row
+
+    def _sync_project(
+        self, result: dict, workspace_id: str, project_group_id: str = None
+    ) -> dict:
+        name = result["name"]
+        reference_id = result["resource_id"]
+        key = (workspace_id, reference_id)
+        project_row = self.project_by_ref.get(key)
+
+        params = {"project_type": "PRIVATE", "is_managed": True}
+        if project_group_id:
+            params["project_group_id"] = project_group_id
+
+        if project_row:
+            if project_row.get("name") != name:
+                params["name"] = name
+
+            params.update(
+                {
+                    "trusted_account_id": self.trusted_account_id,
+                    "last_synced_at": datetime.utcnow(),
+                }
+            )
+            self._update(Project, project_row, params)
+        else:
+            params.update(
+                {
+                    "name": name,
+                    "reference_id": reference_id,
+                    "domain_id": self.domain_id,
+                    "workspace_id": workspace_id,
+                    "last_synced_at": datetime.utcnow(),
+                }
+            )
+            project_row = self._insert(Project, params)
+            self.project_by_ref[key] = project_row
+
+        return project_row
+
+    def _sync_service_account(self, result: dict, project_row: dict) -> dict:
+        workspace_id = project_row["workspace_id"]
+        project_id = project_row["project_id"]
+        name = result["name"]
+        reference_id = result["resource_id"]
+        secret_data = result.get("secret_data", {})
+        secret_schema_id = result.get("secret_schema_id")
+        key = (workspace_id, project_id, reference_id)
+        service_account_row = self.service_account_by_ref.get(key)
+
+        if service_account_row:
+            # name is not synced for existing service accounts
+            self._update(
+                ServiceAccount,
+                service_account_row,
+                {
+                    "trusted_account_id": self.trusted_account_id,
+                    "last_synced_at": datetime.utcnow(),
+                },
+            )
+        else:
+            params = {
+                "provider": self.provider,
+                "reference_id": reference_id,
+                "is_managed": True,
+                "domain_id": self.domain_id,
+                "workspace_id": workspace_id,
+                "project_id": project_id,
+                "name": name,
+                "data": result.get("data", {}),
+                "trusted_account_id": self.trusted_account_id,
+                "tags": result.get("tags", {}),
+                "last_synced_at": datetime.utcnow(),
+                "state": "ACTIVE",
+                "cost_info": {"day": 0, "month": 0},
+            }
+            service_account_row = self._insert(ServiceAccount, params)
+            self.service_account_by_ref[key] = service_account_row
+
+        if secret_data:
+            self.pending_secrets.append(
+                (service_account_row, secret_data, secret_schema_id)
+            )
+
+        return service_account_row
+
+    def _sync_secret(
+        self, service_account_row: dict, secret_data: dict, secret_schema_id: str
+    ) -> None:
+        secret_mgr: SecretManager = self.locator.get_manager("SecretManager")
+        workspace_id = service_account_row["workspace_id"]
+        secret_id = service_account_row.get("secret_id")
+        secret_total_count = 0
+
+        if secret_id:
+            response = secret_mgr.list_secrets({"secret_id": secret_id}, self.domain_id)
+            secret_total_count = response.get("total_count", 0)
+
+        if secret_total_count > 0:
+            update_secret_params = {
+                "secret_id": secret_id,
+                "data": secret_data,
+                "schema_id": secret_schema_id,
+            }
+            secret_mgr.update_secret_data(
+                update_secret_params, self.domain_id, workspace_id
+            )
+        else:
+            # Check secret_data by schema
+            schema_mgr = SchemaManager()
+            schema_mgr.validate_secret_data_by_schema_id(
+                secret_schema_id, self.domain_id, secret_data, "TRUSTING_SECRET"
+            )
+
+            service_account_id = service_account_row["service_account_id"]
+            create_secret_params = {
+                "name": f"{service_account_id}-secret",
+                "data": secret_data,
+                "resource_group": "PROJECT",
+                "workspace_id": workspace_id,
+                "project_id": service_account_row["project_id"],
+                "service_account_id": service_account_id,
+                "trusted_secret_id": self.trusted_secret_id,
+                "schema_id": secret_schema_id,
+            }
+            secret_info = secret_mgr.create_secret(create_secret_params, self.domain_id)
+            self._update(
+                ServiceAccount,
+                service_account_row,
+                {"secret_id": secret_info["secret_id"]},
+            )
+
+    def _remove_old_reference_id_from_workspace(
+        self, workspace_id: str, reference_id: str
+    ) -> None:
+        for workspace_row in self.workspace_by_id.values():
+            if workspace_row["workspace_id"] == workspace_id:
+                continue
+
+            references = workspace_row.get("references") or []
+            if reference_id in references:
+                references = [ref for ref in references if ref != reference_id]
+                self._update(Workspace, workspace_row, {"references": references})
+
+    def _insert(self, model, params: dict) -> dict:
+        create_data = {}
+        for name, field in model._fields.items():
+            if name in params:
+                create_data[name] = model._trim_value(params[name])
+            else:
+                generate_id = getattr(field, "generate_id", None)
+                if generate_id:
+                    create_data[name] = utils.generate_id(generate_id)
+
+                if getattr(field, "auto_now", False) or getattr(
+                    field, "auto_now_add", False
+                ):
+                    create_data[name] = datetime.utcnow()
+
+        vo = model(**create_data)
+        try:
+            vo.validate()
+        except Exception as e:
+            raise ERROR_DB_QUERY(reason=e)
+
+        row = vo.to_mongo().to_dict()
+        row["_id"] = ObjectId()
+        self.pending_inserts.setdefault(model, []).append(row)
+        self.pending_insert_ids.add(row["_id"])
+        self._check_project_tree_changed(model, row, row)
+        return row
+
+    def _update(self, model, row: dict, params: dict) -> None:
+        updatable_fields = model._meta.get("updatable_fields", [])
+        update_data = {
+            key: model._trim_value(value)
+            for key, value in params.items()
+            if key in updatable_fields and row.get(key) != value
+        }
+
+        if not update_data:
+            return
+
+        row.update(update_data)
+        self._check_project_tree_changed(model, row, update_data)
+
+        # rows waiting to be inserted already carry the changes
+        if row["_id"] not in self.pending_insert_ids:
+            model_updates = self.pending_updates.setdefault(model, {})
+            model_updates.setdefault(row["_id"], {}).update(update_data)
+
+    def _check_project_tree_changed(self, model, row: dict, data: dict) -> None:
+        if model in [ProjectGroup, Project]:
+            if any(field in data for field in _PROJECT_TREE_FIELDS):
+                self.changed_workspace_ids.add(row["workspace_id"])
+
+    def _bulk_write(self, model, inserts: List[dict], updates: dict) -> None:
+        def _rollback(inserted_ids: List[ObjectId]):
+            _LOGGER.info(
+                f"[_bulk_write._rollback] Delete {model.__name__}: "
+                f"{len(inserted_ids)} rows"
+            )
+            model._get_collection().delete_many({"_id": {"$in": inserted_ids}})
+
+        self._check_unique_values(model, inserts)
+
+        if inserts:
+            # rows of a partially failed bulk write are deleted as well
+            self.transaction.add_rollback(_rollback, [row["_id"] for row in inserts])
+
+        requests = [InsertOne(row) for row in inserts]
+        requests += [
+            UpdateOne({"_id": _id}, {"$set": update_data})
+            for _id, update_data in updates.items()
+        ]
+
+        if requests:
+            try:
+                model._get_collection().bulk_write(requests, ordered=False)
+            except Exception as e:
+                raise ERROR_DB_QUERY(reason=e)
+
+            _LOGGER.debug(
+                f"[_bulk_write] {model.__name__}: "
+                f"inserted={len(inserts)}, updated={len(updates)}"
+            )
+
+    def _check_unique_values(self, model, inserts: List[dict]) -> None:
+        """Checks the unique keys which model.create() would check.
+
+        Generated ids are unique by themselves. Unique fields are never
+        updated by the sync, so only inserted rows are checked.
+        """
+
+        if not inserts:
+            return
+
+        unique_keys_list = list(_MODEL_UNIQUE_KEYS.get(model, []))
+        for unique_keys in model._get_unique_fields():
+            if not getattr(model._fields[unique_keys[0]], "generate_id", None):
+                unique_keys_list.append(unique_keys)
+
+        for unique_keys in unique_keys_list:
+            new_values = set()
+            for row in inserts:
+                key = tuple(row.get(k) for k in unique_keys)
+                if key in new_values:
+                    raise ERROR_SAVE_UNIQUE_VALUES(keys=unique_keys)
+                new_values.add(key)
+
+            existing_vos = model.filter(
+                domain_id=self.domain_id,
+                **{unique_keys[0]: list({key[0] for key in new_values})},
+            ).only(*unique_keys)
+            for vo in existing_vos:
+                if tuple(getattr(vo, k) for k in unique_keys) in new_values:
+                    raise ERROR_SAVE_UNIQUE_VALUES(keys=unique_keys)
+
+    def _get_location(self, result: dict) -> list:
+        location = list(result.get("location", []))
+        skip_project_group_option = self.sync_options.get("skip_project_group")
+
+        if skip_project_group_option:
+            if self.resource_group == "DOMAIN":
+                if location:
+                    location = [location[0]]
+            else:
+                location = []
+
+        else:
+            if self.resource_group == "DOMAIN" and not location:
+                _LOGGER.debug(
+                    f"[_get_location] location is empty: {result} {self.sync_options} => SKIP"
+                )
+
+        return location
+
+    @staticmethod
+    def _set_workspace_theme(tags: dict = None) -> dict:
+        theme = random.choice(WORKSPACE_COLORS_NAME)
+        if tags:
+            tags.update({"theme": theme})
+        else:
+            tags = {"theme": theme}
+
+        return tags
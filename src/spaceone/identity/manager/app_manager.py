@@ -4,6 +4,8 @@ from typing import Tuple, Union
 from mongoengine import QuerySet
 from spaceone.core.manager import BaseManager
 
+from spaceone.identity.lib.access_time_buffer import AccessTimeBuffer
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
 from spaceone.identity.model.app.database import App
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,10 +32,18 @@ class AppManager(BaseManager):
                 f'[update_app._rollback] Revert Data: {old_data["name"]} ({old_data["app_id"]})'
             )
             app_vo.update(old_data)
+            InvalidationBus.app_changed(
+                app_vo.domain_id, old_data["client_id"], app_vo.client_id
+            )
 
         self.transaction.add_rollback(_rollback, app_vo.to_dict())
 
-        return app_vo.update(params)
+        old_client_id = app_vo.client_id
+        app_vo = app_vo.update(params)
+
+        InvalidationBus.app_changed(app_vo.domain_id, old_client_id, app_vo.client_id)
+
+        return app_vo
 
     def enable_app(self, app_vo: App) -> App:
         self.update_app_by_vo({"state": "ENABLED"}, app_vo)
@@ -48,6 +58,7 @@ class AppManager(BaseManager):
     @staticmethod
     def delete_app_by_vo(app_vo: App) -> None:
         app_vo.delete()
+        InvalidationBus.app_changed(app_vo.domain_id, app_vo.client_id)
 
     def get_app(
         self,
@@ -73,3 +84,8 @@ class AppManager(BaseManager):
 
     def stat_apps(self, query: dict) -> dict:
         return self.app_model.stat(**query)
+
+    def touch_app(self, app_id: str, domain_id: str) -> None:
+        AccessTimeBuffer.record(
+            self.app_model, {"app_id": app_id, "domain_id": domain_id}
+        )
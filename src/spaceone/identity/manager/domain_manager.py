@@ -2,8 +2,9 @@ import logging
 from typing import Tuple
 from mongoengine import QuerySet
 
-from spaceone.core import cache
 from spaceone.core.manager import BaseManager
+
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
 from spaceone.identity.model.domain.database import Domain
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,17 +41,17 @@ class DomainManager(BaseManager):
     @staticmethod
     def delete_domain_by_vo(domain_vo: Domain) -> None:
         domain_vo.delete()
-        cache.delete_pattern(f"identity:domain-state:{domain_vo.domain_id}")
+        InvalidationBus.domain_state_changed(domain_vo.domain_id)
 
     def enable_domain(self, domain_vo: Domain) -> Domain:
         self.update_domain_by_vo({"state": "ENABLED"}, domain_vo)
-        cache.delete_pattern(f"identity:domain-state:{domain_vo.domain_id}")
+        InvalidationBus.domain_state_changed(domain_vo.domain_id)
 
         return domain_vo
 
     def disable_domain(self, domain_vo: Domain) -> Domain:
         self.update_domain_by_vo({"state": "DISABLED"}, domain_vo)
-        cache.delete_pattern(f"identity:domain-state:{domain_vo.domain_id}")
+        InvalidationBus.domain_state_changed(domain_vo.domain_id)
 
         return domain_vo
 
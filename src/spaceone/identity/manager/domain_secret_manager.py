@@ -1,8 +1,11 @@
 import logging
+from jwcrypto import jwk
 from spaceone.core.auth.jwt import JWTUtil
 from spaceone.core import cache
 from spaceone.core.manager import *
 from spaceone.core import utils
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
+from spaceone.identity.lib.key_ring import KeyRing
 from spaceone.identity.model.domain.database import Domain, DomainSecret
 from spaceone.identity.manager.domain_manager import DomainManager
 
@@ -34,10 +37,25 @@ class DomainSecretManager(BaseManager):
     def delete_domain_secret(self, domain_id: str) -> None:
         domain_secret_vos = self.domain_secret_model.filter(domain_id=domain_id)
         domain_secret_vos.delete()
-        cache.delete(f"identity:public-jwk:{domain_id}")
-        cache.delete(f"identity:private-jwk:{domain_id}")
-        cache.delete(f"identity:refresh-public-jwk:{domain_id}")
-        cache.delete(f"identity:refresh-private-jwk:{domain_id}")
+        InvalidationBus.domain_secret_changed(domain_id)
+
+    def get_domain_signing_key(self, domain_id: str, refresh: bool = False) -> jwk.JWK:
+        if refresh:
+            return KeyRing.get_key(
+                domain_id, "refresh-private", self.get_domain_refresh_private_key
+            )
+        else:
+            return KeyRing.get_key(domain_id, "private", self.get_domain_private_key)
+
+    def get_domain_verifying_key(
+        self, domain_id: str, refresh: bool = False
+    ) -> jwk.JWK:
+        if refresh:
+            return KeyRing.get_key(
+                domain_id, "refresh-public", self.get_domain_refresh_public_key
+            )
+        else:
+            return KeyRing.get_key(domain_id, "public", self.get_domain_public_key)
 
     @cache.cacheable(key="identity:public-jwk:{domain_id}", expire=600)
     def get_domain_public_key(self, domain_id: str) -> dict:
@@ -0,0 +1,190 @@
+import logging
+from datetime import datetime, timedelta
+from typing import List, Union
+
+from mongoengine import Q, QuerySet
+from spaceone.core.error import ERROR_SAVE_UNIQUE_VALUES
+from spaceone.core.manager import BaseManager
+
+from spaceone.identity.model.job.database import DormancyShard
+from spaceone.identity.model.workspace.database import Workspace
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DormancyShardManager(BaseManager):
+    """Splits the daily dormancy check of a domain into workspace ranges.
+
+    Shards are claimed by queue workers with an atomic update, so a shard
+    is processed by one worker at a time. A shard which is still
+    IN_PROGRESS after the lease time is considered abandoned by a stopped
+    worker and can be claimed again, resuming from its checkpoint.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dormancy_shard_model = DormancyShard
+
+    def create_shards(
+        self, domain_id: str, run_date: str, shard_size: int
+    ) -> List[DormancyShard]:
+        """Creates the shards of a run which are not created yet.
+
+        Shards are created in order and only the last one is unbounded, so
+        a planning stopped halfway is continued from the end of the last
+        created shard. Returns [] if the run is already planned.
+        """
+
+        last_shard_vo = self.get_last_shard(domain_id, run_date)
+
+        if last_shard_vo is None:
+            shard_index, start_workspace_id = 0, None
+        elif last_shard_vo.end_workspace_id is None:
+            _LOGGER.debug(f"[create_shards] already planned: {domain_id} ({run_date})")
+            return []
+        else:
+            shard_index = last_shard_vo.shard_index + 1
+            start_workspace_id = last_shard_vo.end_workspace_id
+
+        query = {"domain_id": domain_id}
+        if start_workspace_id:
+            query["workspace_id"] = {"$gte": start_workspace_id}
+
+        workspace_ids = [
+            workspace["workspace_id"]
+            for workspace in Workspace._get_collection()
+            .find(query, {"workspace_id": 1})
+            .sort("workspace_id", 1)
+        ]
+
+        # the last shard is unbounded to include new workspaces
+        start_workspace_ids = [start_workspace_id] + workspace_ids[
+            shard_size::shard_size
+        ]
+        end_workspace_ids = start_workspace_ids[1:] + [None]
+
+        shard_vos = []
+        for shard_index, (start_workspace_id, end_workspace_id) in enumerate(
+            zip(start_workspace_ids, end_workspace_ids), start=shard_index
+        ):
+            try:
+                shard_vo = self.dormancy_shard_model.create(
+                    {
+                        "run_date": run_date,
+                        "shard_index": shard_index,
+                        "start_workspace_id": start_workspace_id,
+                        "end_workspace_id": end_workspace_id,
+                        "domain_id": domain_id,
+                    }
+                )
+            except ERROR_SAVE_UNIQUE_VALUES:
+                # another worker is planning the same run and creates the rest
+                _LOGGER.debug(
+                    f"[create_shards] planned by another worker: {domain_id} "
+                    f"({run_date}, shard_index = {shard_index})"
+                )
+                break
+
+            shard_vos.append(shard_vo)
+
+        return shard_vos
+
+    def get_last_shard(
+        self, domain_id: str, run_date: str
+    ) -> Union[DormancyShard, None]:
+        return (
+            self.dormancy_shard_model.objects.filter(
+                domain_id=domain_id, run_date=run_date
+            )
+            .order_by("-shard_index")
+            .first()
+        )
+
+    def filter_unfinished_plans(self, run_date: str, lease: int) -> List[str]:
+        """Returns domains whose planning of a run stopped halfway."""
+
+        expired_at = datetime.utcnow() - timedelta(seconds=lease)
+        pipeline = [
+            {"$match": {"run_date": run_date}},
+            {"$sort": {"shard_index": -1}},
+            {
+                "$group": {
+                    "_id": "$domain_id",
+                    "end_workspace_id": {"$first": "$end_workspace_id"},
+                    "created_at": {"$first": "$created_at"},
+                }
+            },
+        ]
+
+        return [
+            result["_id"]
+            for result in self.dormancy_shard_model._get_collection().aggregate(
+                pipeline
+            )
+            if result["end_workspace_id"] is not None
+            and result["created_at"] < expired_at
+        ]
+
+    def claim_shard(
+        self, shard_id: str, lease: int, max_attempts: int
+    ) -> Union[DormancyShard, None]:
+        now = datetime.utcnow()
+        expired_at = now - timedelta(seconds=lease)
+
+        return (
+            self.dormancy_shard_model.objects.filter(shard_id=shard_id)
+            .filter(
+                Q(status="PENDING")
+                | Q(status="FAILURE", attempts__lt=max_attempts)
+                | Q(status="IN_PROGRESS", updated_at__lt=expired_at)
+            )
+            .modify(
+                new=True,
+                set__status="IN_PROGRESS",
+                set__started_at=now,
+                set__updated_at=now,
+                inc__attempts=1,
+            )
+        )
+
+    @staticmethod
+    def save_checkpoint(
+        shard_vo: DormancyShard, checkpoint_workspace_id: str, processed_count: int
+    ) -> DormancyShard:
+        return shard_vo.update(
+            {
+                "checkpoint_workspace_id": checkpoint_workspace_id,
+                "processed_count": shard_vo.processed_count + processed_count,
+                "updated_at": datetime.utcnow(),
+            }
+        )
+
+    @staticmethod
+    def finish_shard(
+        shard_vo: DormancyShard, status: str, error_message: str = None
+    ) -> DormancyShard:
+        now = datetime.utcnow()
+
+        return shard_vo.update(
+            {
+                "status": status,
+                "error_message": error_message,
+                "duration": (now - shard_vo.started_at).total_seconds(),
+                "updated_at": now,
+                "finished_at": now,
+            }
+        )
+
+    def filter_resumable_shards(
+        self, run_date: str, lease: int, max_attempts: int
+    ) -> QuerySet:
+        expired_at = datetime.utcnow() - timedelta(seconds=lease)
+
+        return self.dormancy_shard_model.objects.filter(run_date=run_date).filter(
+            Q(status="PENDING", created_at__lt=expired_at)
+            | Q(status="FAILURE", attempts__lt=max_attempts)
+            | Q(status="IN_PROGRESS", updated_at__lt=expired_at)
+        )
+
+    def filter_shards(self, **conditions) -> QuerySet:
+        return self.dormancy_shard_model.filter(**conditions)
@@ -1,19 +1,14 @@
+import functools
 import logging
-import os
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import List
 
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
-from spaceone.identity.connector.smtp_connector import SMTPConnector
+from spaceone.identity.lib.email_outbox import EmailOutbox
+from spaceone.identity.lib.email_template import EmailTemplate
 
 _LOGGER = logging.getLogger(__name__)
 
-TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), f"../template")
-JINJA_ENV = Environment(
-    loader=FileSystemLoader(searchpath=TEMPLATE_PATH), autoescape=select_autoescape()
-)
-
 LANGUAGE_MAPPER = {
     "default": {
         "reset_password": "Reset your password",
@@ -43,77 +38,119 @@ LANGUAGE_MAPPER = {
 
 
 class EmailManager(BaseManager):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.smtp_connector = SMTPConnector()
-
     def send_reset_password_email(self, user_id, email, reset_password_link, language):
-        service_name = self._get_service_name()
-        language_map_info = LANGUAGE_MAPPER.get(language, "default")
-
-        template = JINJA_ENV.get_template(
-            f"reset_pwd_link_when_pw_forgotten_{language}.html"
-        )
-        email_contents = template.render(
+        self._send_email(
+            "reset_pwd_link_when_pw_forgotten",
+            "reset_password",
+            language,
+            email,
+            durable=False,
             user_name=user_id,
             reset_password_link=reset_password_link,
-            service_name=service_name,
         )
-        subject = f'[{service_name}] {language_map_info["reset_password"]}'
-
-        self.smtp_connector.send_email(email, subject, email_contents)
 
     def send_temporary_password_email(
         self, user_id, email, console_link, temp_password, language
     ):
-        service_name = self._get_service_name()
-        language_map_info = LANGUAGE_MAPPER.get(language, "default")
-
-        template = JINJA_ENV.get_template(f"temp_pwd_when_pw_forgotten_{language}.html")
-        email_contents = template.render(
+        self._send_email(
+            "temp_pwd_when_pw_forgotten",
+            "temp_password",
+            language,
+            email,
+            durable=False,
             user_name=user_id,
             temp_password=temp_password,
-            service_name=service_name,
             login_link=console_link,
         )
-        subject = f'[{service_name}] {language_map_info["temp_password"]}'
-
-        self.smtp_connector.send_email(email, subject, email_contents)
 
     def send_reset_password_email_when_user_added(
         self, user_id, email, reset_password_link, language
     ):
-        service_name = self._get_service_name()
-        language_map_info = LANGUAGE_MAPPER.get(language, "default")
-
-        template = JINJA_ENV.get_template(
-            f"reset_pwd_link_when_user_added_{language}.html"
+        self.send_reset_password_emails_when_users_added(
+            [
+                {
+                    "user_id": user_id,
+                    "email": email,
+                    "reset_password_link": reset_password_link,
+                }
+            ],
+            language,
         )
-        email_contents = template.render(
-            user_name=user_id,
-            reset_password_link=reset_password_link,
-            service_name=service_name,
-        )
-        subject = f'[{service_name}] {language_map_info["reset_password"]}'
 
-        self.smtp_connector.send_email(email, subject, email_contents)
+    def send_reset_password_emails_when_users_added(
+        self, users: List[dict], language: str
+    ):
+        """Send the emails of users added at once
+        Args:
+            users (list): [
+                {
+                    'user_id': 'str',
+                    'email': 'str',
+                    'reset_password_link': 'str'
+                }
+            ]
+            language (str)
+        """
+
+        self._send_emails(
+            "reset_pwd_link_when_user_added",
+            "reset_password",
+            language,
+            [
+                (
+                    user["email"],
+                    {
+                        "user_name": user["user_id"],
+                        "reset_password_link": user["reset_password_link"],
+                    },
+                )
+                for user in users
+            ],
+            durable=False,
+        )
 
     def send_temporary_password_email_when_user_added(
         self, user_id, email, console_link, temp_password, language
     ):
-        service_name = self._get_service_name()
-        language_map_info = LANGUAGE_MAPPER.get(language, "default")
+        self.send_temporary_password_emails_when_users_added(
+            [{"user_id": user_id, "email": email, "temp_password": temp_password}],
+            console_link,
+            language,
+        )
 
-        template = JINJA_ENV.get_template(f"temp_pwd_when_user_added_{language}.html")
-        email_contents = template.render(
-            user_name=user_id,
-            temp_password=temp_password,
-            service_name=service_name,
+    def send_temporary_password_emails_when_users_added(
+        self, users: List[dict], console_link: str, language: str
+    ):
+        """Send the emails of users added at once
+        Args:
+            users (list): [
+                {
+                    'user_id': 'str',
+                    'email': 'str',
+                    'temp_password': 'str'
+                }
+            ]
+            console_link (str)
+            language (str)
+        """
+
+        self._send_emails(
+            "temp_pwd_when_user_added",
+            "temp_password",
+            language,
+            [
+                (
+                    user["email"],
+                    {
+                        "user_name": user["user_id"],
+                        "temp_password": user["temp_password"],
+                    },
+                )
+                for user in users
+            ],
+            durable=False,
             login_link=console_link,
         )
-        subject = f'[{service_name}] {language_map_info["temp_password"]}'
-
-        self.smtp_connector.send_email(email, subject, email_contents)
 
     def send_invite_email_when_external_user_added(
         self,
@@ -123,35 +160,80 @@ class EmailManager(BaseManager):
         language: str,
         external_auth_provider: str = "EXTERNAL",
     ):
-        service_name = self._get_service_name()
-        language_map_info = LANGUAGE_MAPPER.get(language, "default")
-
-        template = JINJA_ENV.get_template(f"sso_invite_user_link_{language}.html")
-
-        email_contents = template.render(
+        self._send_email(
+            "sso_invite_user_link",
+            "invite_external_user",
+            language,
+            email,
             user_name=user_id,
             auth_type=external_auth_provider,
-            service_name=service_name,
             login_link=console_link,
         )
 
-        subject = f'[{service_name}] {language_map_info["invite_external_user"]}'
-        self.smtp_connector.send_email(email, subject, email_contents)
-
-    def send_verification_email(self, user_id, email, verification_code, language):
-        service_name = self._get_service_name()
-        language_map_info = LANGUAGE_MAPPER.get(language, "default")
-
-        template = JINJA_ENV.get_template(f"verification_code_{language}.html")
-        email_contents = template.render(
+    def send_verification_email(
+        self, user_id, email, verification_code, language, expire: int = None
+    ):
+        self._send_email(
+            "verification_code",
+            "verify_email",
+            language,
+            email,
+            expire=expire,
             user_name=user_id,
             verification_code=verification_code,
-            service_name=service_name,
         )
-        subject = f'[{service_name}] {language_map_info["verify_email"]}'
 
-        self.smtp_connector.send_email(email, subject, email_contents)
+    def _send_email(
+        self,
+        template_name: str,
+        subject_key: str,
+        language: str,
+        email: str,
+        expire: int = None,
+        durable: bool = True,
+        **context,
+    ):
+        self._send_emails(
+            template_name,
+            subject_key,
+            language,
+            [(email, context)],
+            expire=expire,
+            durable=durable,
+        )
 
     @staticmethod
-    def _get_service_name():
-        return config.get_global("EMAIL_SERVICE_NAME")
+    def _send_emails(
+        template_name: str,
+        subject_key: str,
+        language: str,
+        recipients: List[tuple],
+        expire: int = None,
+        durable: bool = True,
+        **common_context,
+    ):
+        email_contents_list = EmailTemplate.render_many(
+            template_name,
+            language,
+            [context for _, context in recipients],
+            **common_context,
+        )
+        subject = _get_subject(subject_key, language)
+
+        # emails with passwords or reset links are sent at once without being
+        # stored, and a failure is raised to the caller
+        EmailOutbox.send_many(
+            [
+                (email, subject, email_contents)
+                for (email, _), email_contents in zip(recipients, email_contents_list)
+            ],
+            expire,
+            durable,
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _get_subject(subject_key: str, language: str) -> str:
+    service_name = config.get_global("EMAIL_SERVICE_NAME")
+    language_map_info = LANGUAGE_MAPPER.get(language, LANGUAGE_MAPPER["default"])
+    return f"[{service_name}] {language_map_info[subject_key]}"
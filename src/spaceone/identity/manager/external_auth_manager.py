@@ -2,13 +2,13 @@ import logging
 from typing import Tuple
 
 from mongoengine import QuerySet
-from spaceone.core import config
 from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.connector.external_auth_plugin_connector import (
     ExternalAuthPluginConnector,
 )
+from spaceone.identity.manager.plugin_manager import PluginManager
 from spaceone.identity.model.domain.database import Domain
 from spaceone.identity.model.external_auth.database import ExternalAuth
 
@@ -31,7 +31,7 @@ class ExternalAuthManager(BaseManager):
             domain_id = domain_vo.domain_id
             options = plugin_info.get("options", {})
             endpoint, updated_version = self.get_auth_plugin_endpoint(
-                domain_id, plugin_info
+                domain_id, plugin_info, refresh=True
             )
 
             if updated_version:
@@ -89,24 +89,10 @@ class ExternalAuthManager(BaseManager):
         return self.external_auth_model.filter(**conditions)
 
     def get_auth_plugin_endpoint(
-        self, domain_id: str, plugin_info: dict
+        self, domain_id: str, plugin_info: dict, refresh: bool = False
     ) -> Tuple[str, str]:
-        system_token = config.get_global("TOKEN")
-        plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", service="plugin"
-        )
-        response = plugin_connector.dispatch(
-            "Plugin.get_plugin_endpoint",
-            {
-                "plugin_id": plugin_info["plugin_id"],
-                "version": plugin_info.get("version"),
-                "upgrade_mode": plugin_info.get("upgrade_mode", "AUTO"),
-                "domain_id": domain_id,
-            },
-            token=system_token,
-        )
-
-        return response["endpoint"], response.get("updated_version")
+        plugin_mgr: PluginManager = self.locator.get_manager("PluginManager")
+        return plugin_mgr.get_plugin_endpoint(plugin_info, domain_id, refresh)
 
     @staticmethod
     def init_auth_plugin(endpoint: str, options: dict, domain_id: str) -> dict:
@@ -159,3 +159,47 @@ class JobManager(BaseManager):
         _LOGGER.debug(f"[push_dormancy_job] {params['domain_id']}")
 
         queue.put("identity_q", utils.dump_json(task))
+
+    def push_dormancy_shard_job(self, params: dict) -> None:
+        token = self.transaction.meta.get("token")
+
+        task = {
+            "name": "check_dormancy_by_shard",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "JobService",
+                    "metadata": {"token": token},
+                    "method": "check_dormancy_by_shard",
+                    "params": {"params": params},
+                }
+            ],
+        }
+        _LOGGER.debug(
+            f"[push_dormancy_shard_job] {params['domain_id']} ({params['shard_id']})"
+        )
+
+        queue.put("identity_q", utils.dump_json(task))
+
+    def push_workspace_user_count_job(self, params: dict) -> None:
+        token = self.transaction.meta.get("token")
+
+        task = {
+            "name": "reconcile_workspace_user_count_by_domain",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "JobService",
+                    "metadata": {"token": token},
+                    "method": "reconcile_workspace_user_count_by_domain",
+                    "params": {"params": params},
+                }
+            ],
+        }
+        _LOGGER.debug(f"[push_workspace_user_count_job] {params['domain_id']}")
+
+        queue.put("identity_q", utils.dump_json(task))
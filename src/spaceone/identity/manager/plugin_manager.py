@@ -1,6 +1,8 @@
 import logging
-from typing import Tuple
+import threading
+from typing import Tuple, Union
 
+from cachetools import TTLCache
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
@@ -11,24 +13,124 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class PluginManager(BaseManager):
+    """Resolves plugin endpoints through the plugin service.
+
+    Resolved endpoints are kept in a process-local TTL cache keyed on
+    (plugin_id, version, upgrade_mode, domain_id). Failed resolutions are
+    cached for a short time, and concurrent lookups of the same key wait for
+    a single request to the plugin service.
+    """
+
+    _endpoints: Union[TTLCache, None] = None
+    _errors: Union[TTLCache, None] = None
+    _lock = threading.Lock()
+    _key_locks = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.plugin_connector: SpaceConnector = self.locator.get_connector(
             "SpaceConnector", service="plugin"
         )
 
-    def get_plugin_endpoint(self, plugin_info: dict, domain_id: str) -> Tuple[str, str]:
+    def get_plugin_endpoint(
+        self, plugin_info: dict, domain_id: str, refresh: bool = False
+    ) -> Tuple[str, str]:
+        cache_key = (
+            plugin_info["plugin_id"],
+            plugin_info.get("version"),
+            plugin_info.get("upgrade_mode", "AUTO"),
+            domain_id,
+        )
+
+        if refresh:
+            self.delete_plugin_endpoint_cache(plugin_info["plugin_id"], domain_id)
+        elif (cached := self._get_cached_endpoint(cache_key)) is not None:
+            return cached
+
+        with self._get_key_lock(cache_key):
+            # another thread may have resolved the same key while waiting
+            if not refresh and (cached := self._get_cached_endpoint(cache_key)):
+                return cached
+
+            try:
+                endpoint_info = self._resolve_plugin_endpoint(*cache_key)
+            except Exception as e:
+                with self._lock:
+                    self._errors[cache_key] = e
+                raise e
+
+            plugin_id, version, _, _ = cache_key
+            updated_version = endpoint_info[1]
+
+            # a new version was released, so endpoints of older versions are stale
+            if updated_version and updated_version != version:
+                self.delete_plugin_endpoint_cache(plugin_id, domain_id)
+
+            with self._lock:
+                self._endpoints[cache_key] = endpoint_info
+
+            return endpoint_info
+
+    @classmethod
+    def delete_plugin_endpoint_cache(cls, plugin_id: str, domain_id: str) -> None:
+        cls._init_cache()
+
+        with cls._lock:
+            for cache in [cls._endpoints, cls._errors]:
+                for cache_key in list(cache.keys()):
+                    if cache_key[0] == plugin_id and cache_key[3] == domain_id:
+                        cache.pop(cache_key, None)
+
+    def _resolve_plugin_endpoint(
+        self, plugin_id: str, version: str, upgrade_mode: str, domain_id: str
+    ) -> Tuple[str, str]:
         system_token = config.get_global("TOKEN")
 
         response = self.plugin_connector.dispatch(
             "Plugin.get_plugin_endpoint",
             {
-                "plugin_id": plugin_info["plugin_id"],
-                "version": plugin_info.get("version"),
-                "upgrade_mode": plugin_info.get("upgrade_mode", "AUTO"),
+                "plugin_id": plugin_id,
+                "version": version,
+                "upgrade_mode": upgrade_mode,
                 "domain_id": domain_id,
             },
             token=system_token,
         )
 
         return response["endpoint"], response.get("updated_version")
+
+    @classmethod
+    def _get_cached_endpoint(cls, cache_key: tuple) -> Union[Tuple[str, str], None]:
+        cls._init_cache()
+
+        with cls._lock:
+            if error := cls._errors.get(cache_key):
+                raise error
+
+            return cls._endpoints.get(cache_key)
+
+    @classmethod
+    def _get_key_lock(cls, cache_key: tuple) -> threading.Lock:
+        with cls._lock:
+            # drop locks of expired keys so the lock table stays bounded
+            if len(cls._key_locks) > cls._endpoints.maxsize:
+                for key in list(cls._key_locks.keys()):
+                    if key not in cls._endpoints and not cls._key_locks[key].locked():
+                        del cls._key_locks[key]
+
+            return cls._key_locks.setdefault(cache_key, threading.Lock())
+
+    @classmethod
+    def _init_cache(cls) -> None:
+        if cls._endpoints is None:
+            with cls._lock:
+                if cls._endpoints is None:
+                    identity_conf = config.get_global("IDENTITY") or {}
+                    cache_conf = identity_conf.get("plugin_endpoint_cache", {})
+                    max_size = cache_conf.get("max_size", 1024)
+                    cls._errors = TTLCache(
+                        maxsize=max_size, ttl=cache_conf.get("error_ttl", 10)
+                    )
+                    cls._endpoints = TTLCache(
+                        maxsize=max_size, ttl=cache_conf.get("ttl", 300)
+                    )
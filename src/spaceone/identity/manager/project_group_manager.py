@@ -1,22 +1,34 @@
 import logging
-from typing import Tuple, List
+import threading
+from typing import Tuple, List, Union
+
+from cachetools import TTLCache
 from mongoengine import QuerySet
+from pymongo import UpdateOne
 from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.error.error_project_group import *
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
 from spaceone.identity.manager.project_manager import ProjectManager
+from spaceone.identity.manager.user_project_manager import UserProjectManager
 from spaceone.identity.model.project.database import Project
 from spaceone.identity.model.project_group.database import ProjectGroup
 
 _LOGGER = logging.getLogger(__name__)
 
+# domains whose project groups all have a path, rechecked after the TTL since
+# older versions may still create groups without a path during an upgrade
+_PATH_MIGRATED_DOMAINS = TTLCache(maxsize=10000, ttl=300)
+_PATH_MIGRATED_LOCK = threading.Lock()
+
 
 class ProjectGroupManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.project_group_model = ProjectGroup
         self.project_model = Project
+        self.user_project_mgr = UserProjectManager()
 
     def create_project_group(self, params: dict) -> ProjectGroup:
         def _rollback(vo: ProjectGroup):
@@ -25,6 +37,10 @@ class ProjectGroupManager(BaseManager):
             )
             vo.delete()
 
+        params["path"] = self.get_project_group_path(
+            params["domain_id"], params.get("parent_group_id")
+        )
+
         project_group_vo = self.project_group_model.create(params)
         self.transaction.add_rollback(_rollback, project_group_vo)
 
@@ -38,10 +54,53 @@ class ProjectGroupManager(BaseManager):
                 f'[update_project_group._rollback] Revert Data: {old_data["name"]} ({old_data["project_group_id"]})'
             )
             project_group_vo.update(old_data)
+            self.user_project_mgr.delete_workspace_user_projects(
+                project_group_vo.domain_id, project_group_vo.workspace_id
+            )
+
+        def _rollback_descendant_paths(vo: ProjectGroup, path: list):
+            _LOGGER.info(
+                f"[update_project_group._rollback] Revert descendant paths: {vo.project_group_id}"
+            )
+            self.update_descendant_paths(vo.domain_id, vo.project_group_id, path)
 
         self.transaction.add_rollback(_rollback, project_group_vo.to_dict())
 
-        return project_group_vo.update(params)
+        old_parent_group_id = project_group_vo.parent_group_id
+        old_path = project_group_vo.path
+        old_users = set(project_group_vo.users or [])
+
+        if (
+            "parent_group_id" in params
+            and params["parent_group_id"] != old_parent_group_id
+        ):
+            params["path"] = self.get_project_group_path(
+                project_group_vo.domain_id, params["parent_group_id"]
+            )
+
+        project_group_vo = project_group_vo.update(params)
+
+        if "path" in params:
+            self.transaction.add_rollback(
+                _rollback_descendant_paths, project_group_vo, old_path
+            )
+            self.update_descendant_paths(
+                project_group_vo.domain_id,
+                project_group_vo.project_group_id,
+                project_group_vo.path,
+            )
+
+        domain_id = project_group_vo.domain_id
+        workspace_id = project_group_vo.workspace_id
+        if project_group_vo.parent_group_id != old_parent_group_id:
+            self.user_project_mgr.delete_workspace_user_projects(domain_id, workspace_id)
+        else:
+            users = set(project_group_vo.users or [])
+            self.user_project_mgr.delete_user_projects(
+                domain_id, workspace_id, list(users ^ old_users)
+            )
+
+        return project_group_vo
 
     def delete_project_group_by_vo(self, project_group_vo: ProjectGroup) -> None:
         project_mgr = ProjectManager()
@@ -61,6 +120,10 @@ class ProjectGroupManager(BaseManager):
 
         project_group_vo.delete()
 
+        InvalidationBus.project_group_tree_changed(
+            project_group_vo.domain_id, project_group_vo.workspace_id
+        )
+
     def get_project_group(
         self,
         project_group_id: str,
@@ -90,26 +153,144 @@ class ProjectGroupManager(BaseManager):
     def stat_project_groups(self, query: dict) -> dict:
         return self.project_group_model.stat(**query)
 
-    @cache.cacheable(
-        key="identity:project-group:{domain_id}:{project_group_id}",
-        expire=180,
-    )
     def get_projects_in_project_groups(
         self,
         domain_id: str,
-        project_group_id: list,
+        project_group_id: str,
+    ) -> List[str]:
+        generation = InvalidationBus.get_generation(
+            f"identity:project-group-generation:{domain_id}"
+        )
+        return self._get_projects_in_project_group(
+            domain_id, generation, project_group_id
+        )
+
+    @cache.cacheable(
+        key="identity:project-group:{domain_id}:{generation}:{project_group_id}",
+        expire=3600,
+    )
+    def _get_projects_in_project_group(
+        self, domain_id: str, generation: int, project_group_id: str
+    ) -> List[str]:
+        return self.list_projects_in_project_group_tree(domain_id, [project_group_id])
+
+    def list_projects_in_project_group_tree(
+        self, domain_id: str, project_group_ids: List[str]
     ) -> List[str]:
+        project_group_ids = project_group_ids + self.get_child_project_group_ids(
+            domain_id, project_group_ids
+        )
+
         project_vos = self.project_model.filter(
-            domain_id=domain_id, project_group_id=project_group_id
+            domain_id=domain_id, project_group_id=project_group_ids
+        ).only("project_id")
+        return list(set([project_vo.project_id for project_vo in project_vos]))
+
+    def get_child_project_group_ids(
+        self, domain_id: str, project_group_id: Union[str, List[str]]
+    ) -> List[str]:
+        self.ensure_project_group_path(domain_id)
+
+        project_group_vos = self.project_group_model.filter(
+            domain_id=domain_id, path=project_group_id
+        ).only("project_group_id")
+        return [
+            project_group_vo.project_group_id for project_group_vo in project_group_vos
+        ]
+
+    def get_project_group_path(
+        self, domain_id: str, parent_group_id: str = None
+    ) -> List[str]:
+        if parent_group_id is None:
+            return []
+
+        self.ensure_project_group_path(domain_id)
+
+        parent_group_vo = self.project_group_model.get(
+            project_group_id=parent_group_id, domain_id=domain_id
         )
-        projects = [project_vo.project_id for project_vo in project_vos]
+        return (parent_group_vo.path or []) + [parent_group_id]
+
+    def update_descendant_paths(
+        self, domain_id: str, project_group_id: str, path: List[str]
+    ) -> None:
+        project_group_vos = self.project_group_model.filter(
+            domain_id=domain_id, path=project_group_id
+        ).only("project_group_id", "path")
+
+        requests = []
+        for project_group_vo in project_group_vos:
+            old_path = project_group_vo.path
+            new_path = path + old_path[old_path.index(project_group_id) :]
+            if new_path != old_path:
+                requests.append(
+                    UpdateOne({"_id": project_group_vo.pk}, {"$set": {"path": new_path}})
+                )
 
-        child_project_groups = self.project_group_model.filter(
-            domain_id=domain_id, parent_group_id=project_group_id
+        if requests:
+            self.project_group_model._get_collection().bulk_write(
+                requests, ordered=False
+            )
+
+    def list_domains_without_project_group_path(self) -> List[str]:
+        return self.project_group_model._get_collection().distinct(
+            "domain_id", {"path": None}
         )
-        for child_project_group in child_project_groups:
-            parent_group_id = child_project_group.project_group_id
-            projects.extend(
-                self.get_projects_in_project_groups(domain_id, parent_group_id)
+
+    def ensure_project_group_path(self, domain_id: str) -> None:
+        """Sets path of the domain's project groups before paths are trusted.
+
+        Until ProjectGroupPathScheduler migrates a domain, groups created by
+        older versions have no path, which would hide their descendants.
+        """
+
+        with _PATH_MIGRATED_LOCK:
+            if domain_id in _PATH_MIGRATED_DOMAINS:
+                return
+
+        if self.project_group_model._get_collection().find_one(
+            {"domain_id": domain_id, "path": None}, {"_id": 1}
+        ):
+            self.migrate_project_group_path(domain_id)
+
+        with _PATH_MIGRATED_LOCK:
+            _PATH_MIGRATED_DOMAINS[domain_id] = True
+
+    def migrate_project_group_path(self, domain_id: str) -> int:
+        """Sets path of project groups created before it was maintained.
+
+        Returns the number of project groups whose path was updated.
+        """
+
+        parent_map = {}
+        path_map = {}
+        pk_map = {}
+        for project_group_vo in self.project_group_model.filter(
+            domain_id=domain_id
+        ).only("project_group_id", "parent_group_id", "path"):
+            project_group_id = project_group_vo.project_group_id
+            parent_map[project_group_id] = project_group_vo.parent_group_id
+            path_map[project_group_id] = project_group_vo.path
+            pk_map[project_group_id] = project_group_vo.pk
+
+        requests = []
+        for project_group_id, current_path in path_map.items():
+            path = []
+            parent_group_id = parent_map[project_group_id]
+            while parent_group_id and parent_group_id not in path:
+                path.insert(0, parent_group_id)
+                parent_group_id = parent_map.get(parent_group_id)
+
+            if path != current_path:
+                requests.append(
+                    UpdateOne(
+                        {"_id": pk_map[project_group_id]}, {"$set": {"path": path}}
+                    )
+                )
+
+        if requests:
+            self.project_group_model._get_collection().bulk_write(
+                requests, ordered=False
             )
-        return list(set(projects))
+
+        return len(requests)
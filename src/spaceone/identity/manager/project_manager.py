@@ -8,6 +8,7 @@ from spaceone.core.manager import BaseManager
 from spaceone.identity.model.project.database import Project
 from spaceone.identity.error.error_project import *
 from spaceone.identity.manager.service_account_manager import ServiceAccountManager
+from spaceone.identity.manager.user_project_manager import UserProjectManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +17,7 @@ class ProjectManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.project_model = Project
+        self.user_project_mgr = UserProjectManager()
 
     def create_project(self, params: dict) -> Project:
         def _rollback(vo: Project):
@@ -23,10 +25,22 @@ class ProjectManager(BaseManager):
                 f"[create_project._rollback] Delete project: {vo.name} ({vo.project_id})"
             )
             vo.delete()
+            self.user_project_mgr.delete_workspace_user_projects(
+                vo.domain_id, vo.workspace_id
+            )
 
         project_vo = self.project_model.create(params)
         self.transaction.add_rollback(_rollback, project_vo)
 
+        if project_vo.project_type == "PUBLIC" or project_vo.project_group_id:
+            self.user_project_mgr.delete_workspace_user_projects(
+                project_vo.domain_id, project_vo.workspace_id
+            )
+        else:
+            self.user_project_mgr.delete_user_projects(
+                project_vo.domain_id, project_vo.workspace_id, project_vo.users
+            )
+
         return project_vo
 
     def update_project_by_vo(self, params: dict, project_vo: Project) -> Project:
@@ -35,13 +49,34 @@ class ProjectManager(BaseManager):
                 f'[update_project._rollback] Revert Data: {old_data["name"]} ({old_data["project_id"]})'
             )
             project_vo.update(old_data)
+            self.user_project_mgr.delete_workspace_user_projects(
+                project_vo.domain_id, project_vo.workspace_id
+            )
 
         self.transaction.add_rollback(_rollback, project_vo.to_dict())
 
-        return project_vo.update(params)
+        old_project_type = project_vo.project_type
+        old_project_group_id = project_vo.project_group_id
+        old_users = set(project_vo.users or [])
+
+        project_vo = project_vo.update(params)
 
-    @staticmethod
-    def delete_project_by_vo(project_vo: Project) -> None:
+        if (
+            project_vo.project_type != old_project_type
+            or project_vo.project_group_id != old_project_group_id
+        ):
+            self.user_project_mgr.delete_workspace_user_projects(
+                project_vo.domain_id, project_vo.workspace_id
+            )
+        else:
+            users = set(project_vo.users or [])
+            self.user_project_mgr.delete_user_projects(
+                project_vo.domain_id, project_vo.workspace_id, list(users ^ old_users)
+            )
+
+        return project_vo
+
+    def delete_project_by_vo(self, project_vo: Project) -> None:
         service_account_mgr = ServiceAccountManager()
         service_account_vos = service_account_mgr.filter_service_accounts(
             project_id=project_vo.project_id
@@ -53,6 +88,10 @@ class ProjectManager(BaseManager):
 
         project_vo.delete()
 
+        self.user_project_mgr.delete_workspace_user_projects(
+            project_vo.domain_id, project_vo.workspace_id
+        )
+
     def get_project(
         self,
         project_id: str,
@@ -1,10 +1,19 @@
 import logging
-from typing import Tuple
+from collections import Counter
+from datetime import datetime
+from typing import List, Set, Tuple
 
 from mongoengine import QuerySet
+from pymongo import DeleteOne, UpdateOne
+from spaceone.core import utils
+from spaceone.core.error import ERROR_DB_QUERY
 from spaceone.core.manager import BaseManager
 
-from spaceone.identity.model.role_binding.database import RoleBinding
+from spaceone.identity.model.role_binding.database import (
+    RoleBinding,
+    WorkspaceUserRef,
+)
+from spaceone.identity.model.workspace.database import Workspace
 from spaceone.identity.manager.user_group_manager import UserGroupManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -14,17 +23,54 @@ class RoleBindingManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.role_binding_model = RoleBinding
+        self.workspace_user_ref_model = WorkspaceUserRef
 
     def create_role_binding(self, params: dict) -> RoleBinding:
         def _rollback(vo: RoleBinding):
             _LOGGER.info(f"[create_role_binding._rollback]: {vo.role_binding_id}")
             vo.delete()
+            self._remove_workspace_user_refs([vo])
 
         role_binding_vo = self.role_binding_model.create(params)
         self.transaction.add_rollback(_rollback, role_binding_vo)
 
+        self._add_workspace_user_refs([role_binding_vo])
+
         return role_binding_vo
 
+    def create_role_bindings(self, params_list: List[dict]) -> List[RoleBinding]:
+        def _rollback(vos: List[RoleBinding]):
+            _LOGGER.info(f"[create_role_bindings._rollback]: {len(vos)} role bindings")
+            self.role_binding_model.filter(
+                role_binding_id=[vo.role_binding_id for vo in vos]
+            ).delete()
+            self._remove_workspace_user_refs(vos)
+
+        if not params_list:
+            return []
+
+        role_binding_vos = []
+        for params in params_list:
+            role_binding_vo = self.role_binding_model(
+                role_binding_id=utils.generate_id("rb"),
+                created_at=datetime.utcnow(),
+                **params,
+            )
+
+            try:
+                role_binding_vo.validate()
+            except Exception as e:
+                raise ERROR_DB_QUERY(reason=e)
+
+            role_binding_vos.append(role_binding_vo)
+
+        role_binding_vos = self.role_binding_model.objects.insert(role_binding_vos)
+        self.transaction.add_rollback(_rollback, role_binding_vos)
+
+        self._add_workspace_user_refs(role_binding_vos)
+
+        return role_binding_vos
+
     def update_role_binding_by_vo(
         self, params: dict, role_binding_vo: RoleBinding
     ) -> RoleBinding:
@@ -39,12 +85,12 @@ class RoleBindingManager(BaseManager):
 
         return role_binding_vo.update(params)
 
-    @staticmethod
-    def delete_role_binding_by_vo(role_binding_vo: RoleBinding) -> None:
+    def delete_role_binding_by_vo(self, role_binding_vo: RoleBinding) -> None:
         _LOGGER.debug(
             f"[delete_role_binding_by_vo] Delete role binding info: {role_binding_vo.to_dict()}"
         )
         role_binding_vo.delete()
+        self._remove_workspace_user_refs([role_binding_vo])
 
         if role_binding_vo.workspace_id:
             # Delete user from user groups
@@ -80,3 +126,251 @@ class RoleBindingManager(BaseManager):
 
     def stat_role_bindings(self, query: dict) -> dict:
         return self.role_binding_model.stat(**query)
+
+    def reconcile_workspace_user_refs(
+        self, domain_id: str, workspace_ids: List[str] = None
+    ) -> int:
+        """Rebuilds user references and user_count of workspaces from role bindings.
+
+        Returns the number of workspaces whose user_count was corrected.
+        """
+
+        rb_match = {"domain_id": domain_id, "resource_group": "WORKSPACE"}
+        ref_match = {"domain_id": domain_id}
+        workspace_match = {"domain_id": domain_id}
+
+        if workspace_ids is not None:
+            rb_match["workspace_id"] = {"$in": workspace_ids}
+            ref_match["workspace_id"] = {"$in": workspace_ids}
+            workspace_match["workspace_id"] = {"$in": workspace_ids}
+
+        pipeline = [
+            {"$match": rb_match},
+            {
+                "$group": {
+                    "_id": {"workspace_id": "$workspace_id", "user_id": "$user_id"},
+                    "ref_count": {"$sum": 1},
+                }
+            },
+        ]
+        ref_counts = {
+            (result["_id"]["workspace_id"], result["_id"]["user_id"]): result[
+                "ref_count"
+            ]
+            for result in self.role_binding_model._get_collection().aggregate(pipeline)
+        }
+
+        ref_collection = self.workspace_user_ref_model._get_collection()
+        current_ref_counts = {
+            (ref["workspace_id"], ref["user_id"]): ref["ref_count"]
+            for ref in ref_collection.find(
+                ref_match, {"workspace_id": 1, "user_id": 1, "ref_count": 1}
+            )
+        }
+
+        operations = []
+        for (workspace_id, user_id), ref_count in ref_counts.items():
+            if current_ref_counts.get((workspace_id, user_id)) != ref_count:
+                operations.append(
+                    UpdateOne(
+                        {
+                            "domain_id": domain_id,
+                            "workspace_id": workspace_id,
+                            "user_id": user_id,
+                        },
+                        {"$set": {"ref_count": ref_count}},
+                        upsert=True,
+                    )
+                )
+
+        for workspace_id, user_id in current_ref_counts.keys() - ref_counts.keys():
+            operations.append(
+                DeleteOne(
+                    {
+                        "domain_id": domain_id,
+                        "workspace_id": workspace_id,
+                        "user_id": user_id,
+                    }
+                )
+            )
+
+        if operations:
+            ref_collection.bulk_write(operations, ordered=False)
+
+        user_counts = Counter(workspace_id for workspace_id, _ in ref_counts.keys())
+        workspace_collection = Workspace._get_collection()
+
+        operations = [
+            UpdateOne(
+                {"_id": workspace["_id"]},
+                {"$set": {"user_count": user_counts[workspace["workspace_id"]]}},
+            )
+            for workspace in workspace_collection.find(
+                workspace_match, {"workspace_id": 1, "user_count": 1}
+            )
+            if workspace.get("user_count") != user_counts[workspace["workspace_id"]]
+        ]
+
+        if operations:
+            workspace_collection.bulk_write(operations, ordered=False)
+
+        return len(operations)
+
+    def _add_workspace_user_refs(self, role_binding_vos: List[RoleBinding]) -> None:
+        ref_counts = self._count_workspace_user_refs(role_binding_vos)
+        if not ref_counts:
+            return
+
+        # references of legacy workspaces were never created, so a new
+        # reference would not mean a new user there
+        unreferenced_workspaces = self._filter_unreferenced_workspaces(
+            {(domain_id, workspace_id) for domain_id, workspace_id, _ in ref_counts}
+        )
+        if unreferenced_workspaces:
+            ref_counts = Counter(
+                {
+                    ref_key: ref_count
+                    for ref_key, ref_count in ref_counts.items()
+                    if ref_key[:2] not in unreferenced_workspaces
+                }
+            )
+            for domain_id, workspace_id in unreferenced_workspaces:
+                self.reconcile_workspace_user_refs(domain_id, [workspace_id])
+
+            if not ref_counts:
+                return
+
+        ref_keys = list(ref_counts.keys())
+        result = self.workspace_user_ref_model._get_collection().bulk_write(
+            [
+                UpdateOne(
+                    {
+                        "domain_id": domain_id,
+                        "workspace_id": workspace_id,
+                        "user_id": user_id,
+                    },
+                    {"$inc": {"ref_count": ref_count}},
+                    upsert=True,
+                )
+                for (domain_id, workspace_id, user_id), ref_count in ref_counts.items()
+            ],
+            ordered=False,
+        )
+
+        # only a newly created reference adds a user to the workspace
+        user_counts = Counter()
+        for index in result.upserted_ids.keys():
+            domain_id, workspace_id, _ = ref_keys[index]
+            user_counts[(domain_id, workspace_id)] += 1
+
+        self._increase_workspace_user_count(user_counts)
+
+    def _filter_unreferenced_workspaces(
+        self, workspace_keys: Set[Tuple[str, str]]
+    ) -> Set[Tuple[str, str]]:
+        ref_collection = self.workspace_user_ref_model._get_collection()
+
+        referenced_workspaces = set()
+        for domain_id in {domain_id for domain_id, _ in workspace_keys}:
+            workspace_ids = ref_collection.distinct(
+                "workspace_id",
+                {
+                    "domain_id": domain_id,
+                    "workspace_id": {
+                        "$in": [
+                            workspace_id
+                            for key_domain_id, workspace_id in workspace_keys
+                            if key_domain_id == domain_id
+                        ]
+                    },
+                },
+            )
+            referenced_workspaces.update(
+                (domain_id, workspace_id) for workspace_id in workspace_ids
+            )
+
+        return workspace_keys - referenced_workspaces
+
+    def _remove_workspace_user_refs(self, role_binding_vos: List[RoleBinding]) -> None:
+        ref_counts = self._count_workspace_user_refs(role_binding_vos)
+        if not ref_counts:
+            return
+
+        ref_collection = self.workspace_user_ref_model._get_collection()
+        result = ref_collection.bulk_write(
+            [
+                UpdateOne(
+                    {
+                        "domain_id": domain_id,
+                        "workspace_id": workspace_id,
+                        "user_id": user_id,
+                    },
+                    {"$inc": {"ref_count": -ref_count}},
+                )
+                for (domain_id, workspace_id, user_id), ref_count in ref_counts.items()
+            ],
+            ordered=False,
+        )
+
+        workspace_users = {}
+        for domain_id, workspace_id, user_id in ref_counts.keys():
+            workspace_users.setdefault((domain_id, workspace_id), []).append(user_id)
+
+        if result.matched_count < len(ref_counts):
+            # references are missing, e.g. created before they were maintained
+            for domain_id, workspace_id in workspace_users.keys():
+                self.reconcile_workspace_user_refs(domain_id, [workspace_id])
+            return
+
+        # the delete is atomic, so only one caller removes a user from a workspace
+        user_counts = Counter()
+        for (domain_id, workspace_id), user_ids in workspace_users.items():
+            delete_result = ref_collection.delete_many(
+                {
+                    "domain_id": domain_id,
+                    "workspace_id": workspace_id,
+                    "user_id": {"$in": user_ids},
+                    "ref_count": {"$lte": 0},
+                }
+            )
+            if delete_result.deleted_count:
+                user_counts[(domain_id, workspace_id)] -= delete_result.deleted_count
+
+        self._increase_workspace_user_count(user_counts)
+
+    def _increase_workspace_user_count(self, user_counts: Counter) -> None:
+        user_counts = {key: value for key, value in user_counts.items() if value}
+        if not user_counts:
+            return
+
+        workspace_keys = list(user_counts.keys())
+        result = Workspace._get_collection().bulk_write(
+            [
+                UpdateOne(
+                    {
+                        "domain_id": domain_id,
+                        "workspace_id": workspace_id,
+                        "user_count": {"$type": "number"},
+                    },
+                    {"$inc": {"user_count": user_count}},
+                )
+                for (domain_id, workspace_id), user_count in user_counts.items()
+            ],
+            ordered=False,
+        )
+
+        if result.matched_count < len(workspace_keys):
+            # user_count of legacy workspaces may not be set yet
+            for domain_id, workspace_id in workspace_keys:
+                if Workspace.filter(
+                    domain_id=domain_id, workspace_id=workspace_id, user_count=None
+                ).count():
+                    self.reconcile_workspace_user_refs(domain_id, [workspace_id])
+
+    @staticmethod
+    def _count_workspace_user_refs(role_binding_vos: List[RoleBinding]) -> Counter:
+        return Counter(
+            (vo.domain_id, vo.workspace_id, vo.user_id)
+            for vo in role_binding_vos
+            if vo.resource_group == "WORKSPACE"
+        )
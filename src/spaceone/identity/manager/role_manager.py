@@ -6,6 +6,8 @@ from spaceone.core import cache, utils
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.error.error_role import ERROR_ROLE_IN_USED
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
+from spaceone.identity.lib.permission_matcher import PermissionMatcher
 from spaceone.identity.manager.managed_resource_manager import ManagedResourceManager
 from spaceone.identity.manager.role_binding_manager import RoleBindingManager
 from spaceone.identity.model.role.database import Role
@@ -48,7 +50,10 @@ class RoleManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, role_vo.to_dict())
 
-        return role_vo.update(params)
+        role_vo = role_vo.update(params)
+        self._delete_role_permission_cache(role_vo)
+
+        return role_vo
 
     def enable_role_by_vo(self, role_vo: Role) -> Role:
         self.update_role_by_vo({"state": "ENABLED"}, role_vo)
@@ -71,6 +76,7 @@ class RoleManager(BaseManager):
             )
 
         role_vo.delete()
+        RoleManager._delete_role_permission_cache(role_vo)
 
     def get_role(self, role_id: str, domain_id: str) -> Role:
         return self.role_model.get(role_id=role_id, domain_id=domain_id)
@@ -78,6 +84,27 @@ class RoleManager(BaseManager):
     def filter_roles(self, **conditions) -> QuerySet:
         return self.role_model.filter(**conditions)
 
+    def get_role_permission_matcher(
+        self, role_id: str, domain_id: str
+    ) -> PermissionMatcher:
+        role_permission_info = self.get_role_permission_info(role_id, domain_id)
+
+        return PermissionMatcher.get_matcher(
+            (domain_id, role_id, role_permission_info["version"]),
+            lambda: role_permission_info["permissions"],
+        )
+
+    @cache.cacheable(
+        key="identity:role-permission-info:{domain_id}:{role_id}", expire=3600
+    )
+    def get_role_permission_info(self, role_id: str, domain_id: str) -> dict:
+        role_vo = self.get_role(role_id, domain_id)
+
+        return {
+            "version": utils.datetime_to_iso8601(role_vo.updated_at),
+            "permissions": role_vo.permissions,
+        }
+
     def list_roles(self, query: dict, domain_id: str) -> Tuple[QuerySet, int]:
         self._create_managed_role(domain_id)
         return self.role_model.query(**query)
@@ -115,3 +142,7 @@ class RoleManager(BaseManager):
                 self.create_role(managed_role_info)
 
         return True
+
+    @staticmethod
+    def _delete_role_permission_cache(role_vo: Role) -> None:
+        InvalidationBus.role_changed(role_vo.domain_id, role_vo.role_id)
@@ -1,6 +1,5 @@
 import logging
 from typing import Tuple, List
-from jsonschema import validate, exceptions
 
 from spaceone.core import cache
 from spaceone.core.manager import BaseManager
@@ -9,6 +8,8 @@ from spaceone.identity.error.error_schema import (
     ERROR_SCHEMA_ID_IS_NOT_DEFINED,
     ERROR_INVALID_PARAMETER,
 )
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
+from spaceone.identity.lib.schema_validator import SchemaValidator
 from spaceone.identity.model.schema.database import Schema
 from spaceone.identity.manager.managed_resource_manager import ManagedResourceManager
 
@@ -24,10 +25,20 @@ class SchemaManager(BaseManager):
         def _rollback(vo: Schema):
             _LOGGER.info(f"[create_schema._rollback] Delete schema : {vo.schema}")
             vo.delete()
+            InvalidationBus.schema_changed(
+                vo.domain_id, vo.schema_id, vo.provider, vo.schema_type
+            )
 
         schema_vo = self.schema_model.create(params)
         self.transaction.add_rollback(_rollback, schema_vo)
 
+        InvalidationBus.schema_changed(
+            schema_vo.domain_id,
+            schema_vo.schema_id,
+            schema_vo.provider,
+            schema_vo.schema_type,
+        )
+
         return schema_vo
 
     def update_schema_by_vo(self, params: dict, schema_vo: Schema) -> Schema:
@@ -36,14 +47,31 @@ class SchemaManager(BaseManager):
                 f'[update_schema._rollback] Revert Data : {old_data["schema"]}'
             )
             schema_vo.update(old_data)
+            InvalidationBus.schema_changed(
+                schema_vo.domain_id,
+                schema_vo.schema_id,
+                schema_vo.provider,
+                schema_vo.schema_type,
+            )
 
         self.transaction.add_rollback(_rollback, schema_vo.to_dict())
 
-        return schema_vo.update(params)
+        schema_vo = schema_vo.update(params)
+        InvalidationBus.schema_changed(
+            schema_vo.domain_id,
+            schema_vo.schema_id,
+            schema_vo.provider,
+            schema_vo.schema_type,
+        )
+
+        return schema_vo
 
     @staticmethod
     def delete_schema_by_vo(schema_vo: Schema) -> None:
+        domain_id, schema_id = schema_vo.domain_id, schema_vo.schema_id
+        provider, schema_type = schema_vo.provider, schema_vo.schema_type
         schema_vo.delete()
+        InvalidationBus.schema_changed(domain_id, schema_id, provider, schema_type)
 
     def get_schema(self, schema_id: str, domain_id: str) -> Schema:
         return self.schema_model.get(schema_id=schema_id, domain_id=domain_id)
@@ -92,35 +120,37 @@ class SchemaManager(BaseManager):
     def validate_data_by_schema(
         self, provider: str, domain_id: str, schema_type: str, data: dict
     ) -> None:
-        schema_vos = self.filter_schemas(
-            provider=provider, domain_id=domain_id, schema_type=schema_type
+        validator = SchemaValidator.get_validator(
+            (domain_id, "provider", provider, schema_type),
+            lambda: self.filter_schemas(
+                provider=provider, domain_id=domain_id, schema_type=schema_type
+            ).first(),
         )
 
-        if len(schema_vos) > 0:
-            try:
-                validate(instance=data, schema=schema_vos[0].schema)
-            except exceptions.ValidationError as e:
-                raise ERROR_INVALID_PARAMETER(key="data", reason=e.message)
-        else:
+        if validator is None:
             raise ERROR_SCHEMA_IS_NOT_DEFINED(
                 provider=provider, schema_type=schema_type
             )
 
+        if reason := SchemaValidator.validate(validator, data):
+            raise ERROR_INVALID_PARAMETER(key="data", reason=reason)
+
     def validate_secret_data_by_schema_id(
         self, schema_id: str, domain_id: str, data: dict, schema_type: str
     ) -> None:
-        schema_vos = self.filter_schemas(
-            schema_id=schema_id,
-            domain_id=domain_id,
-            schema_type=schema_type,
+        validator = SchemaValidator.get_validator(
+            (domain_id, "schema_id", schema_id, schema_type),
+            lambda: self.filter_schemas(
+                schema_id=schema_id,
+                domain_id=domain_id,
+                schema_type=schema_type,
+            ).first(),
         )
 
-        if len(schema_vos) > 0:
-            try:
-                validate(instance=data, schema=schema_vos[0].schema)
-            except exceptions.ValidationError as e:
-                raise ERROR_INVALID_PARAMETER(key="secret_data", reason=e.message)
-        else:
+        if validator is None:
             raise ERROR_SCHEMA_ID_IS_NOT_DEFINED(
                 schema_id=schema_id, schema_type=schema_type
             )
+
+        if reason := SchemaValidator.validate(validator, data):
+            raise ERROR_INVALID_PARAMETER(key="secret_data", reason=reason)
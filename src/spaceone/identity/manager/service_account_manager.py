@@ -1,5 +1,5 @@
 import logging
-from typing import Tuple, List
+from typing import Dict, List, Tuple
 from mongoengine import QuerySet
 
 from spaceone.core.manager import BaseManager
@@ -87,6 +87,25 @@ class ServiceAccountManager(BaseManager):
     def stat_service_accounts(self, query: dict) -> dict:
         return self.service_account_model.stat(**query)
 
+    def count_service_accounts_by_workspace(
+        self, domain_id: str, workspace_ids: List[str] = None
+    ) -> Dict[str, int]:
+        match = {"domain_id": domain_id}
+        if workspace_ids is not None:
+            match["workspace_id"] = {"$in": workspace_ids}
+
+        pipeline = [
+            {"$match": match},
+            {"$group": {"_id": "$workspace_id", "count": {"$sum": 1}}},
+        ]
+
+        return {
+            result["_id"]: result["count"]
+            for result in self.service_account_model._get_collection().aggregate(
+                pipeline
+            )
+        }
+
     def update_secret_project(
         self,
         service_account_id: str,
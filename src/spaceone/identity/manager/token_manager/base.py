@@ -1,7 +1,6 @@
 import logging
 import random
 from abc import abstractmethod, ABC
-from datetime import datetime
 from typing import Union
 
 from spaceone.core import config, cache
@@ -9,7 +8,11 @@ from spaceone.core.manager import BaseManager
 from spaceone.identity.error.error_authentication import *
 
 from spaceone.identity.error.error_token import *
+from spaceone.identity.lib.access_time_buffer import AccessTimeBuffer
+from spaceone.identity.lib.claim_codec import encode_list_claim
 from spaceone.identity.lib.key_generator import KeyGenerator
+from spaceone.identity.lib.stage_timer import StageTimer
+from spaceone.identity.model.user.database import User
 
 __all__ = ["TokenManager"]
 _LOGGER = logging.getLogger(__name__)
@@ -46,6 +49,7 @@ class TokenManager(BaseManager, ABC):
         workspace_id=None,
         timeout=None,
         permissions=None,
+        encoded_permissions=None,
         projects=None,
         app_id=None,
     ):
@@ -72,23 +76,35 @@ class TokenManager(BaseManager, ABC):
         endpoints = config.get_global("ENDPOINTS")
         identity_base_url = config.get_global("IDENTITY_BASE_URL")
 
-        access_token = key_gen.generate_token(
-            "ACCESS_TOKEN",
-            timeout=timeout,
-            role_type=self.role_type,
-            workspace_id=workspace_id,
-            permissions=permissions,
-            projects=projects,
-            endpoints=endpoints,
-            identity_base_url=identity_base_url,
-        )
+        encoded_projects = None
+        if projects and self._is_compact_projects(projects):
+            with StageTimer.stage("project_encode"):
+                encoded_projects = encode_list_claim(projects)
+            projects = None
+
+        with StageTimer.stage("jwt_sign"):
+            access_token = key_gen.generate_token(
+                "ACCESS_TOKEN",
+                timeout=timeout,
+                role_type=self.role_type,
+                workspace_id=workspace_id,
+                permissions=permissions,
+                encoded_permissions=encoded_permissions,
+                projects=projects,
+                encoded_projects=encoded_projects,
+                endpoints=endpoints,
+                identity_base_url=identity_base_url,
+            )
+
+            refresh_token = key_gen.generate_token(
+                "REFRESH_TOKEN", timeout=self._get_refresh_token_timeout()
+            )
 
-        refresh_token = key_gen.generate_token(
-            "REFRESH_TOKEN", timeout=self._get_refresh_token_timeout()
-        )
         if self.owner_type != "SYSTEM":
             # todo: remove
-            self.user.update({"last_accessed_at": datetime.utcnow()})
+            AccessTimeBuffer.record(
+                User, {"user_id": self.user.user_id, "domain_id": self.user.domain_id}
+            )
 
         return {"access_token": access_token, "refresh_token": refresh_token}
 
@@ -145,6 +161,12 @@ class TokenManager(BaseManager, ABC):
 
         return refresh_timeout
 
+    def _is_compact_projects(self, projects: list) -> bool:
+        return (
+            self.CONST_COMPACT_PROJECTS
+            and len(projects) >= self.CONST_COMPACT_PROJECTS_MIN_COUNT
+        )
+
     @staticmethod
     def check_verify_code(user_id, domain_id, verify_code):
         if cache.is_set():
@@ -169,3 +191,7 @@ class TokenManager(BaseManager, ABC):
             "admin_refresh_max_timeout", 2592000
         )
         self.CONST_MAX_TOKEN_TIMEOUT = token_conf.get("token_max_timeout", 604800)
+        self.CONST_COMPACT_PROJECTS = token_conf.get("compact_projects", False)
+        self.CONST_COMPACT_PROJECTS_MIN_COUNT = token_conf.get(
+            "compact_projects_min_count", 100
+        )
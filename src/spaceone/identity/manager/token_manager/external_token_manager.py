@@ -6,6 +6,7 @@ from spaceone.identity.connector.external_auth_plugin_connector import (
 )
 from spaceone.identity.error.error_authentication import *
 from spaceone.identity.error.error_user import *
+from spaceone.identity.lib.stage_timer import StageTimer
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.external_auth_manager import ExternalAuthManager
 from spaceone.identity.manager.token_manager.base import TokenManager
@@ -33,19 +34,22 @@ class ExternalTokenManager(TokenManager):
 
         _LOGGER.debug(f"[authenticate] domain_id: {domain_id}")
 
-        self.domain: Domain = self.domain_mgr.get_domain(domain_id)
+        with StageTimer.stage("external_auth_lookup"):
+            self.domain: Domain = self.domain_mgr.get_domain(domain_id)
 
-        self._check_domain_state()
+            self._check_domain_state()
 
-        self.external_auth = self.external_auth_mgr.get_external_auth(domain_id)
+            self.external_auth = self.external_auth_mgr.get_external_auth(domain_id)
 
-        endpoint, version = self.external_auth_mgr.get_auth_plugin_endpoint(
-            self.domain.domain_id, self.external_auth.plugin_info
-        )
+        with StageTimer.stage("plugin_endpoint"):
+            endpoint, version = self.external_auth_mgr.get_auth_plugin_endpoint(
+                self.domain.domain_id, self.external_auth.plugin_info
+            )
 
-        external_auth_user_info = self._authenticate_with_plugin(
-            endpoint, credentials, domain_id
-        )
+        with StageTimer.stage("auth_plugin"):
+            external_auth_user_info = self._authenticate_with_plugin(
+                endpoint, credentials, domain_id
+            )
 
         _LOGGER.info(
             f'[authenticate] Authentication success. (user_id={external_auth_user_info.get("user_id")})'
@@ -55,9 +59,10 @@ class ExternalTokenManager(TokenManager):
             "auto_user_sync", False
         )
 
-        self._verify_user_from_plugin_user_info(
-            external_auth_user_info, domain_id, auto_user_sync
-        )
+        with StageTimer.stage("user_lookup"):
+            self._verify_user_from_plugin_user_info(
+                external_auth_user_info, domain_id, auto_user_sync
+            )
         self._check_user_state()
 
         self.is_authenticated = True
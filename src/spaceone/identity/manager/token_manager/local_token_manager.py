@@ -3,6 +3,7 @@ import logging
 from spaceone.identity.error.error_authentication import *
 from spaceone.identity.error.error_user import ERROR_USER_STATE_DISABLED
 from spaceone.identity.lib.cipher import PasswordCipher
+from spaceone.identity.lib.stage_timer import StageTimer
 from spaceone.identity.manager.user_manager import UserManager
 from spaceone.identity.manager.token_manager.base import TokenManager
 
@@ -22,23 +23,43 @@ class LocalTokenManager(TokenManager):
         user_id = credentials["user_id"]
         password = credentials["password"]
 
-        self.user = self.user_mgr.get_user(user_id, domain_id)
+        with StageTimer.stage("user_lookup"):
+            self.user = self.user_mgr.get_user(user_id, domain_id)
 
         self._check_user_state()
 
         # TODO: decrypt pw
-        is_correct = PasswordCipher().checkpw(password, self.user.password)
+        password_cipher = PasswordCipher()
+        with StageTimer.stage("password_check"):
+            is_correct = password_cipher.checkpw(password, self.user.password)
         _LOGGER.debug(f"[authenticate] is_correct: {is_correct}")
 
         if is_correct:
             self.is_authenticated = True
 
+            if password_cipher.needs_rehash(self.user.password):
+                with StageTimer.stage("password_rehash"):
+                    self._upgrade_password_hash(password_cipher, password)
+
             if self.user.state == "PENDING":
                 self.user_mgr.update_user_by_vo({"state": "ENABLED"}, self.user)
 
         else:
             raise ERROR_AUTHENTICATION_FAILURE(user_id=self.user.user_id)
 
+    def _upgrade_password_hash(
+        self, password_cipher: PasswordCipher, password: str
+    ) -> None:
+        try:
+            hashed_pw = password_cipher.hashpw(password)
+            self.user = self.user.update({"password": hashed_pw})
+            _LOGGER.debug(
+                f"[_upgrade_password_hash] upgrade password hash to {password_cipher.scheme}: {self.user.user_id}"
+            )
+        except Exception as e:
+            # the login itself succeeded, so the upgrade is retried on the next login
+            _LOGGER.error(f"[_upgrade_password_hash] failed to upgrade hash: {e}")
+
     def _check_user_state(self):
         if self.user.state == "DISABLED":
             raise ERROR_USER_STATE_DISABLED(user_id=self.user.user_id)
@@ -3,6 +3,7 @@ import logging
 from spaceone.identity.error.error_authentication import *
 from spaceone.identity.error.error_user import *
 from spaceone.identity.error.error_mfa import *
+from spaceone.identity.lib.stage_timer import StageTimer
 from spaceone.identity.manager.external_auth_manager import ExternalAuthManager
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.user_manager import UserManager
@@ -27,14 +28,16 @@ class MFATokenManager(TokenManager):
 
     def authenticate(self, domain_id: str, **kwargs):
         credentials = kwargs.get("credentials", {})
-        mfa_info = MFAManager.get_mfa_info(credentials)
+        with StageTimer.stage("mfa_lookup"):
+            mfa_info = MFAManager.get_mfa_info(credentials)
         if mfa_info is None:
             raise ERROR_INVALID_CREDENTIALS()
 
         user_id = mfa_info.get("user_id")
         domain_id = mfa_info.get("domain_id")
 
-        self.user: User = self.user_mgr.get_user(user_id, domain_id)
+        with StageTimer.stage("user_lookup"):
+            self.user: User = self.user_mgr.get_user(user_id, domain_id)
         self._check_user_state()
 
         user_mfa = self.user.mfa.to_dict()
@@ -42,7 +45,10 @@ class MFATokenManager(TokenManager):
         mfa_manager = MFAManager.get_manager_by_mfa_type(mfa_type)
 
         if verify_code := kwargs.get("verify_code"):
-            if mfa_manager.check_mfa_verify_code(credentials, verify_code):
+            with StageTimer.stage("mfa_verify"):
+                is_verified = mfa_manager.check_mfa_verify_code(credentials, verify_code)
+
+            if is_verified:
                 self.is_authenticated = True
             else:
                 raise ERROR_INVALID_CREDENTIALS()
@@ -0,0 +1,109 @@
+import logging
+from typing import List
+
+from mongoengine import Q
+from spaceone.core import cache
+from spaceone.core.manager import BaseManager
+
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
+from spaceone.identity.model.project.database import Project
+from spaceone.identity.model.project_group.database import ProjectGroup
+
+_LOGGER = logging.getLogger(__name__)
+
+_USER_PROJECTS_EXPIRE = 3600
+
+
+class UserProjectManager(BaseManager):
+    """Maintains the accessible project index of workspace members.
+
+    The index holds the project ids each user can access in a workspace:
+    PUBLIC projects, PRIVATE projects listing the user and every project
+    under the project groups listing the user. Entries are built on first
+    read and invalidated by the project and project group managers.
+
+    Entry keys include a generation of the workspace, which every
+    invalidation increases. An entry built from data read before an
+    invalidation is stored under the old generation, so it is never read.
+    Changes of the project group tree increase it with the
+    PROJECT_GROUP_TREE_CHANGED event.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.project_model = Project
+        self.project_group_model = ProjectGroup
+
+    def get_user_projects(
+        self, domain_id: str, workspace_id: str, user_id: str
+    ) -> List[str]:
+        if not cache.is_set():
+            return self._build_user_projects(domain_id, workspace_id, user_id)
+
+        generation = InvalidationBus.get_generation(
+            self._get_generation_key(domain_id, workspace_id)
+        )
+        cache_key = self._get_cache_key(domain_id, workspace_id, generation, user_id)
+
+        user_projects = cache.get(cache_key)
+        if user_projects is not None:
+            return user_projects
+
+        user_projects = self._build_user_projects(domain_id, workspace_id, user_id)
+        cache.set(cache_key, user_projects, expire=_USER_PROJECTS_EXPIRE)
+
+        return user_projects
+
+    def delete_user_projects(
+        self, domain_id: str, workspace_id: str, users: List[str]
+    ) -> None:
+        # entries of other users are rebuilt as well, but a stale entry of
+        # these users can not be stored by a concurrent read
+        if cache.is_set() and users:
+            InvalidationBus.increase_generation(
+                self._get_generation_key(domain_id, workspace_id)
+            )
+
+    @staticmethod
+    def delete_workspace_user_projects(domain_id: str, workspace_id: str) -> None:
+        InvalidationBus.project_group_tree_changed(domain_id, workspace_id)
+
+    def _build_user_projects(
+        self, domain_id: str, workspace_id: str, user_id: str
+    ) -> List[str]:
+        user_group_ids = [
+            project_group_vo.project_group_id
+            for project_group_vo in self.project_group_model.filter(
+                domain_id=domain_id, workspace_id=workspace_id, users=user_id
+            ).only("project_group_id")
+        ]
+
+        access_query = Q(project_type="PUBLIC") | Q(
+            project_type="PRIVATE", users=user_id
+        )
+
+        if user_group_ids:
+            project_group_mgr = self.locator.get_manager("ProjectGroupManager")
+            group_ids = user_group_ids + project_group_mgr.get_child_project_group_ids(
+                domain_id, user_group_ids
+            )
+            access_query = access_query | Q(project_group_id__in=group_ids)
+
+        project_vos = (
+            self.project_model.filter(domain_id=domain_id, workspace_id=workspace_id)
+            .filter(access_query)
+            .only("project_id")
+        )
+        return list({project_vo.project_id for project_vo in project_vos})
+
+    @staticmethod
+    def _get_cache_key(
+        domain_id: str, workspace_id: str, generation: int, user_id: str
+    ) -> str:
+        return (
+            f"identity:user-projects:{domain_id}:{workspace_id}:{generation}:{user_id}"
+        )
+
+    @staticmethod
+    def _get_generation_key(domain_id: str, workspace_id: str) -> str:
+        return f"identity:user-projects-generation:{domain_id}:{workspace_id}"
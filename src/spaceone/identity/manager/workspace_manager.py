@@ -2,9 +2,10 @@ import logging
 from typing import Dict, List, Tuple
 
 from mongoengine import QuerySet
-from spaceone.core import cache
+from pymongo import UpdateOne
 from spaceone.core.manager import BaseManager
 
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
 from spaceone.identity.manager.role_binding_manager import RoleBindingManager
 from spaceone.identity.model.workspace.database import Workspace
 
@@ -63,26 +64,43 @@ class WorkspaceManager(BaseManager):
                 self.rb_mgr.delete_role_binding_by_vo(rb_vo)
         workspace_vo.delete()
 
-        cache.delete_pattern(
-            f"identity:workspace-state:{workspace_vo.domain_id}:{workspace_vo.workspace_id}"
+        InvalidationBus.workspace_state_changed(
+            workspace_vo.domain_id, workspace_vo.workspace_id
         )
 
     def enable_workspace(self, workspace_vo: Workspace) -> Workspace:
         self.update_workspace_by_vo({"state": "ENABLED"}, workspace_vo)
-        cache.delete_pattern(
-            f"identity:workspace-state:{workspace_vo.domain_id}:{workspace_vo.workspace_id}"
+        InvalidationBus.workspace_state_changed(
+            workspace_vo.domain_id, workspace_vo.workspace_id
         )
 
         return workspace_vo
 
     def disable_workspace(self, workspace_vo: Workspace) -> Workspace:
         self.update_workspace_by_vo({"state": "DISABLED"}, workspace_vo)
-        cache.delete_pattern(
-            f"identity:workspace-state:{workspace_vo.domain_id}:{workspace_vo.workspace_id}"
+        InvalidationBus.workspace_state_changed(
+            workspace_vo.domain_id, workspace_vo.workspace_id
         )
 
         return workspace_vo
 
+    def bulk_update_workspaces(
+        self, domain_id: str, workspace_updates: Dict[str, dict]
+    ) -> None:
+        if not workspace_updates:
+            return
+
+        self.workspace_model._get_collection().bulk_write(
+            [
+                UpdateOne(
+                    {"domain_id": domain_id, "workspace_id": workspace_id},
+                    {"$set": params},
+                )
+                for workspace_id, params in workspace_updates.items()
+            ],
+            ordered=False,
+        )
+
     def get_workspace(self, workspace_id: str, domain_id: str) -> Workspace:
         return self.workspace_model.get(domain_id=domain_id, workspace_id=workspace_id)
 
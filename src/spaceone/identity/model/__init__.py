@@ -1,13 +1,14 @@
 from spaceone.identity.model.agent.database import Agent
 from spaceone.identity.model.app.database import App
 from spaceone.identity.model.domain.database import Domain
+from spaceone.identity.model.email_outbox.database import OutboxEmail
 from spaceone.identity.model.external_auth.database import ExternalAuth
-from spaceone.identity.model.job.database import Job
+from spaceone.identity.model.job.database import DormancyShard, Job
 from spaceone.identity.model.project.database import Project
 from spaceone.identity.model.project_group.database import ProjectGroup
 from spaceone.identity.model.provider.database import Provider
 from spaceone.identity.model.role.database import Role
-from spaceone.identity.model.role_binding.database import RoleBinding
+from spaceone.identity.model.role_binding.database import RoleBinding, WorkspaceUserRef
 from spaceone.identity.model.schema.database import Schema
 from spaceone.identity.model.service_account.database import ServiceAccount
 from spaceone.identity.model.trusted_account.database import TrustedAccount
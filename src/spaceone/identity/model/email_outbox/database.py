@@ -0,0 +1,44 @@
+from mongoengine import *
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class OutboxEmail(MongoModel):
+    """An email waiting in the outbox to be sent by a background worker.
+
+    Sent emails are deleted. Emails which failed max_attempts times are
+    kept as FAILED without their contents, which may include credentials.
+    Emails past expires_at are deleted without being sent.
+    """
+
+    email_id = StringField(max_length=40, generate_id="email", unique=True)
+    to_emails = StringField()
+    subject = StringField()
+    contents = StringField(default=None, null=True)
+    status = StringField(
+        choices=("PENDING", "SENDING", "FAILED"),
+        default="PENDING",
+    )
+    attempts = IntField(default=0)
+    error_message = StringField(default=None, null=True)
+    created_at = DateTimeField(auto_now_add=True)
+    claimed_at = DateTimeField(default=None, null=True)
+    next_attempt_at = DateTimeField(default=None, null=True)
+    expires_at = DateTimeField(default=None, null=True)
+
+    meta = {
+        "updatable_fields": [
+            "contents",
+            "status",
+            "attempts",
+            "error_message",
+            "claimed_at",
+            "next_attempt_at",
+        ],
+        "ordering": ["created_at"],
+        "indexes": [
+            "status",
+            "next_attempt_at",
+            "expires_at",
+            "created_at",
+        ],
+    }
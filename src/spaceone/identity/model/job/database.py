@@ -43,3 +43,60 @@ class Job(MongoModel):
             "domain_id",
         ],
     }
+
+
+class DormancyShard(MongoModel):
+    """A range of workspaces of a domain in a daily dormancy check.
+
+    Workspaces from start_workspace_id (inclusive) to end_workspace_id
+    (exclusive) are checked by one worker, None meaning unbounded.
+    checkpoint_workspace_id is the last checked workspace, so a shard
+    whose worker stopped is resumed from there. Shards are deleted by a TTL
+    index 14 days after they are created.
+    """
+
+    shard_id = StringField(max_length=40, generate_id="shard", unique=True)
+    run_date = StringField(max_length=10)
+    shard_index = IntField(default=0, unique_with=["domain_id", "run_date"])
+    status = StringField(
+        choices=("PENDING", "IN_PROGRESS", "FAILURE", "SUCCESS"),
+        default="PENDING",
+    )
+    start_workspace_id = StringField(max_length=40, default=None, null=True)
+    end_workspace_id = StringField(max_length=40, default=None, null=True)
+    checkpoint_workspace_id = StringField(max_length=40, default=None, null=True)
+    processed_count = IntField(default=0)
+    attempts = IntField(default=0)
+    duration = FloatField(default=None, null=True)
+    error_message = StringField(default=None, null=True)
+    domain_id = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+    started_at = DateTimeField(default=None, null=True)
+    updated_at = DateTimeField(default=None, null=True)
+    finished_at = DateTimeField(default=None, null=True)
+
+    meta = {
+        "updatable_fields": [
+            "status",
+            "checkpoint_workspace_id",
+            "processed_count",
+            "attempts",
+            "duration",
+            "error_message",
+            "started_at",
+            "updated_at",
+            "finished_at",
+        ],
+        "ordering": ["shard_index"],
+        "indexes": [
+            "status",
+            "run_date",
+            "domain_id",
+            # shards are only resumed on the next day and kept for reports
+            {
+                "fields": ["created_at"],
+                "name": "TTL_INDEX_FOR_DORMANCY_SHARD",
+                "expireAfterSeconds": 1209600,
+            },
+        ],
+    }
@@ -11,6 +11,7 @@ class ProjectGroup(MongoModel):
     is_managed = BooleanField(default=False)
     trusted_account_id = StringField(max_length=40, default=None, null=True)
     parent_group_id = StringField(max_length=40, null=True, default=None)
+    path = ListField(StringField(max_length=40), default=None, null=True)
     workspace_id = StringField(max_length=40)
     domain_id = StringField(max_length=40)
     created_at = DateTimeField(auto_now_add=True)
@@ -24,6 +25,7 @@ class ProjectGroup(MongoModel):
             "is_managed",
             "trusted_account_id",
             "parent_group_id",
+            "path",
             "last_synced_at",
         ],
         "minimal_fields": [
@@ -38,6 +40,7 @@ class ProjectGroup(MongoModel):
         "ordering": ["name"],
         "indexes": [
             "parent_group_id",
+            "path",
             "workspace_id",
             "domain_id",
         ],
@@ -49,3 +49,27 @@ class RoleBinding(MongoModel):
             },
         ],
     }
+
+
+class WorkspaceUserRef(MongoModel):
+    """Number of role bindings of a user in a workspace.
+
+    A workspace's user_count is the number of its references, so it is
+    adjusted only when a reference is created or removed.
+    """
+
+    workspace_id = StringField(max_length=40)
+    user_id = StringField(max_length=255)
+    ref_count = IntField(default=0)
+    domain_id = StringField(max_length=40)
+
+    meta = {
+        "updatable_fields": ["ref_count"],
+        "indexes": [
+            {
+                "fields": ["domain_id", "workspace_id", "user_id"],
+                "name": "COMPOUND_INDEX_FOR_WORKSPACE_USER_REF",
+                "unique": True,
+            },
+        ],
+    }
@@ -23,3 +23,10 @@ class AccountCollector(BaseAPI, account_collector_pb2_grpc.AccountCollectorServi
         account_collector_svc = AccountCollectorService(metadata)
         response: dict = account_collector_svc.sync(params)
         return self.dict_to_message(response)
+
+    def sync_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        account_collector_svc = AccountCollectorService(metadata)
+        response_iterator = account_collector_svc.sync_stream(params)
+        for response in response_iterator:
+            yield self.dict_to_message(response)
@@ -1,5 +1,5 @@
 import logging
-from typing import Union
+from typing import Generator, Union
 from spaceone.core.service import BaseService, transaction
 from spaceone.core.service.utils import convert_model
 from spaceone.identity.plugin.account_collector.model.account_collect_request import *
@@ -58,3 +58,37 @@ class AccountCollectorService(BaseService):
         func = self.get_plugin_method("sync")
         response = func(params.dict())
         return AccountsResponse(**response)
+
+    @transaction
+    @convert_model
+    def sync_stream(
+        self, params: AccountCollectorSyncRequest
+    ) -> Generator[AccountsResponse, None, None]:
+        """Sync accounts page by page
+
+        Args:
+            params (AccountCollectorSyncRequest): {
+                'options': 'dict',          # Required
+                'schema_id': 'str',
+                'secret_data': 'dict',       # Required
+                'domain_id': 'str'          # Required
+            }
+
+        Returns:
+            Generator[AccountsResponse, None, None]
+            {
+                'results': 'list[AccountResponse]'
+            }
+        """
+
+        func = self.get_plugin_method("sync_stream")
+
+        if func is None:
+            # plugin only implements unary sync
+            func = self.get_plugin_method("sync")
+            response = func(params.dict())
+            yield AccountsResponse(**response)
+        else:
+            response_iterator = func(params.dict())
+            for response in response_iterator:
+                yield AccountsResponse(**response)
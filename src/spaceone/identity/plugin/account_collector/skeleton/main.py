@@ -1,3 +1,5 @@
+from typing import Generator
+
 from spaceone.identity.plugin.account_collector.lib.server import (
     AccountCollectorPluginServer,
 )
@@ -56,3 +58,38 @@ def account_collector_sync(params: dict) -> dict:
         }
     """
     pass
+
+
+@app.route("AccountCollector.sync_stream")
+def account_collector_sync_stream(params: dict) -> Generator[dict, None, None]:
+    """AccountCollector sync by pages
+
+    Args:
+        params (AccountCollectorInit): {
+            'options': 'dict',          # Required
+            'schema_id': 'str',
+            'secret_data': 'dict',      # Required
+            'domain_id': 'str'          # Required
+        }
+
+    Returns:
+        Generator[AccountsResponse, None, None]
+        {
+            'results': [
+                {
+                    name: 'str',
+                    data: 'dict',
+                    secret_schema_id: 'str',
+                    secret_data: 'dict',
+                    tags: 'dict',
+                    location: [
+                        {
+                            'name': 'str',
+                            'resource_id': 'str'
+                        }
+                    ]
+                }
+            ]
+        }
+    """
+    pass
@@ -2,10 +2,12 @@ import logging
 from datetime import datetime, timedelta
 from typing import Union
 
+from spaceone.core import cache
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 
 from spaceone.identity.error.error_app import *
+from spaceone.identity.lib.invalidation_bus import InvalidationBus
 from spaceone.identity.manager.app_manager import AppManager
 from spaceone.identity.manager.project_group_manager import ProjectGroupManager
 from spaceone.identity.manager.project_manager import ProjectManager
@@ -312,54 +314,22 @@ class AppService(BaseService):
             None:
         """
 
-        app_vos = self.app_mgr.filter_apps(
-            client_id=params.client_id,
-            domain_id=params.domain_id,
+        generation = InvalidationBus.get_generation(
+            f"identity:app-auth-generation:{params.domain_id}"
+        )
+        app_auth_info = self._get_app_auth_info(
+            params.client_id, params.domain_id, generation
         )
-        projects = []
 
-        if app_vos.count() == 0:
+        if app_auth_info["is_denied"]:
             raise ERROR_PERMISSION_DENIED()
 
-        app_vo = app_vos[0]
-        if app_vo.state != "ENABLED":
-            raise ERROR_PERMISSION_DENIED()
-
-        domain_mgr = DomainManager()
-        domain_vo = domain_mgr.get_domain(app_vo.domain_id)
-        if domain_vo.state != "ENABLED":
-            raise ERROR_PERMISSION_DENIED()
-
-        if app_vo.role_type in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
-            workspace_mgr = WorkspaceManager()
-            workspace_vo = workspace_mgr.get_workspace(
-                app_vo.workspace_id, app_vo.domain_id
-            )
-            if workspace_vo.state != "ENABLED":
-                raise ERROR_PERMISSION_DENIED()
-
-            if app_vo.project_group_id:
-                project_group_mgr = ProjectGroupManager()
-                project_group_vo = project_group_mgr.get_project_group(
-                    app_vo.project_group_id, app_vo.domain_id
-                )
-                projects = project_group_mgr.get_projects_in_project_groups(
-                    project_group_vo.domain_id, project_group_vo.project_group_id
-                )
-
-            elif app_vo.project_id:
-                project_mgr = ProjectManager()
-                project_vo = project_mgr.get_project(
-                    app_vo.project_id, app_vo.domain_id
-                )
-                projects = [project_vo.project_id]
-
-        role_mgr = RoleManager()
-        role_vo = role_mgr.get_role(app_vo.role_id, app_vo.domain_id)
+        self.app_mgr.touch_app(app_auth_info["app_id"], params.domain_id)
 
-        self.app_mgr.update_app_by_vo({"last_accessed_at": datetime.utcnow()}, app_vo)
-
-        return CheckAppResponse(permissions=role_vo.permissions, projects=projects)
+        return CheckAppResponse(
+            permissions=app_auth_info["permissions"],
+            projects=app_auth_info["projects"],
+        )
 
     @transaction(
         permission="identity:App.read",
@@ -437,3 +407,78 @@ class AppService(BaseService):
 
         if one_year_later.strftime("%Y-%m-%d %H:%M:%S") < expired_at:
             raise ERROR_APP_EXPIRED_LIMIT(expired_at=expired_at)
+
+    @cache.cacheable(
+        key="identity:app-auth:{domain_id}:{generation}:{client_id}", expire=3600
+    )
+    def _get_app_auth_info(
+        self, client_id: str, domain_id: str, generation: int
+    ) -> dict:
+        """Resolves the permissions and projects of an API key.
+
+        Denials are cached as well, so unknown or disabled keys do not hit
+        the database on every request. Entries are deleted when the app
+        changes, and keys include a generation of the domain which increases
+        when a role, a project group tree or the state of a workspace or
+        domain changes.
+        """
+
+        app_auth_info = {
+            "is_denied": True,
+            "app_id": None,
+            "permissions": [],
+            "projects": [],
+        }
+
+        app_vos = self.app_mgr.filter_apps(client_id=client_id, domain_id=domain_id)
+
+        if app_vos.count() == 0:
+            return app_auth_info
+
+        app_vo = app_vos[0]
+        if app_vo.state != "ENABLED":
+            return app_auth_info
+
+        domain_mgr = DomainManager()
+        domain_vo = domain_mgr.get_domain(app_vo.domain_id)
+        if domain_vo.state != "ENABLED":
+            return app_auth_info
+
+        projects = []
+        if app_vo.role_type in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
+            workspace_mgr = WorkspaceManager()
+            workspace_vo = workspace_mgr.get_workspace(
+                app_vo.workspace_id, app_vo.domain_id
+            )
+            if workspace_vo.state != "ENABLED":
+                return app_auth_info
+
+            if app_vo.project_group_id:
+                project_group_mgr = ProjectGroupManager()
+                project_group_vo = project_group_mgr.get_project_group(
+                    app_vo.project_group_id, app_vo.domain_id
+                )
+                projects = project_group_mgr.get_projects_in_project_groups(
+                    project_group_vo.domain_id, project_group_vo.project_group_id
+                )
+
+            elif app_vo.project_id:
+                project_mgr = ProjectManager()
+                project_vo = project_mgr.get_project(
+                    app_vo.project_id, app_vo.domain_id
+                )
+                projects = [project_vo.project_id]
+
+        role_mgr = RoleManager()
+        role_vo = role_mgr.get_role(app_vo.role_id, app_vo.domain_id)
+
+        app_auth_info.update(
+            {
+                "is_denied": False,
+                "app_id": app_vo.app_id,
+                "permissions": role_vo.permissions,
+                "projects": projects,
+            }
+        )
+
+        return app_auth_info
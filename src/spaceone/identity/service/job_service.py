@@ -1,21 +1,23 @@
 import logging
-import random
 from datetime import datetime, timedelta
-from typing import Union, List
+from typing import Dict, List, Union
 
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 from spaceone.core import config
 
-from spaceone.identity.conf.global_conf import WORKSPACE_COLORS_NAME
 from spaceone.identity.error.error_job import *
+from spaceone.identity.lib.email_outbox import EmailOutbox
+from spaceone.identity.lib.job_dispatcher import JobDispatcher
 from spaceone.identity.manager.account_collector_plugin_manager import (
     AccountCollectorPluginManager,
 )
+from spaceone.identity.manager.account_sync_manager import AccountSyncManager
 from spaceone.identity.manager.job_manager import JobManager
 from spaceone.identity.manager.project_manager import ProjectManager
 from spaceone.identity.manager.project_group_manager import ProjectGroupManager
 from spaceone.identity.manager.provider_manager import ProviderManager
+from spaceone.identity.manager.role_binding_manager import RoleBindingManager
 from spaceone.identity.manager.schema_manager import SchemaManager
 from spaceone.identity.manager.service_account_manager import ServiceAccountManager
 from spaceone.identity.manager.secret_manager import SecretManager
@@ -24,12 +26,10 @@ from spaceone.identity.manager.workspace_manager import WorkspaceManager
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.config_manager import ConfigManager
 from spaceone.identity.manager.cost_analysis_manager import CostAnalysisManager
-from spaceone.identity.model.project.database import Project
-from spaceone.identity.model.project_group.database import ProjectGroup
+from spaceone.identity.manager.dormancy_shard_manager import DormancyShardManager
 from spaceone.identity.model.provider.database import Provider
-from spaceone.identity.model.service_account.database import ServiceAccount
 from spaceone.identity.model.trusted_account.database import TrustedAccount
-from spaceone.identity.model.job.database import Job
+from spaceone.identity.model.job.database import DormancyShard, Job
 from spaceone.identity.model.job.request import *
 from spaceone.identity.model.job.response import *
 from spaceone.identity.model.workspace.database import Workspace
@@ -68,14 +68,23 @@ class JobService(BaseService):
 
         current_hour = params.get("current_hour", datetime.utcnow().hour)
 
-        for trusted_account_vo in self._get_all_schedule_enabled_trusted_accounts(
-            current_hour
-        ):
-            try:
-                self.create_service_account_job(trusted_account_vo, {})
-            except Exception as e:
-                _LOGGER.error(
-                    f"[create_jobs_by_trusted_account] sync error: {e}", exc_info=True
+        identity_conf = config.get_global("IDENTITY") or {}
+        dispatcher_conf = identity_conf.get("job_dispatcher", {})
+
+        with JobDispatcher(
+            max_workers=dispatcher_conf.get("max_workers", 8),
+            max_tasks_per_key=dispatcher_conf.get("max_jobs_per_plugin", 2),
+            meta=self.transaction.meta,
+        ) as job_dispatcher:
+            for trusted_account_vo in self._get_all_schedule_enabled_trusted_accounts(
+                current_hour
+            ):
+                # limit concurrent requests to the same account collector plugin
+                job_dispatcher.submit(
+                    trusted_account_vo.provider,
+                    self.create_service_account_job,
+                    trusted_account_vo,
+                    {},
                 )
 
     @transaction(
@@ -189,6 +198,75 @@ class JobService(BaseService):
 
         return self.job_mgr.stat_jobs(query)
 
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def reconcile_workspace_user_count(self, params: dict) -> None:
+        """Reconcile user_count of workspaces by domains
+        Args:
+            params (dict): {}
+        Returns:
+            None:
+        """
+
+        domain_mgr = DomainManager()
+
+        domain_vos = domain_mgr.filter_domains(state="ENABLED")
+        for domain_vo in domain_vos:
+            self.job_mgr.push_workspace_user_count_job(
+                {"domain_id": domain_vo.domain_id}
+            )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def reconcile_workspace_user_count_by_domain(self, params: dict) -> None:
+        """Reconcile user_count of workspaces in a domain with its role bindings
+        Args:
+            params (dict): {
+                'domain_id': 'str'
+            }
+        Returns:
+            None:
+        """
+
+        domain_id = params["domain_id"]
+
+        rb_mgr = RoleBindingManager()
+        fixed_count = rb_mgr.reconcile_workspace_user_refs(domain_id)
+
+        if fixed_count > 0:
+            _LOGGER.warning(
+                f"[reconcile_workspace_user_count_by_domain] user_count of {fixed_count} workspaces is corrected. ({domain_id})"
+            )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def migrate_project_group_path(self, params: dict) -> None:
+        """Set path of project groups created before it was maintained
+        Args:
+            params (dict): {}
+        Returns:
+            None:
+        """
+
+        project_group_mgr = ProjectGroupManager()
+
+        for domain_id in project_group_mgr.list_domains_without_project_group_path():
+            updated_count = project_group_mgr.migrate_project_group_path(domain_id)
+            _LOGGER.info(
+                f"[migrate_project_group_path] path of {updated_count} project groups is set. ({domain_id})"
+            )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def drain_email_outbox(self, params: dict) -> None:
+        """Send the emails left in the outbox, e.g. by a stopped process
+        Args:
+            params (dict): {}
+        Returns:
+            None:
+        """
+
+        sent_count = EmailOutbox.drain_all()
+
+        if sent_count > 0:
+            _LOGGER.debug(f"[drain_email_outbox] {sent_count} emails are claimed.")
+
     @transaction(exclude=["authentication", "authorization", "mutation"])
     def check_dormancy(self, params: dict) -> None:
         """Check dormancy by domains
@@ -206,7 +284,7 @@ class JobService(BaseService):
 
     @transaction(exclude=["authentication", "authorization", "mutation"])
     def check_dormancy_by_domain(self, params: dict) -> None:
-        """Check dormancy by domains
+        """Split the dormancy check of a domain into shards of workspaces
         Args:
             params (dict): {
                 'domain_id': 'str'
@@ -216,39 +294,208 @@ class JobService(BaseService):
         """
 
         domain_id = params["domain_id"]
+        run_date = datetime.utcnow().strftime("%Y-%m-%d")
+        shard_size = config.get_global("DORMANCY_SHARD_SIZE", 500)
+
+        dormancy_shard_mgr = DormancyShardManager()
+        shard_vos = dormancy_shard_mgr.create_shards(domain_id, run_date, shard_size)
+
+        for shard_vo in shard_vos:
+            self.job_mgr.push_dormancy_shard_job(
+                {"domain_id": domain_id, "shard_id": shard_vo.shard_id}
+            )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def check_dormancy_by_shard(self, params: dict) -> None:
+        """Check dormancy of the workspaces in a shard
+        Args:
+            params (dict): {
+                'domain_id': 'str',
+                'shard_id': 'str'
+            }
+        Returns:
+            None:
+        """
+
+        domain_id = params["domain_id"]
+        shard_id = params["shard_id"]
+        lease = config.get_global("DORMANCY_SHARD_LEASE", 1800)
+        max_attempts = config.get_global("DORMANCY_SHARD_MAX_ATTEMPTS", 3)
+
+        dormancy_shard_mgr = DormancyShardManager()
+        shard_vo = dormancy_shard_mgr.claim_shard(shard_id, lease, max_attempts)
+
+        if shard_vo is None:
+            _LOGGER.debug(
+                f"[check_dormancy_by_shard] shard is finished or in progress: {shard_id}"
+            )
+            return
+
+        try:
+            shard_vo = self._check_dormancy_by_shard(dormancy_shard_mgr, shard_vo)
+        except Exception as e:
+            dormancy_shard_mgr.finish_shard(shard_vo, "FAILURE", str(e))
+            raise e
+
+        shard_vo = dormancy_shard_mgr.finish_shard(shard_vo, "SUCCESS")
+        _LOGGER.info(
+            f"[check_dormancy_by_shard] shard {shard_vo.shard_index} of {domain_id} "
+            f"({shard_vo.run_date}): {shard_vo.processed_count} workspaces in "
+            f"{shard_vo.duration:.3f}s (attempts = {shard_vo.attempts})"
+        )
+
+        self._report_dormancy_run(dormancy_shard_mgr, domain_id, shard_vo.run_date)
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def resume_dormancy_shards(self, params: dict) -> None:
+        """Push the shards of recent dormancy checks again if their worker stopped
+        Args:
+            params (dict): {}
+        Returns:
+            None:
+        """
+
+        now = datetime.utcnow()
+        lease = config.get_global("DORMANCY_SHARD_LEASE", 1800)
+        max_attempts = config.get_global("DORMANCY_SHARD_MAX_ATTEMPTS", 3)
+        shard_size = config.get_global("DORMANCY_SHARD_SIZE", 500)
+
+        dormancy_shard_mgr = DormancyShardManager()
+
+        # a run stopped shortly before midnight is resumed on the next day
+        for run_date in [
+            (now - timedelta(days=1)).strftime("%Y-%m-%d"),
+            now.strftime("%Y-%m-%d"),
+        ]:
+            # a worker stopped while planning the shards of a domain
+            for domain_id in dormancy_shard_mgr.filter_unfinished_plans(
+                run_date, lease
+            ):
+                _LOGGER.info(
+                    f"[resume_dormancy_shards] continue planning of {domain_id} "
+                    f"({run_date})"
+                )
+                for shard_vo in dormancy_shard_mgr.create_shards(
+                    domain_id, run_date, shard_size
+                ):
+                    self.job_mgr.push_dormancy_shard_job(
+                        {"domain_id": domain_id, "shard_id": shard_vo.shard_id}
+                    )
+
+            shard_vos = dormancy_shard_mgr.filter_resumable_shards(
+                run_date, lease, max_attempts
+            )
+
+            for shard_vo in shard_vos:
+                _LOGGER.info(
+                    f"[resume_dormancy_shards] resume shard {shard_vo.shard_index} of "
+                    f"{shard_vo.domain_id} ({run_date}) from "
+                    f"{shard_vo.checkpoint_workspace_id}"
+                )
+                self.job_mgr.push_dormancy_shard_job(
+                    {"domain_id": shard_vo.domain_id, "shard_id": shard_vo.shard_id}
+                )
+
+    def _check_dormancy_by_shard(
+        self, dormancy_shard_mgr: DormancyShardManager, shard_vo: DormancyShard
+    ) -> DormancyShard:
+        domain_id = shard_vo.domain_id
+        batch_size = config.get_global("DORMANCY_BATCH_SIZE", 100)
+
+        conditions = {"domain_id": domain_id}
+        if shard_vo.checkpoint_workspace_id:
+            conditions["workspace_id__gt"] = shard_vo.checkpoint_workspace_id
+        elif shard_vo.start_workspace_id:
+            conditions["workspace_id__gte"] = shard_vo.start_workspace_id
+
+        if shard_vo.end_workspace_id:
+            conditions["workspace_id__lt"] = shard_vo.end_workspace_id
+
+        workspace_vos = [
+            workspace_vo
+            for workspace_vo in self.workspace_mgr.filter_workspaces(
+                **conditions
+            ).order_by("workspace_id")
+            if not self._is_dormancy_updated(workspace_vo)
+        ]
+
+        if not workspace_vos:
+            return shard_vo
+
         dormancy_settings = self._get_dormancy_settings(domain_id)
+        month_costs = self._get_this_month_costs(
+            CostAnalysisManager(),
+            domain_id,
+            [workspace_vo.workspace_id for workspace_vo in workspace_vos],
+        )
+
+        for index in range(0, len(workspace_vos), batch_size):
+            batch_workspace_vos = workspace_vos[index : index + batch_size]
+            self._update_workspace_dormancy(
+                domain_id, batch_workspace_vos, dormancy_settings, month_costs
+            )
+            shard_vo = dormancy_shard_mgr.save_checkpoint(
+                shard_vo,
+                batch_workspace_vos[-1].workspace_id,
+                len(batch_workspace_vos),
+            )
+
+        return shard_vo
+
+    @staticmethod
+    def _report_dormancy_run(
+        dormancy_shard_mgr: DormancyShardManager, domain_id: str, run_date: str
+    ) -> None:
+        shard_vos = dormancy_shard_mgr.filter_shards(
+            domain_id=domain_id, run_date=run_date
+        )
+
+        if any(shard_vo.status != "SUCCESS" for shard_vo in shard_vos):
+            return
+
+        shard_durations = {
+            shard_vo.shard_index: shard_vo.duration for shard_vo in shard_vos
+        }
+        _LOGGER.info(
+            f"[check_dormancy_by_shard] finished dormancy check of {domain_id} "
+            f"({run_date}): {len(shard_durations)} shards, "
+            f"{sum(shard_vo.processed_count for shard_vo in shard_vos)} workspaces, "
+            f"max duration = {max(shard_durations.values()):.3f}s, "
+            f"durations = {shard_durations}"
+        )
+
+    def _update_workspace_dormancy(
+        self,
+        domain_id: str,
+        workspace_vos: List[Workspace],
+        dormancy_settings: dict,
+        month_costs: Dict[str, float],
+    ) -> None:
         dormancy_state = dormancy_settings.get("state")
         threshold = dormancy_settings.get("cost")
         dormancy_send_email = dormancy_settings.get("send_email")
 
-        cost_analysis_mgr = CostAnalysisManager()
+        service_account_counts = (
+            self.service_account_mgr.count_service_accounts_by_workspace(
+                domain_id, [workspace_vo.workspace_id for workspace_vo in workspace_vos]
+            )
+        )
 
-        workspace_vos = self.workspace_mgr.filter_workspaces(domain_id=domain_id)
+        workspace_updates = {}
         for workspace_vo in workspace_vos:
-            if self._is_dormancy_updated(workspace_vo):
-                continue
-
             cost_info = workspace_vo.cost_info or {}
             before_month_cost = cost_info.get("month", 0)
             before_dormant_ttl = workspace_vo.dormant_ttl or -1
             before_is_dormant = workspace_vo.is_dormant
 
+            workspace_id = workspace_vo.workspace_id
             update_params = {
                 "is_dormant": workspace_vo.is_dormant,
                 "dormant_ttl": workspace_vo.dormant_ttl,
-                "service_account_count": workspace_vo.service_account_count,
+                "service_account_count": service_account_counts.get(workspace_id, 0),
             }
 
-            workspace_id = workspace_vo.workspace_id
-            service_account_vos = self.service_account_mgr.filter_service_accounts(
-                domain_id=domain_id, workspace_id=workspace_id
-            )
-
-            update_params["service_account_count"] = service_account_vos.count()
-
-            month_cost = self._get_this_month_cost(
-                cost_analysis_mgr, domain_id, workspace_id
-            )
+            month_cost = month_costs.get(workspace_id, 0)
 
             day_cost = month_cost - before_month_cost
             if day_cost < 0:
@@ -259,7 +506,7 @@ class JobService(BaseService):
             if dormancy_state == "ENABLED" and before_dormant_ttl >= 0:
                 if day_cost <= threshold:
                     _LOGGER.debug(
-                        f"[check_dormancy_by_domain] change dormant: {workspace_vo.name}"
+                        f"[_update_workspace_dormancy] change dormant: {workspace_vo.name}"
                     )
                     update_params["is_dormant"] = True
 
@@ -276,14 +523,16 @@ class JobService(BaseService):
                 else:
                     if before_is_dormant:
                         _LOGGER.debug(
-                            f"[check_dormancy_by_domain] change active: {workspace_vo.name}"
+                            f"[_update_workspace_dormancy] change active: {workspace_vo.name}"
                         )
 
                     update_params["is_dormant"] = False
                     update_params["dormant_ttl"] = 3
 
             update_params["dormant_updated_at"] = datetime.utcnow()
-            self.workspace_mgr.update_workspace_by_vo(update_params, workspace_vo)
+            workspace_updates[workspace_id] = update_params
+
+        self.workspace_mgr.bulk_update_workspaces(domain_id, workspace_updates)
 
     @staticmethod
     def _is_dormancy_updated(workspace_vo: Workspace) -> bool:
@@ -302,35 +551,39 @@ class JobService(BaseService):
             return False
 
     @staticmethod
-    def _get_this_month_cost(
+    def _get_this_month_costs(
         cost_analysis_mgr: CostAnalysisManager,
         domain_id: str,
-        workspace_id: str,
-    ) -> float:
+        workspace_ids: List[str],
+    ) -> Dict[str, float]:
         system_token = config.get_global("TOKEN")
         now = datetime.utcnow()
         report_month = now.strftime("%Y-%m")
 
-        # Get Monthly Cost
+        # Get Monthly Cost of all workspaces at once
         params = {
             "status": "IN_PROGRESS",
             "query": {
                 "filter": [
                     {"k": "report_month", "v": report_month, "o": "eq"},
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                ]
+                    {"k": "workspace_id", "v": workspace_ids, "o": "in"},
+                ],
+                "only": ["workspace_id", "currency", "cost"],
             },
         }
 
         response = cost_analysis_mgr.list_cost_reports(
             params, token=system_token, x_domain_id=domain_id
         )
-        results = response.get("results", [])
-        if len(results) > 0:
-            currency = results[0]["currency"]
-            return results[0]["cost"][currency]
-        else:
-            return 0
+
+        month_costs = {}
+        for cost_report_info in response.get("results", []):
+            workspace_id = cost_report_info.get("workspace_id")
+            if workspace_id and workspace_id not in month_costs:
+                currency = cost_report_info["currency"]
+                month_costs[workspace_id] = cost_report_info["cost"][currency]
+
+        return month_costs
 
     @staticmethod
     def _get_dormancy_settings(domain_id: str) -> dict:
@@ -425,67 +678,30 @@ class JobService(BaseService):
 
                 is_canceled = False
 
-                response = self.account_collector_plugin_mgr.sync(
-                    endpoint, options, secret_data, domain_id, schema_id
+                account_sync_mgr = AccountSyncManager(
+                    trusted_account_id,
+                    trusted_secret_id,
+                    provider,
+                    trusted_account_vo.resource_group,
+                    domain_id,
+                    workspace_id,
+                    sync_options,
                 )
 
-                for result in response.get("results", []):
-                    location: List[dict] = self._get_location(
-                        result, trusted_account_vo.resource_group, sync_options
-                    )
-
-                    if trusted_account_vo.resource_group == "DOMAIN":
-                        if sync_options.get("single_workspace_id"):
-                            workspace_vo = self.workspace_mgr.get_workspace(
-                                sync_options.get("single_workspace_id"), domain_id
-                            )
-                        elif location:
-                            location_info = location.pop(0)
-                            workspace_vo = self._create_workspace(
-                                domain_id, trusted_account_id, location_info
-                            )
-                        else:
-                            _LOGGER.debug(
-                                f"[sync_service_accounts] location is empty => SKIP"
-                            )
-                            continue
-
-                        sync_workspace_id = workspace_vo.workspace_id
-
-                    else:
-                        sync_workspace_id = workspace_id
-
-                    parent_group_id = None
-                    for location_info in location:
-                        project_group_vo = self._create_project_group(
-                            domain_id,
-                            sync_workspace_id,
-                            trusted_account_id,
-                            location_info,
-                            parent_group_id,
-                        )
-                        parent_group_id = project_group_vo.project_group_id
-
-                    project_vo = self._create_project(
-                        result,
-                        domain_id,
-                        sync_workspace_id,
-                        trusted_account_id,
-                        project_group_id=parent_group_id,
-                        sync_options=sync_options,
-                    )
-                    self._create_service_account(
-                        result,
-                        project_vo,
-                        trusted_account_id,
-                        trusted_secret_id,
-                        provider,
-                        sync_options,
+                synced_count = 0
+                for results in self.account_collector_plugin_mgr.sync_stream(
+                    endpoint, options, secret_data, domain_id, schema_id
+                ):
+                    synced_count += account_sync_mgr.sync(results)
+                    _LOGGER.debug(
+                        f"[sync_service_accounts] synced accounts ({job_vo.job_id}): {synced_count}"
                     )
 
-                if self._is_job_failed(job_id, domain_id, job_vo.workspace_id):
-                    self.job_mgr.change_canceled_status(job_vo)
-                    is_canceled = True
+                    # stop consuming pages as soon as the job is canceled
+                    if self._is_job_failed(job_id, domain_id, job_vo.workspace_id):
+                        self.job_mgr.change_canceled_status(job_vo)
+                        is_canceled = True
+                        break
 
                 if not is_canceled:
                     end_dt = datetime.utcnow()
@@ -658,310 +874,3 @@ class JobService(BaseService):
             self.job_mgr.change_success_status(job_vo)
         elif job_vo.status == "FAILURE":
             self.job_mgr.update_job_by_vo({"finished_at": datetime.utcnow()}, job_vo)
-
-    def _create_workspace(
-        self, domain_id: str, trusted_account_id: str, location_info: dict
-    ) -> Workspace:
-        name = location_info.get("name")
-        reference_id = location_info.get("resource_id")
-
-        workspace_vos = self.workspace_mgr.filter_workspaces(
-            domain_id=domain_id, name=name
-        )
-
-        _LOGGER.debug(
-            f"[_create_workspace] 'name': '{name}', 'domain_id': '{domain_id}', count: {len(workspace_vos)}"
-        )
-
-        params = {"trusted_account_id": trusted_account_id, "is_managed": True}
-        if workspace_vos:
-            workspace_vo = workspace_vos[0]
-
-            if not workspace_vo.references:
-                params["references"] = [reference_id]
-            elif reference_id not in workspace_vo.references:
-                params["references"] = workspace_vo.references + [reference_id]
-
-            params["last_synced_at"] = datetime.utcnow()
-            _LOGGER.debug(f"[_create_workspace] update workspace: {params}")
-
-            workspace_vo = self.workspace_mgr.update_workspace_by_vo(
-                params, workspace_vo
-            )
-
-            self._remove_old_reference_id_from_workspace(
-                domain_id, workspace_vo.workspace_id, reference_id
-            )
-        else:
-            params.update(
-                {
-                    "name": name,
-                    "tags": self._set_workspace_theme(),
-                    "domain_id": domain_id,
-                    "last_synced_at": datetime.utcnow(),
-                    "references": [reference_id],
-                }
-            )
-            workspace_vo = self.workspace_mgr.create_workspace(params)
-        return workspace_vo
-
-    def _create_project_group(
-        self,
-        domain_id: str,
-        workspace_id: str,
-        trusted_account_id: str,
-        location_info: dict,
-        parent_group_id: str = None,
-    ) -> ProjectGroup:
-        name = location_info["name"]
-        reference_id = location_info["resource_id"]
-
-        filter_params = {
-            "is_managed": True,
-            "reference_id": reference_id,
-            "domain_id": domain_id,
-            "workspace_id": workspace_id,
-        }
-
-        project_group_vos = self.project_group_mgr.filter_project_groups(
-            **filter_params
-        )
-
-        params = {
-            "trusted_account_id": trusted_account_id,
-        }
-        if parent_group_id:
-            params.update({"parent_group_id": parent_group_id})
-
-        if project_group_vos:
-            project_group_vo = project_group_vos[0]
-            if project_group_vo.name != name:
-                params.update({"name": name})
-
-            params.update({"last_synced_at": datetime.utcnow()})
-            project_group_vo = self.project_group_mgr.update_project_group_by_vo(
-                params, project_group_vo
-            )
-
-        else:
-            params.update(
-                {
-                    "name": name,
-                    "reference_id": reference_id,
-                    "is_managed": True,
-                    "domain_id": domain_id,
-                    "workspace_id": workspace_id,
-                    "last_synced_at": datetime.utcnow(),
-                }
-            )
-            if parent_group_id:
-                params["parent_group_id"] = parent_group_id
-            project_group_vo = self.project_group_mgr.create_project_group(params)
-
-        return project_group_vo
-
-    def _create_project(
-        self,
-        result: dict,
-        domain_id: str,
-        workspace_id: str,
-        trusted_account_id: str,
-        project_group_id: str = None,
-        sync_options: dict = None,
-        project_type: str = "PRIVATE",
-    ) -> Project:
-        name = result["name"]
-        reference_id = result["resource_id"]
-
-        params = {
-            "domain_id": domain_id,
-            "workspace_id": workspace_id,
-            "project_type": project_type,
-            "reference_id": reference_id,
-            "is_managed": True,
-        }
-
-        project_vos = self.project_mgr.filter_projects(**params)
-        _LOGGER.debug(
-            f"[_create_service_account] project_vos: 'name': '{name}', 'params': '{params}' count: {len(project_vos)}"
-        )
-
-        if project_group_id:
-            params["project_group_id"] = project_group_id
-
-        if project_vos:
-            project_vo = project_vos[0]
-            if project_vo.name != name:
-                params.update({"name": name})
-
-            params.update(
-                {
-                    "trusted_account_id": trusted_account_id,
-                    "last_synced_at": datetime.utcnow(),
-                }
-            )
-            project_vo = self.project_mgr.update_project_by_vo(params, project_vo)
-        else:
-            params.update({"name": name, "last_synced_at": datetime.utcnow()})
-            project_vo = self.project_mgr.create_project(params)
-        return project_vo
-
-    def _create_service_account(
-        self,
-        result: dict,
-        project_vo: Project,
-        trusted_account_id: str,
-        trusted_secret_id: str,
-        provider: str,
-        sync_options: dict = None,
-    ) -> Union[ServiceAccount, None]:
-        domain_id = project_vo.domain_id
-        workspace_id = project_vo.workspace_id
-        project_id = project_vo.project_id
-        name = result["name"]
-        reference_id = result["resource_id"]
-        secret_data = result.get("secret_data", {})
-        data = result.get("data", {})
-        secret_schema_id = result.get("secret_schema_id")
-        tags = result.get("tags", {})
-
-        params = {
-            "provider": provider,
-            "reference_id": reference_id,
-            "is_managed": True,
-            "domain_id": domain_id,
-            "workspace_id": workspace_id,
-            "project_id": project_id,
-        }
-
-        service_account_vos = self.service_account_mgr.filter_service_accounts(**params)
-        _LOGGER.debug(
-            f"[_create_service_account] service_account_vos: {name} {params} count: {len(service_account_vos)}"
-        )
-
-        if service_account_vos:
-            service_account_vo = service_account_vos[0]
-            update_params = {}
-            if service_account_vo.name != result["name"]:
-                update_params.update({"name": name})
-
-            update_params = {
-                "trusted_account_id": trusted_account_id,
-                "last_synced_at": datetime.utcnow(),
-            }
-
-            service_account_vo = self.service_account_mgr.update_service_account_by_vo(
-                update_params, service_account_vo
-            )
-        else:
-            params.update(
-                {
-                    "name": name,
-                    "data": data,
-                    "trusted_account_id": trusted_account_id,
-                    "tags": tags,
-                    "last_synced_at": datetime.utcnow(),
-                }
-            )
-            if secret_schema_id:
-                params["schema_id"] = secret_schema_id
-
-            service_account_vo = self.service_account_mgr.create_service_account(params)
-
-        if secret_data:
-            secret_mgr: SecretManager = self.locator.get_manager("SecretManager")
-            secret_id = service_account_vo.secret_id
-            secret_total_count = 0
-
-            if secret_id:
-                response = secret_mgr.list_secrets({"secret_id": secret_id}, domain_id)
-                secret_total_count = response.get("total_count", 0)
-
-            if secret_total_count > 0:
-                update_secret_params = {
-                    "secret_id": service_account_vo.secret_id,
-                    "data": secret_data,
-                    "schema_id": secret_schema_id,
-                }
-                secret_mgr.update_secret_data(
-                    update_secret_params, domain_id, workspace_id
-                )
-            else:
-
-                # Check secret_data by schema
-                schema_mgr = SchemaManager()
-                schema_mgr.validate_secret_data_by_schema_id(
-                    secret_schema_id,
-                    service_account_vo.domain_id,
-                    secret_data,
-                    "TRUSTING_SECRET",
-                )
-
-                create_secret_params = {
-                    "name": f"{service_account_vo.service_account_id}-secret",
-                    "data": secret_data,
-                    "resource_group": "PROJECT",
-                    "workspace_id": workspace_id,
-                    "project_id": project_id,
-                    "service_account_id": service_account_vo.service_account_id,
-                    "trusted_secret_id": trusted_secret_id,
-                    "schema_id": secret_schema_id,
-                }
-                secret_info = secret_mgr.create_secret(create_secret_params, domain_id)
-                service_account_vo = (
-                    self.service_account_mgr.update_service_account_by_vo(
-                        {"secret_id": secret_info["secret_id"]}, service_account_vo
-                    )
-                )
-        return service_account_vo
-
-    def _remove_old_reference_id_from_workspace(
-        self, domain_id: str, workspace_id: str, reference_id: str
-    ) -> None:
-        query = {
-            "filter": [
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "workspace_id", "v": workspace_id, "o": "not"},
-                {"k": "references", "v": [reference_id], "o": "in"},
-            ],
-        }
-        workspace_vos, _ = self.workspace_mgr.list_workspaces(query)
-        for workspace_vo in workspace_vos:
-            references = workspace_vo.references
-            references.remove(reference_id)
-            self.workspace_mgr.update_workspace_by_vo(
-                {"references": references}, workspace_vo
-            )
-
-    @staticmethod
-    def _get_location(result: dict, resource_group: str, sync_options: dict) -> list:
-        location = result.get("location", [])
-        skip_project_group_option = sync_options.get("skip_project_group")
-
-        if skip_project_group_option:
-            if resource_group == "DOMAIN":
-                if location:
-                    location = [location[0]]
-            else:
-                location = []
-
-        else:
-            if resource_group == "DOMAIN" and not location:
-                _LOGGER.debug(
-                    f"[_get_location] location is empty: {result} {sync_options} => SKIP"
-                )
-                # raise ERROR_REQUIRED_PARAMETER(
-                #     key="location", reason="location is required"
-                # )
-
-        return location
-
-    @staticmethod
-    def _set_workspace_theme(tags: dict = None) -> dict:
-        theme = random.choice(WORKSPACE_COLORS_NAME)
-        if tags:
-            tags.update({"theme": theme})
-        else:
-            tags = {"theme": theme}
-
-        return tags
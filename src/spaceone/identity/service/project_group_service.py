@@ -1,7 +1,6 @@
 import logging
 from typing import Union, List
 
-from mongoengine import QuerySet
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 
@@ -131,15 +130,13 @@ class ProjectGroupService(BaseService):
             )
 
             # Check parent project group is not sub project group
-            project_group_vos = self.project_group_mgr.filter_project_groups(
-                workspace_id=params.workspace_id, domain_id=params.domain_id
-            )
-
-            self._check_is_sub_project_group(
-                params.parent_group_id,
-                project_group_vo.project_group_id,
-                project_group_vos,
+            parent_group_path = self.project_group_mgr.get_project_group_path(
+                params.domain_id, params.parent_group_id
             )
+            if project_group_vo.project_group_id in parent_group_path:
+                raise ERROR_NOT_ALLOWED_TO_CHANGE_PARENT_GROUP_TO_SUB_PROJECT_GROUP(
+                    project_group_id=params.parent_group_id
+                )
 
         project_group_vo = self.project_group_mgr.update_project_group_by_vo(
             params.dict(), project_group_vo
@@ -336,26 +333,6 @@ class ProjectGroupService(BaseService):
         query = params.query or {}
         return self.project_group_mgr.stat_project_groups(query)
 
-    def _check_is_sub_project_group(
-        self,
-        change_parent_group_id: str,
-        cur_group_id: str,
-        project_group_vos: QuerySet,
-    ) -> Union[None, Exception]:
-        for project_group_vo in project_group_vos:
-            if project_group_vo.parent_group_id == cur_group_id:
-                if change_parent_group_id == project_group_vo.project_group_id:
-                    raise ERROR_NOT_ALLOWED_TO_CHANGE_PARENT_GROUP_TO_SUB_PROJECT_GROUP(
-                        project_group_id=change_parent_group_id
-                    )
-                else:
-                    return self._check_is_sub_project_group(
-                        change_parent_group_id,
-                        project_group_vo.project_group_id,
-                        project_group_vos,
-                    )
-        return None
-
     def _check_workspace_member_permission(
         self, project_group_vo: ProjectGroup
     ) -> None:
@@ -350,7 +350,9 @@ class ProjectService(BaseService):
         query = params.query or {}
 
         if include_children and project_group_id:
-            project_group_ids = self._get_child_group_ids(project_group_id)
+            project_group_ids = self.project_group_mgr.get_child_project_group_ids(
+                params.domain_id, project_group_id
+            )
             project_group_ids.append(project_group_id)
             query["filter"].append(
                 {"k": "project_group_id", "v": project_group_ids, "o": "in"}
@@ -390,14 +392,3 @@ class ProjectService(BaseService):
 
         query = params.query or {}
         return self.project_mgr.stat_projects(query)
-
-    def _get_child_group_ids(self, project_group_id: str) -> list:
-        pg_vos = self.project_group_mgr.filter_project_groups(
-            parent_group_id=project_group_id
-        )
-        project_group_ids = [pg.project_group_id for pg in pg_vos]
-
-        for pg in pg_vos:
-            project_group_ids.extend(self._get_child_group_ids(pg.project_group_id))
-
-        return project_group_ids
@@ -132,7 +132,7 @@ class ProviderService(BaseService):
             endpoint,
             updated_version,
         ) = self.ac_plugin_mgr.get_account_collector_plugin_endpoint(
-            plugin_info, domain_id
+            plugin_info, domain_id, refresh=True
         )
 
         if updated_version:
@@ -1,5 +1,5 @@
 import logging
-from typing import Union
+from typing import Dict, List, Union
 
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
@@ -66,12 +66,10 @@ class RoleBindingService(BaseService):
         # Check user
         user_vo = self.user_mgr.get_user(user_id, domain_id)
 
-        workspace_vo = None
-
         # Check workspace
         if resource_group == "WORKSPACE":
             workspace_mgr = WorkspaceManager()
-            workspace_vo = workspace_mgr.get_workspace(workspace_id, domain_id)
+            workspace_mgr.get_workspace(workspace_id, domain_id)
         else:
             params["workspace_id"] = "*"
             workspace_id = "*"
@@ -117,11 +115,99 @@ class RoleBindingService(BaseService):
         # Create role binding
         rb_vo = self.role_binding_manager.create_role_binding(params)
 
-        if workspace_vo:
-            self.update_workspace_user_count(domain_id, workspace_id)
-
         return rb_vo
 
+    def create_role_bindings(
+        self,
+        users: List[Dict[str, str]],
+        workspace_ids: List[str],
+        workspace_group_id: str,
+        domain_id: str,
+    ) -> list:
+        """Binds each user to every workspace with the user's workspace role.
+
+        Users, workspaces, roles and duplicates are checked with one query
+        each and role bindings are inserted at once.
+
+        Args:
+            users: [{'user_id': 'str', 'role_id': 'str'}, ...]
+            workspace_ids: 'List[str]'
+            workspace_group_id: 'str'
+            domain_id: 'str'
+        """
+
+        if not (users and workspace_ids):
+            return []
+
+        user_ids = list({user_info["user_id"] for user_info in users})
+        role_ids = list({user_info["role_id"] for user_info in users})
+
+        # Check users
+        user_vos = self.user_mgr.filter_users(user_id=user_ids, domain_id=domain_id)
+        user_vo_map = {user_vo.user_id: user_vo for user_vo in user_vos}
+        for user_id in user_ids:
+            if user_id not in user_vo_map:
+                raise ERROR_NOT_FOUND(key="user_id", value=user_id)
+
+        # Check workspaces
+        workspace_vos = self.workspace_mgr.filter_workspaces(
+            workspace_id=workspace_ids, domain_id=domain_id
+        )
+        existing_workspace_ids = {
+            workspace_vo.workspace_id for workspace_vo in workspace_vos
+        }
+        for workspace_id in workspace_ids:
+            if workspace_id not in existing_workspace_ids:
+                raise ERROR_NOT_FOUND(key="workspace_id", value=workspace_id)
+
+        # Check roles
+        role_mgr = RoleManager()
+        role_vos = role_mgr.filter_roles(role_id=role_ids, domain_id=domain_id)
+        role_type_map = {role_vo.role_id: role_vo.role_type for role_vo in role_vos}
+        for role_id in role_ids:
+            if role_id not in role_type_map:
+                raise ERROR_NOT_FOUND(key="role_id", value=role_id)
+
+            if role_type_map[role_id] not in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
+                raise ERROR_NOT_ALLOWED_ROLE_TYPE(
+                    request_role_id=role_id,
+                    request_role_type=role_type_map[role_id],
+                    supported_role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+                )
+
+        self.check_duplicate_workspace_roles(
+            domain_id, workspace_group_id, workspace_ids, user_ids
+        )
+
+        # Update user role types
+        for user_id, user_vo in user_vo_map.items():
+            latest_role_type = self._get_latest_role_type(
+                user_vo.role_type, "WORKSPACE_MEMBER"
+            )
+            if latest_role_type != user_vo.role_type:
+                self.user_mgr.update_user_by_vo(
+                    {"role_type": latest_role_type}, user_vo
+                )
+
+        # Create role bindings
+        rb_vos = self.role_binding_manager.create_role_bindings(
+            [
+                {
+                    "user_id": user_info["user_id"],
+                    "role_id": user_info["role_id"],
+                    "role_type": role_type_map[user_info["role_id"]],
+                    "resource_group": "WORKSPACE",
+                    "workspace_group_id": workspace_group_id,
+                    "workspace_id": workspace_id,
+                    "domain_id": domain_id,
+                }
+                for workspace_id in workspace_ids
+                for user_info in users
+            ]
+        )
+
+        return rb_vos
+
     @transaction(
         permission="identity:RoleBinding.write",
         role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER"],
@@ -262,9 +348,6 @@ class RoleBindingService(BaseService):
 
         self.user_mgr.update_user_by_vo(user_role_info, user_vo)
 
-        if rb_vo.workspace_id:
-            self.update_workspace_user_count(rb_vo.domain_id, rb_vo.workspace_id)
-
         self.role_binding_manager.delete_role_binding_by_vo(rb_vo)
 
     @transaction(
@@ -390,6 +473,28 @@ class RoleBindingService(BaseService):
                 allowed_role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]
             )
 
+    def check_duplicate_workspace_roles(
+        self,
+        domain_id: str,
+        workspace_group_id: str,
+        workspace_ids: List[str],
+        user_ids: List[str],
+    ) -> None:
+        conditions = {
+            "domain_id": domain_id,
+            "workspace_id": workspace_ids,
+            "user_id": user_ids,
+        }
+        if workspace_group_id:
+            conditions["workspace_group_id"] = workspace_group_id
+
+        rb_vos = self.role_binding_manager.filter_role_bindings(**conditions)
+
+        if rb_vos.count() >= 1:
+            raise ERROR_DUPLICATED_WORKSPACE_ROLE_BINDING(
+                allowed_role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]
+            )
+
     def check_last_domain_admin_role_binding(
         self, new_role_type: Union[str, None], domain_id: str
     ) -> None:
@@ -449,28 +554,3 @@ class RoleBindingService(BaseService):
                 return "USER"
 
             return after
-
-    def update_workspace_user_count(self, domain_id: str, workspace_id: str) -> None:
-        workspace_vo = self.workspace_mgr.get_workspace(
-            domain_id=domain_id, workspace_id=workspace_id
-        )
-
-        if workspace_vo:
-            user_rb_total_count = self._get_workspace_user_count(
-                domain_id, workspace_id
-            )
-            self.workspace_mgr.update_workspace_by_vo(
-                {"user_count": user_rb_total_count}, workspace_vo
-            )
-
-    def _get_workspace_user_count(self, domain_id: str, workspace_id: str) -> int:
-        user_rb_ids = self.role_binding_manager.stat_role_bindings(
-            query={
-                "distinct": "user_id",
-                "filter": [
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ],
-            }
-        ).get("results", [])
-        return len(user_rb_ids)
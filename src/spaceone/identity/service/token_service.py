@@ -1,8 +1,9 @@
 import logging
 from typing import List, Tuple
 
-from spaceone.core import cache
-from spaceone.core.auth.jwt import JWTAuthenticator, JWTUtil
+from jwcrypto import jwk
+from spaceone.core import config
+from spaceone.core.auth.jwt import JWTUtil
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 
@@ -10,19 +11,21 @@ from spaceone.identity.error.error_authentication import *
 from spaceone.identity.error.error_domain import ERROR_DOMAIN_STATE
 from spaceone.identity.error.error_mfa import *
 from spaceone.identity.error.error_workspace import ERROR_WORKSPACE_STATE
+from spaceone.identity.lib.key_ring import KeyRing
+from spaceone.identity.lib.stage_timer import StageTimer
+from spaceone.identity.lib.state_cache import StateCache
 from spaceone.identity.manager.app_manager import AppManager
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.external_auth_manager import ExternalAuthManager
 from spaceone.identity.manager import SecretManager
 from spaceone.identity.manager.domain_secret_manager import DomainSecretManager
 from spaceone.identity.manager.mfa_manager.base import MFAManager
-from spaceone.identity.manager.project_group_manager import ProjectGroupManager
-from spaceone.identity.manager.project_manager import ProjectManager
 from spaceone.identity.manager.role_binding_manager import RoleBindingManager
 from spaceone.identity.manager.role_manager import RoleManager
 from spaceone.identity.manager.system_manager import SystemManager
 from spaceone.identity.manager.token_manager.base import TokenManager
 from spaceone.identity.manager.user_manager import UserManager
+from spaceone.identity.manager.user_project_manager import UserProjectManager
 from spaceone.identity.manager.workspace_manager import WorkspaceManager
 from spaceone.identity.model.app.database import App
 from spaceone.identity.model.domain.database import Domain
@@ -45,12 +48,12 @@ class TokenService(BaseService):
         self.app_mgr = AppManager()
         self.rb_mgr = RoleBindingManager()
         self.role_mgr = RoleManager()
-        self.project_mgr = ProjectManager()
-        self.project_group_mgr = ProjectGroupManager()
         self.workspace_mgr = WorkspaceManager()
+        self.user_project_mgr = UserProjectManager()
 
     @transaction()
     @convert_model
+    @StageTimer.measure("issue")
     def issue(self, params: TokenIssueRequest) -> Union[TokenResponse, dict]:
         """Issue token
         Args:
@@ -70,18 +73,21 @@ class TokenService(BaseService):
         verify_code = params.verify_code
         credentials = params.credentials
 
-        private_jwk = self.domain_secret_mgr.get_domain_private_key(domain_id=domain_id)
-        refresh_private_jwk = self.domain_secret_mgr.get_domain_refresh_private_key(
-            domain_id=domain_id
-        )
+        with StageTimer.stage("key_fetch"):
+            private_jwk = self.domain_secret_mgr.get_domain_signing_key(domain_id)
+            refresh_private_jwk = self.domain_secret_mgr.get_domain_signing_key(
+                domain_id, refresh=True
+            )
 
         # Check Domain state is ENABLED
-        self._check_domain_state(domain_id)
+        with StageTimer.stage("domain_state"):
+            self._check_domain_state(domain_id)
 
         token_mgr = TokenManager.get_token_manager_by_auth_type(params.auth_type)
-        token_mgr.authenticate(
-            domain_id, verify_code=verify_code, credentials=credentials
-        )
+        with StageTimer.stage("authenticate"):
+            token_mgr.authenticate(
+                domain_id, verify_code=verify_code, credentials=credentials
+            )
 
         user_vo = token_mgr.user
         user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
@@ -90,22 +96,29 @@ class TokenService(BaseService):
 
         mfa_user_id = user_vo.user_id
 
-        if self._check_login_protocol_with_user_auth_type(params.auth_type, domain_id):
+        with StageTimer.stage("login_protocol"):
+            is_mfa_supported = self._check_login_protocol_with_user_auth_type(
+                params.auth_type, domain_id
+            )
+
+        if is_mfa_supported:
             if user_mfa.get("state", "DISABLED") == "ENABLED" and params.auth_type != "MFA":
                 mfa_manager = MFAManager.get_manager_by_mfa_type(mfa_type)
                 if mfa_type == "EMAIL":
                     mfa_email = user_mfa["options"].get("email")
-                    mfa_manager.send_mfa_authentication_email(
-                        user_vo.user_id, domain_id, mfa_email, user_vo.language, credentials
-                    )
+                    with StageTimer.stage("mfa_send"):
+                        mfa_manager.send_mfa_authentication_email(
+                            user_vo.user_id, domain_id, mfa_email, user_vo.language, credentials
+                        )
                     mfa_user_id = mfa_email
 
                 elif mfa_type == "OTP":
                     secret_manager: SecretManager = self.locator.get_manager(SecretManager)
                     user_secret_id = user_mfa["options"].get("user_secret_id")
-                    otp_secret_key = secret_manager.get_user_otp_secret_key(user_secret_id, domain_id)
+                    with StageTimer.stage("mfa_send"):
+                        otp_secret_key = secret_manager.get_user_otp_secret_key(user_secret_id, domain_id)
 
-                    mfa_manager.set_cache_otp_mfa_secret_key(otp_secret_key, user_vo.user_id, domain_id, credentials)
+                        mfa_manager.set_cache_otp_mfa_secret_key(otp_secret_key, user_vo.user_id, domain_id, credentials)
 
                 raise ERROR_MFA_REQUIRED(user_id=mfa_user_id, mfa_type=mfa_type)
 
@@ -121,6 +134,7 @@ class TokenService(BaseService):
 
     @transaction()
     @convert_model
+    @StageTimer.measure("grant")
     def grant(self, params: TokenGrantRequest) -> Union[GrantTokenResponse, dict]:
         """Grant token
         Args:
@@ -139,16 +153,17 @@ class TokenService(BaseService):
         timeout = params.timeout
         public_jwk = None  # todo: remove
 
-        refresh_public_jwk = self.domain_secret_mgr.get_domain_refresh_public_key(
-            domain_id=domain_id
-        )
+        with StageTimer.stage("key_fetch"):
+            refresh_public_jwk = self.domain_secret_mgr.get_domain_verifying_key(
+                domain_id, refresh=True
+            )
 
         # todo: remove
         if (
             domain_id == SystemManager.get_root_domain_id()
             and params.scope == "WORKSPACE"
         ):
-            public_jwk = self.domain_secret_mgr.get_domain_public_key(domain_id)
+            public_jwk = self.domain_secret_mgr.get_domain_verifying_key(domain_id)
             domain_id = params.domain_id
 
         if domain_id == SystemManager.get_root_domain_id() and params.scope != "SYSTEM":
@@ -157,17 +172,14 @@ class TokenService(BaseService):
             if params.workspace_id is None:
                 raise ERROR_REQUIRED_PARAMETER(key="workspace_id")
 
-            self._check_workspace_state(params.workspace_id, domain_id)
-            workspace_vo = self.workspace_mgr.get_workspace(
-                params.workspace_id, domain_id
-            )
-            if workspace_vo.state != "ENABLED":
-                raise ERROR_PERMISSION_DENIED()
+            with StageTimer.stage("workspace_state"):
+                self._check_workspace_state(params.workspace_id, domain_id)
         else:
             params.workspace_id = None
 
         # Check Domain state is ENABLED
-        self._check_domain_state(domain_id)
+        with StageTimer.stage("domain_state"):
+            self._check_domain_state(domain_id)
 
         if public_jwk:
             # todo: remove
@@ -178,30 +190,34 @@ class TokenService(BaseService):
             role_type = "WORKSPACE_OWNER"
             user_vo = None
         else:
-            decoded_token_info = self._verify_token(
-                params.grant_type, params.token, refresh_public_jwk
-            )
+            with StageTimer.stage("jwt_verify"):
+                decoded_token_info = self._verify_token(
+                    params.grant_type, params.token, refresh_public_jwk
+                )
 
             if decoded_token_info["owner_type"] != "USER":
                 raise ERROR_PERMISSION_DENIED()
 
-            user_vo = self.user_mgr.get_user(
-                user_id=decoded_token_info["user_id"], domain_id=domain_id
-            )
+            with StageTimer.stage("user_lookup"):
+                user_vo = self.user_mgr.get_user(
+                    user_id=decoded_token_info["user_id"], domain_id=domain_id
+                )
 
             self._check_user_required_actions(user_vo.required_actions, user_vo.user_id)
 
-            role_type, role_id = self._get_user_role_info(
-                user_vo, workspace_id=params.workspace_id
-            )
+            with StageTimer.stage("role_binding_lookup"):
+                role_type, role_id = self._get_user_role_info(
+                    user_vo, workspace_id=params.workspace_id
+                )
 
         decoded_token_info["scope"] = params.scope
         decoded_token_info["workspace_id"] = params.workspace_id
 
-        private_jwk = self.domain_secret_mgr.get_domain_private_key(domain_id=domain_id)
-        refresh_private_jwk = self.domain_secret_mgr.get_domain_refresh_private_key(
-            domain_id=domain_id
-        )
+        with StageTimer.stage("key_fetch"):
+            private_jwk = self.domain_secret_mgr.get_domain_signing_key(domain_id)
+            refresh_private_jwk = self.domain_secret_mgr.get_domain_signing_key(
+                domain_id, refresh=True
+            )
 
         token_mgr = TokenManager.get_token_manager_by_auth_type("GRANT")
         app_id = None
@@ -219,18 +235,28 @@ class TokenService(BaseService):
                 user_vo=user_vo,
             )
 
+        encoded_permissions = None
         if params.grant_type == "SYSTEM_TOKEN" and params.scope == "WORKSPACE":
             # todo : remove
             permissions = params.permissions
         elif role_id:
-            permissions = self._get_role_permissions(role_id, domain_id)
+            with StageTimer.stage("role_lookup"):
+                permission_matcher = self.role_mgr.get_role_permission_matcher(
+                    role_id, domain_id
+                )
+            if self._is_compact_permissions():
+                permissions = None
+                encoded_permissions = permission_matcher.encode()
+            else:
+                permissions = permission_matcher.permissions
         else:
             permissions = []
 
         if role_type == "WORKSPACE_MEMBER":
-            user_projects = self._get_user_projects_in_project_group(
-                domain_id, params.workspace_id, user_vo.user_id
-            )
+            with StageTimer.stage("project_expansion"):
+                user_projects = self.user_project_mgr.get_user_projects(
+                    domain_id, params.workspace_id, user_vo.user_id
+                )
         else:
             user_projects = None
 
@@ -241,6 +267,7 @@ class TokenService(BaseService):
             timeout=timeout,
             workspace_id=params.workspace_id,
             permissions=permissions,
+            encoded_permissions=encoded_permissions,
             projects=user_projects,
             app_id=app_id,  # todo : remove
         )
@@ -255,21 +282,23 @@ class TokenService(BaseService):
 
         return GrantTokenResponse(**response)
 
-    @cache.cacheable(
-        key="identity:workspace-state:{domain_id}:{workspace_id}", expire=600
-    )
     def _check_workspace_state(self, workspace_id: str, domain_id: str) -> None:
-        workspace_vo = self.workspace_mgr.get_workspace(workspace_id, domain_id)
+        state = StateCache.get_state(
+            StateCache.get_workspace_state_key(domain_id, workspace_id),
+            lambda: self.workspace_mgr.get_workspace(workspace_id, domain_id).state,
+        )
 
-        if workspace_vo.state != "ENABLED":
+        if state != "ENABLED":
             raise ERROR_WORKSPACE_STATE(workspace_id=workspace_id)
 
-    @cache.cacheable(key="identity:domain-state:{domain_id}", expire=600)
     def _check_domain_state(self, domain_id: str) -> None:
-        domain_vo = self.domain_mgr.get_domain(domain_id)
+        state = StateCache.get_state(
+            StateCache.get_domain_state_key(domain_id),
+            lambda: self.domain_mgr.get_domain(domain_id).state,
+        )
 
-        if domain_vo.state != "ENABLED":
-            raise ERROR_DOMAIN_STATE(domain_id=domain_vo.domain_id)
+        if state != "ENABLED":
+            raise ERROR_DOMAIN_STATE(domain_id=domain_id)
 
     @staticmethod
     def _get_permissions_from_required_actions(user_vo: User) -> Union[List[str], None]:
@@ -297,9 +326,9 @@ class TokenService(BaseService):
         return domain_id
 
     @staticmethod
-    def _verify_token(grant_type: str, token: str, public_jwk: dict) -> dict:
+    def _verify_token(grant_type: str, token: str, public_jwk: jwk.JWK) -> dict:
         try:
-            decoded = JWTAuthenticator(public_jwk).validate(token)
+            decoded = KeyRing.decode(token, public_jwk)
         except Exception as e:
             _LOGGER.error(f"[_verify_refresh_token] {e}")
             raise ERROR_AUTHENTICATE_FAILURE(message="Token validation failed.")
@@ -346,55 +375,11 @@ class TokenService(BaseService):
     def _get_app_role_info(app_vo: App) -> Tuple[str, str]:
         return app_vo.role_type, app_vo.role_id
 
-    @cache.cacheable(key="identity:role-permissions:{domain_id}:{role_id}", expire=600)
-    def _get_role_permissions(self, role_id: str, domain_id: str) -> list:
-        role_vo = self.role_mgr.get_role(role_id=role_id, domain_id=domain_id)
-        return role_vo.permissions
-
-    def _get_user_projects_in_project_group(
-        self, domain_id: str, workspace_id: str, user_id: str
-    ) -> List[str]:
-        user_projects = []
-        project_groups = self.project_group_mgr.filter_project_groups(
-            domain_id=domain_id, workspace_id=workspace_id, users=user_id
-        )
-
-        for project_group in project_groups:
-            project_group_id = project_group.project_group_id
-            user_projects.extend(
-                self.project_group_mgr.get_projects_in_project_groups(
-                    domain_id, project_group_id
-                )
-            )
-
-        user_projects.extend(self._get_user_projects(user_id, workspace_id, domain_id))
-
-        user_projects = list(set(user_projects))
-        return user_projects
-
-    def _get_user_projects(
-        self, user_id: str, workspace_id: str, domain_id: str
-    ) -> List[str]:
-        user_projects = []
-
-        public_project_vos = self.project_mgr.filter_projects(
-            project_type="PUBLIC",
-            domain_id=domain_id,
-            workspace_id=workspace_id,
-        )
-        user_projects.extend(
-            [project_vo.project_id for project_vo in public_project_vos]
-        )
-
-        user_project_vos = self.project_mgr.filter_projects(
-            project_type="PRIVATE",
-            domain_id=domain_id,
-            users=user_id,
-            workspace_id=workspace_id,
-        )
-        user_projects.extend([project_vo.project_id for project_vo in user_project_vos])
-
-        return user_projects
+    @staticmethod
+    def _is_compact_permissions() -> bool:
+        identity_conf = config.get_global("IDENTITY") or {}
+        token_conf = identity_conf.get("token", {})
+        return token_conf.get("compact_permissions", False)
 
     def _check_login_protocol_with_user_auth_type(self, user_auth_type: str, domain_id: str) -> bool:
         if user_auth_type == "EXTERNAL":
@@ -113,7 +113,11 @@ class UserProfileService(BaseService):
 
         email_manager = EmailManager()
         email_manager.send_verification_email(
-            user_id, email, verify_code, user_vo.language
+            user_id,
+            email,
+            verify_code,
+            user_vo.language,
+            token_manager.CONST_VERIFY_CODE_TIMEOUT,
         )
 
     @transaction(permission="identity:UserProfile.write", role_types=["USER"])
@@ -591,11 +595,18 @@ class UserProfileService(BaseService):
         domain_id: str,
         workspace_group_user_ids: List[str],
     ) -> List[Union[WorkspaceGroup, Dict[str, str]]]:
+        user_info_map = self.workspace_group_svc.get_user_info_map(
+            workspace_group_user_ids, domain_id
+        )
+
         updated_workspace_group_infos = []
         for workspace_group_info in workspace_group_infos:
             updated_workspace_group_infos.append(
                 self.workspace_group_svc.add_user_name_and_state_to_users(
-                    workspace_group_info, domain_id, workspace_group_user_ids
+                    workspace_group_info,
+                    domain_id,
+                    workspace_group_user_ids,
+                    user_info_map,
                 )
             )
         return updated_workspace_group_infos
@@ -531,35 +531,24 @@ class WorkspaceGroupService(BaseService):
         workspace_group_new_users_info_list = []
         unique_user_ids = set()
 
-        def add_user(user_info, workspace_group_workspace_id=None):
-            role_type = new_users_role_map[user_info["role_id"]]
-            user_data = {
-                "user_id": user_info["user_id"],
-                "role_id": user_info["role_id"],
-                "role_type": role_type,
-            }
-
-            if workspace_group_workspace_id:
-                role_binding_params = {
-                    **user_data,
-                    "resource_group": "WORKSPACE",
-                    "domain_id": domain_id,
-                    "workspace_group_id": workspace_group_id,
-                    "workspace_id": workspace_group_workspace_id,
-                }
-                self.rb_svc.create_role_binding(role_binding_params)
-
+        for user_info in new_users_info_list:
             if user_info["user_id"] not in unique_user_ids:
-                workspace_group_new_users_info_list.append(user_data)
-                unique_user_ids.add(user_data["user_id"])
+                workspace_group_new_users_info_list.append(
+                    {
+                        "user_id": user_info["user_id"],
+                        "role_id": user_info["role_id"],
+                        "role_type": new_users_role_map[user_info["role_id"]],
+                    }
+                )
+                unique_user_ids.add(user_info["user_id"])
 
-        if workspace_ids := workspace_group_workspace_ids:
-            for workspace_id in workspace_ids:
-                for new_user_info in new_users_info_list:
-                    add_user(new_user_info, workspace_id)
-        else:
-            for new_user_info in new_users_info_list:
-                add_user(new_user_info)
+        if workspace_group_workspace_ids:
+            self.rb_svc.create_role_bindings(
+                workspace_group_new_users_info_list,
+                workspace_group_workspace_ids,
+                workspace_group_id,
+                domain_id,
+            )
 
         return workspace_group_new_users_info_list
 
@@ -568,6 +557,7 @@ class WorkspaceGroupService(BaseService):
         workspace_group_info: Union[WorkspaceGroup, Dict[str, Any]],
         domain_id: str,
         workspace_group_user_ids: List[str],
+        user_info_map: Dict[str, Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Add user's name and state to users in workspace group.
         Since the user's name and state are not in user of workspace group in database,
@@ -576,6 +566,7 @@ class WorkspaceGroupService(BaseService):
             workspace_group_info: 'Union[WorkspaceGroup, Dict[str, Any]]'
             domain_id: 'str'
             workspace_group_user_ids: 'List[str]'
+            user_info_map: 'Dict[str, Dict[str, str]]' # prefetched by get_user_info_map
         Returns:
             workspace_group_info: 'Dict[str, Any]'
         """
@@ -606,15 +597,8 @@ class WorkspaceGroupService(BaseService):
         else:
             workspace_group_users = workspace_group_info.users or []
 
-        user_info_map = {}
-        user_vos = self.user_mgr.filter_users(
-            user_id=workspace_group_user_ids, domain_id=domain_id
-        )
-        for user_vo in user_vos:
-            user_info_map[user_vo.user_id] = {
-                "name": user_vo.name,
-                "state": user_vo.state,
-            }
+        if user_info_map is None:
+            user_info_map = self.get_user_info_map(workspace_group_user_ids, domain_id)
 
         if workspace_group_users:
             updated_users = [
@@ -630,6 +614,29 @@ class WorkspaceGroupService(BaseService):
         else:
             return workspace_group_info
 
+    def get_user_info_map(
+        self, user_ids: List[str], domain_id: str
+    ) -> Dict[str, Dict[str, str]]:
+        """Get name and state of users with a single projected query.
+        Args:
+            user_ids: 'List[str]'
+            domain_id: 'str'
+        Returns:
+            user_info_map: 'Dict[str, Dict[str, str]]'
+        """
+
+        if not user_ids:
+            return {}
+
+        user_vos = self.user_mgr.filter_users(
+            user_id=list(set(user_ids)), domain_id=domain_id
+        ).only("user_id", "name", "state")
+
+        return {
+            user_vo.user_id: {"name": user_vo.name, "state": user_vo.state}
+            for user_vo in user_vos
+        }
+
     def get_users_info_list(
         self,
         new_users_info_list: List[Dict[str, str]],
@@ -654,7 +661,6 @@ class WorkspaceGroupService(BaseService):
         old_users: List[Dict[str, str]],
         workspace_group_id: str,
         domain_id: str,
-        workspace_id: str = None,
     ) -> List[Dict[str, str]]:
         rb_vos = self.rb_mgr.filter_role_bindings(
             user_id=user_ids,
@@ -668,44 +674,29 @@ class WorkspaceGroupService(BaseService):
 
         updated_users = [user for user in old_users if user["user_id"] not in user_ids]
 
-        if not workspace_id:
-            workspace_vos = self.workspace_mgr.filter_workspaces(
-                workspace_group_id=workspace_group_id, domain_id=domain_id
-            )
-            for workspace_vo in workspace_vos:
-                user_rb_ids = self.rb_mgr.stat_role_bindings(
-                    query={
-                        "distinct": "user_id",
-                        "filter": [
-                            {
-                                "k": "workspace_id",
-                                "v": workspace_vo.workspace_id,
-                                "o": "eq",
-                            },
-                            {"k": "domain_id", "v": domain_id, "o": "eq"},
-                        ],
-                    }
-                ).get("results", [])
-                user_rb_total_count = len(user_rb_ids)
-
-                self.workspace_mgr.update_workspace_by_vo(
-                    {"user_count": user_rb_total_count}, workspace_vo
-                )
-        else:
-            self.rb_svc.update_workspace_user_count(domain_id, workspace_id)
-
         return updated_users
 
     def get_workspace_groups_info(
         self, workspace_group_vos: QuerySet, domain_id
     ) -> List[Dict[str, Any]]:
+        workspace_group_vos = list(workspace_group_vos)
+
+        user_ids = []
+        for workspace_group_vo in workspace_group_vos:
+            user_ids.extend(self._get_workspace_group_user_ids(workspace_group_vo))
+
+        user_info_map = self.get_user_info_map(user_ids, domain_id)
+
         workspace_groups_info = []
         for workspace_group_vo in workspace_group_vos:
             workspace_group_user_ids = self._get_workspace_group_user_ids(
                 workspace_group_vo
             )
             workspace_group_dict = self.add_user_name_and_state_to_users(
-                workspace_group_vo, domain_id, workspace_group_user_ids
+                workspace_group_vo,
+                domain_id,
+                workspace_group_user_ids,
+                user_info_map,
             )
             workspace_groups_info.append(workspace_group_dict)
         return workspace_groups_info
@@ -494,37 +494,6 @@ class WorkspaceService(BaseService):
                     workspace_group_id,
                     domain_id,
                 )
-
-                (
-                    workspaces_info,
-                    total_count,
-                ) = self.workspace_mgr.list_workspace_group_workspaces(
-                    old_workspace_group_id,
-                    domain_id,
-                )
-                for workspace_info in workspaces_info:
-                    workspace_vo = self.workspace_mgr.get_workspace(
-                        workspace_info["workspace_id"], domain_id
-                    )
-                    user_rb_ids = self.rb_mgr.stat_role_bindings(
-                        query={
-                            "distinct": "user_id",
-                            "filter": [
-                                {
-                                    "k": "workspace_id",
-                                    "v": workspace_info["workspace_id"],
-                                    "o": "eq",
-                                },
-                                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                            ],
-                        }
-                    ).get("results", [])
-                    user_rb_total_count = len(user_rb_ids)
-
-                    workspace_vo = self.workspace_mgr.update_workspace_by_vo(
-                        {"user_count": user_rb_total_count}, workspace_vo
-                    )
-                    workspace_info.update({"user_count": workspace_vo.user_count})
             else:
                 is_updatable = False
         else:
@@ -567,11 +536,9 @@ class WorkspaceService(BaseService):
         self._delete_role_bindings(
             workspace_id, domain_id, old_workspace_group_id, user_rb_ids
         )
-        user_rb_total_count = len(user_rb_ids)
 
         self.workspace_mgr.update_workspace_by_vo(
             {
-                "user_count": user_rb_total_count,
                 "changed_at": workspace_vo.changed_at,
                 "workspace_group_id": None,
             },
@@ -602,14 +569,9 @@ class WorkspaceService(BaseService):
         domain_id: str,
     ):
         rb_svc = RoleBindingService()
-        for user_info in workspace_group_users or []:
-            rb_svc.create_role_binding(
-                {
-                    "user_id": user_info["user_id"],
-                    "role_id": user_info["role_id"],
-                    "resource_group": "WORKSPACE",
-                    "domain_id": domain_id,
-                    "workspace_group_id": workspace_group_id,
-                    "workspace_id": workspace_id,
-                }
-            )
+        rb_svc.create_role_bindings(
+            workspace_group_users or [],
+            [workspace_id],
+            workspace_group_id,
+            domain_id,
+        )